@@ -0,0 +1,102 @@
+"""
+Benchmark for the schedule edit history
+
+Makes a long run of single level edits to a large schedule, recording each
+version the way the editor does when a game is saved, then reports the
+memory the history holds against keeping a full copy of every version and
+how long recording and jumping to a random version take.
+
+    python benchmarks/history.py --levels 500 --edits 1000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from history import History
+from schedule import COLUMNS, BlindSchedule
+
+
+def held_bytes(history):
+    """
+    Bytes of column data held by every version, counting shared chunks once
+
+    Args:
+        history (History): History to measure
+
+    Returns:
+        size (int): Bytes
+    """
+    seen = {}
+    for snapshot, _, _ in history.entries:
+        for chunk in snapshot.chunks:
+            for column in chunk:
+                seen[id(column)] = column.itemsize * len(column)
+    return sum(seen.values())
+
+
+def main():
+    """
+    Run the benchmark
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--levels", type=int, default=500)
+    parser.add_argument("--edits", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    size = args.levels
+    schedule = BlindSchedule.from_columns(
+        range(1, size + 1),
+        [20] * size,
+        [25 * 2 ** min(i // 3, 40) for i in range(size)],
+        [50 * 2 ** min(i // 3, 40) for i in range(size)],
+    )
+    history = History(schedule)
+    record_times = []
+    for _ in range(args.edits):
+        schedule = schedule[:]
+        schedule.set_level(rng.randrange(size), time=rng.randrange(5, 60))
+        started = time.perf_counter()
+        history.record(schedule, "Save")
+        record_times.append((time.perf_counter() - started) * 1000)
+
+    jump_times = []
+    for _ in range(1000):
+        position = rng.randrange(len(history.entries))
+        started = time.perf_counter()
+        history.jump(position)
+        jump_times.append((time.perf_counter() - started) * 1000)
+
+    full = sum(
+        getattr(schedule, name).itemsize * size for name in COLUMNS.values()
+    ) * len(history.entries)
+    held = held_bytes(history)
+    print(f"{len(history.entries)} versions of {size} levels")
+    print(
+        f"column data held: {held / 1024:.0f} KB, "
+        f"full copies would be {full / 1024:.0f} KB ({full / held:.0f}x)"
+    )
+    print(f"per edit: {(held - full // len(history.entries)) / args.edits:.0f} bytes")
+    print(
+        f"record: median {statistics.median(record_times):.3f} ms, "
+        f"jump: median {statistics.median(jump_times):.3f} ms "
+        f"max {max(jump_times):.3f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark for the ICM calculator
+
+Times the exact solver as the field grows, then compares the sampled
+estimate against it and times the estimate on large fields.
+
+    python benchmarks/icm.py
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from icm import exact_icm, sampled_icm  # pylint: disable=wrong-import-position
+
+
+def field(players, places, seed=0):
+    """
+    Random stacks and a falling payout table
+
+    Args:
+        players (int): Players still in
+        places (int): Paid places
+        seed (int, optional): Random seed
+
+    Returns:
+        field (tuple): Stacks and payouts
+    """
+    rng = np.random.default_rng(seed)
+    stacks = rng.integers(1000, 100000, players)
+    payouts = 1000 * 0.8 ** np.arange(min(players, places))
+    return stacks, payouts
+
+
+def timed(function, *args):
+    """
+    Call a function and time it
+
+    Args:
+        function (callable): Function to call
+        args (tuple): Arguments
+
+    Returns:
+        timed (tuple): Result and milliseconds taken
+    """
+    started = time.perf_counter()
+    result = function(*args)
+    return result, (time.perf_counter() - started) * 1000
+
+
+def main():
+    """
+    Run the benchmark
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    print("players  exact ms  sampled ms  max error  95% range  inside range")
+    for players in (6, 9, 12, 15, 18):
+        stacks, payouts = field(players, players)
+        exact, exact_ms = timed(exact_icm, stacks, payouts)
+        sampled, sampled_ms = timed(sampled_icm, stacks, payouts)
+        error = np.abs(sampled.equity - exact)
+        print(
+            f"{players:7}  {exact_ms:8.1f}  {sampled_ms:10.1f}  {error.max():9.2f}"
+            f"  {sampled.error.max():9.2f}  {np.mean(error <= sampled.error):11.0%}"
+        )
+
+    print()
+    print("players  paid  sampled ms  95% range")
+    for players, places in ((50, 9), (200, 27), (1000, 100), (10000, 1000)):
+        stacks, payouts = field(players, places)
+        sampled, sampled_ms = timed(sampled_icm, stacks, payouts)
+        print(
+            f"{players:7}  {places:4}  {sampled_ms:10.1f}  {sampled.error.max():9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Benchmark for the streaming structure importer
+
+Generates a large structure file with a header, thousands separators and a
+few bad lines, then times importing it.
+
+    python benchmarks/import_structure.py --rows 100000
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from importer import import_structure
+
+
+def write_structure(path, rows):
+    """
+    Write a generated structure file
+
+    Args:
+        path (str): File to write
+        rows (int): Number of levels
+
+    Returns:
+        None
+    """
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        f.write("Level,Time,Small Blind,Big Blind\n")
+        for i in range(1, rows + 1):
+            if i % 10000 == 0:
+                f.write(f"{i},twenty,{i},{i * 2}\n")
+            else:
+                f.write(f'{i}, 20 ,"{i * 25:,}","{i * 50:,}"\n')
+
+
+def main():
+    """
+    Run the benchmark
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "structure.csv")
+        write_structure(path, args.rows)
+        size = os.path.getsize(path)
+
+        started = time.perf_counter()
+        report = import_structure(path)
+        elapsed = time.perf_counter() - started
+
+        tracemalloc.start()
+        import_structure(path)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    print(f"file: {args.rows} rows, {size / 1e6:.1f} MB")
+    print(f"imported {len(report.rounds)} rounds, {report.error_count} errors")
+    print(f"time: {elapsed:.3f}s ({args.rows / elapsed:,.0f} rows/s)")
+    print(f"peak memory while importing: {peak / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
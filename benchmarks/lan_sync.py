@@ -0,0 +1,292 @@
+"""
+Agreement harness for LAN clock synchronization
+
+Runs an authority and a number of followers in this process over loopback
+UDP. Every follower has its own clock, set off from the authority's by a
+random amount and running fast or slow by a few hundred parts per million,
+and talks to the authority through a relay that delays every packet by a
+base latency plus random jitter, a different draw in each direction.
+
+While the authority's clock is started, paused, resumed and moved to the
+next level, the time left on every follower is read at the same moment as
+the authority's. The largest difference is what the displays would
+disagree by.
+
+    python benchmarks/lan_sync.py --followers 20 --latency 2 --jitter 3
+"""
+
+import argparse
+import heapq
+import os
+import random
+import socket
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from clock import TournamentClock
+from lansync import POLL_MS, SyncAuthority, SyncFollower
+from schedule import BlindSchedule
+
+
+class SkewedClock:
+    """
+    Monotonic clock with a fixed offset and a rate error
+    """
+
+    def __init__(self, offset, ppm):
+        self.offset = offset
+        self.rate = ppm / 1e6
+        self.base = time.monotonic()
+
+    def __call__(self):
+        now = time.monotonic()
+        return now + self.offset + (now - self.base) * self.rate
+
+
+class JitterRelay:
+    """
+    UDP relay between one follower and the authority that delays packets
+    """
+
+    def __init__(self, authority, latency, jitter, seed):
+        self.random = random.Random(seed)
+        self.latency = latency / 1000
+        self.jitter = jitter / 1000
+        self.front = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.front.bind(("127.0.0.1", 0))
+        self.back = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.back.connect(authority)
+        self.follower = None
+        self.pending = []
+        self.ready = threading.Condition()
+        self.sequence = 0
+        threading.Thread(target=self.read_front, daemon=True).start()
+        threading.Thread(target=self.read_back, daemon=True).start()
+        threading.Thread(target=self.send_loop, daemon=True).start()
+
+    @property
+    def address(self):
+        """Address the follower should send to"""
+        return self.front.getsockname()
+
+    def delay(self, data, send):
+        """
+        Queue a packet to be sent after the latency and a random jitter
+
+        Args:
+            data (bytes): Packet
+            send (func): Sends the packet
+
+        Returns:
+            None
+        """
+        due = time.monotonic() + self.latency + self.random.expovariate(1 / self.jitter)
+        with self.ready:
+            self.sequence += 1
+            heapq.heappush(self.pending, (due, self.sequence, data, send))
+            self.ready.notify()
+
+    def read_front(self):
+        """
+        Forward follower packets to the authority
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        while True:
+            data, self.follower = self.front.recvfrom(128)
+            self.delay(data, self.back.send)
+
+    def read_back(self):
+        """
+        Forward authority packets to the follower
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        while True:
+            data = self.back.recv(128)
+            self.delay(
+                data, lambda packet, to=self.follower: self.front.sendto(packet, to)
+            )
+
+    def send_loop(self):
+        """
+        Send packets as they come due
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        while True:
+            with self.ready:
+                while not self.pending:
+                    self.ready.wait()
+                due, _, data, send = self.pending[0]
+                wait = due - time.monotonic()
+                if wait > 0:
+                    self.ready.wait(wait)
+                    continue
+                heapq.heappop(self.pending)
+            send(data)
+
+
+def follow_loop(followers, stop):
+    """
+    Stand in for the Tk loop of every follower
+
+    Args:
+        followers (arr[SyncFollower]): Followers to poll
+        stop (threading.Event): Set to end the loop
+
+    Returns:
+        None
+    """
+    while not stop.is_set():
+        for follower in followers:
+            follower.poll()
+            follower.tournament_clock.update()
+        time.sleep(POLL_MS / 1000)
+
+
+def spread(authority_clock, followers):
+    """
+    How far the time left on each follower is from the authority's right now
+
+    Args:
+        authority_clock (TournamentClock): Authority clock
+        followers (arr[SyncFollower]): Followers
+
+    Returns:
+        errors (arr[float]|None): Milliseconds per follower, None while any
+            follower is on another level or not running
+    """
+    level = authority_clock.game_state.round_index
+    reference = authority_clock.countdown.remaining()
+    errors = []
+    for follower in followers:
+        tournament_clock = follower.tournament_clock
+        if (
+            not tournament_clock.is_running
+            or tournament_clock.game_state.round_index != level
+        ):
+            return None
+        errors.append(abs(tournament_clock.countdown.remaining() - reference) * 1000)
+    return errors
+
+
+def start_followers(address, rounds, args):
+    """
+    Start followers, each with its own skewed clock and relay
+
+    Args:
+        address (tuple): Authority address
+        rounds (BlindSchedule): Game every follower runs
+        args (argparse.Namespace): Harness settings
+
+    Returns:
+        followers (arr[SyncFollower]): Running followers
+    """
+    rng = random.Random(args.seed)
+    followers = []
+    for i in range(args.followers):
+        clock = SkewedClock(rng.uniform(-1000, 1000), rng.uniform(-args.ppm, args.ppm))
+        relay = JitterRelay(address, args.latency, args.jitter, args.seed + i)
+        follower = SyncFollower(relay.address, clock)
+        follower.attach(TournamentClock(rounds, clock))
+        follower.start()
+        followers.append(follower)
+    return followers
+
+
+def main():
+    """
+    Run the harness
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--followers", type=int, default=20)
+    parser.add_argument("--latency", type=float, default=2.0, help="ms each way")
+    parser.add_argument("--jitter", type=float, default=3.0, help="mean extra ms")
+    parser.add_argument("--ppm", type=float, default=200.0, help="max rate error")
+    parser.add_argument("--seconds", type=float, default=20.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rounds = BlindSchedule.from_columns(
+        [1, 2, 3], [20, 20, 20], [25, 50, 75], [50, 100, 150]
+    )
+    authority_clock = TournamentClock(rounds)
+    authority = SyncAuthority(("127.0.0.1", 0))
+    address = authority.start()
+    authority.attach(authority_clock)
+
+    followers = start_followers(address, rounds, args)
+    stop = threading.Event()
+    threading.Thread(target=follow_loop, args=(followers, stop), daemon=True).start()
+
+    step = args.seconds / 5
+    actions = [
+        (0.0, authority_clock.start),
+        (step, authority_clock.pause),
+        (step * 1.2, authority_clock.start),
+        (step * 2, authority_clock.next_round),
+        (step * 2.05, authority_clock.start),
+        (step * 3, lambda: authority_clock.add_time(30)),
+    ]
+    settle = 1.0
+    started = time.monotonic()
+    samples, unsettled = [], 0
+    last_action = 0.0
+    while time.monotonic() - started < args.seconds:
+        elapsed = time.monotonic() - started
+        while actions and actions[0][0] <= elapsed:
+            last_action = elapsed
+            actions.pop(0)[1]()
+        authority_clock.update()
+        if authority_clock.is_running and elapsed - last_action > 0.2:
+            errors = spread(authority_clock, followers)
+            if errors is None:
+                unsettled += 1
+            elif elapsed > settle:
+                samples.append(max(errors))
+        time.sleep(0.05)
+    stop.set()
+    for follower in followers:
+        follower.close()
+    authority.close()
+
+    samples.sort()
+    delays = [follower.delay_ns / 1e6 for follower in followers]
+    print(
+        f"{args.followers} followers, {args.latency} ms latency, "
+        f"{args.jitter} ms mean jitter, up to {args.ppm} ppm rate error"
+    )
+    print(f"best round trip: median {statistics.median(delays):.2f} ms")
+    print(
+        f"worst follower error: median {statistics.median(samples):.2f} ms "
+        f"p99 {samples[int(len(samples) * 0.99) - 1]:.2f} ms max {samples[-1]:.2f} ms"
+    )
+    print(f"samples with a follower still catching up: {unsettled}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Latency harness for the remote control
+
+Sends commands one at a time and times each until its answer arrives, which
+the app only sends after the change has been applied and drawn.
+
+Against a running app started with POKER_TIME_REMOTE=1:
+
+    python benchmarks/remote_latency.py --connect 127.0.0.1:8766
+
+Add --token when the app listens on an address other than loopback.
+
+Without --connect a clock and listener are started in this process, with a
+thread polling once per frame like the Tk loop does.
+
+    python benchmarks/remote_latency.py --count 500
+"""
+
+import argparse
+import os
+import socket
+import statistics
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from clock import TournamentClock
+from remote import FRAME_MS, RemoteControl, parse_address
+from schedule import BlindSchedule
+
+
+def frame_loop(remote, stop):
+    """
+    Stand in for the Tk loop, polls the remote control once per frame
+
+    Args:
+        remote (RemoteControl): Listener to poll
+        stop (threading.Event): Set to end the loop
+
+    Returns:
+        None
+    """
+    while not stop.is_set():
+        remote.poll()
+        remote.clock.update()
+        time.sleep(FRAME_MS / 1000)
+
+
+def measure(address, count, token=None):
+    """
+    Time commands sent to a listener
+
+    Args:
+        address (str|tuple): Listener address
+        count (int): Number of commands
+        token (str, optional): Token to send first, if the listener needs one
+
+    Returns:
+        times (arr[float]): Milliseconds from sending each command to its answer
+    """
+    family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+    times = []
+    with socket.socket(family, socket.SOCK_STREAM) as conn:
+        conn.connect(address)
+        if family == socket.AF_INET:
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        answers = conn.makefile("r", encoding="utf-8")
+        if token:
+            conn.sendall(f"auth {token}\n".encode())
+            answer = answers.readline()
+            if not answer.startswith("ok"):
+                raise RuntimeError(f"auth: {answer.strip()}")
+        for i in range(count):
+            command = "add 1" if i % 2 else "add -1"
+            started = time.perf_counter()
+            conn.sendall(command.encode("utf-8") + b"\n")
+            answer = answers.readline()
+            times.append((time.perf_counter() - started) * 1000)
+            if not answer.startswith("ok"):
+                raise RuntimeError(f"{command}: {answer.strip()}")
+            time.sleep(0.003)
+    return times
+
+
+def main():
+    """
+    Run the harness
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--connect", help="host:port or socket path of a running app")
+    parser.add_argument("--count", type=int, default=500)
+    parser.add_argument("--token", help="remote control token of the app")
+    args = parser.parse_args()
+
+    stop = threading.Event()
+    if args.connect:
+        address = parse_address(args.connect)
+    else:
+        clock = TournamentClock(BlindSchedule.from_columns([1], [20], [25], [50]))
+        clock.start()
+        remote = RemoteControl(("127.0.0.1", 0), clock)
+        address = remote.start()
+        threading.Thread(target=frame_loop, args=(remote, stop), daemon=True).start()
+
+    times = measure(address, args.count, args.token)
+    stop.set()
+    times.sort()
+    print(f"{len(times)} commands, frame {FRAME_MS} ms")
+    print(
+        f"latency: median {statistics.median(times):.2f} ms "
+        f"p99 {times[int(len(times) * 0.99) - 1]:.2f} ms max {times[-1]:.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark for table balancing
+
+Draws a large field into seats, then knocks players out one at a time in a
+random order until one is left, timing each knock out.
+
+    python benchmarks/seating.py --players 1000
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from seating import Seating  # pylint: disable=wrong-import-position
+
+
+def main():
+    """
+    Run the benchmark
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--players", type=int, default=1000)
+    parser.add_argument("--seats", type=int, default=9)
+    args = parser.parse_args()
+
+    seating = Seating(args.seats, seed=0)
+    started = time.perf_counter()
+    seating.draw(range(args.players))
+    draw_time = time.perf_counter() - started
+
+    order = list(range(args.players))
+    random.Random(1).shuffle(order)
+    times = []
+    moves = 0
+    for player in order[:-1]:
+        started = time.perf_counter()
+        moves += len(seating.eliminate(player))
+        times.append((time.perf_counter() - started) * 1e6)
+
+    print(f"draw {args.players} players: {draw_time * 1000:.1f} ms")
+    print(f"knock outs: {len(times)}, player moves: {moves}")
+    print(
+        f"per knock out: median {statistics.median(times):.1f} us "
+        f"max {max(times):.1f} us"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Benchmark for the tournament length simulator
+
+Generates a structure for the given field and times simulating it, once in
+a single process and once across a process pool, and checks both runs give
+the same result for the same seed.
+
+    python benchmarks/simulate.py --trials 100000 --players 50
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from generator import generate_structures  # pylint: disable=wrong-import-position
+from simulator import simulate  # pylint: disable=wrong-import-position
+
+
+def main():
+    """
+    Run the benchmark
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--trials", type=int, default=100000)
+    parser.add_argument("--players", type=int, default=50)
+    parser.add_argument("--stack", type=int, default=10000)
+    parser.add_argument("--minutes", type=int, default=240)
+    parser.add_argument("--single", type=int, default=10000)
+    args = parser.parse_args()
+
+    rounds = generate_structures(args.stack, args.players, args.minutes, 20)[0].rounds
+
+    started = time.perf_counter()
+    single = simulate(rounds, args.players, args.stack, args.single, workers=0)
+    single_time = time.perf_counter() - started
+
+    pooled = simulate(rounds, args.players, args.stack, args.single)
+    same = pooled == single
+
+    started = time.perf_counter()
+    result = simulate(rounds, args.players, args.stack, args.trials)
+    elapsed = time.perf_counter() - started
+
+    print(f"{args.single:,} trials in one process: {single_time:.2f}s")
+    print(f"same result across the pool: {same}")
+    print(f"{args.trials:,} trials on {os.cpu_count()} CPUs: {elapsed:.2f}s")
+    print(f"finish minutes: {result.finish_minutes}")
+    print(f"finish round: {result.finish_level}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Startup benchmark for Poker Time
+
+Launches main.py several times and reports the time from starting the
+process to the first frame being drawn, first with an empty image cache
+(cold) and then with the cache filled by the previous launch (warm).
+Needs a display.
+
+    python benchmarks/startup.py --runs 5
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def launch(cache):
+    """
+    Start the app once and time it until it reports its first frame
+
+    Args:
+        cache (str): Cache folder to use
+
+    Returns:
+        seconds (float): Time to first frame
+    """
+    env = dict(os.environ, POKER_TIME_STARTUP_BENCH="500", POKER_TIME_CACHE_DIR=cache)
+    started = time.perf_counter()
+    with subprocess.Popen(
+        [sys.executable, "main.py"],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.PIPE,
+        text=True,
+    ) as app:
+        for line in app.stdout:
+            if line.startswith("first frame"):
+                elapsed = time.perf_counter() - started
+                break
+        else:
+            raise RuntimeError("main.py exited without drawing a frame")
+        app.wait()
+    return elapsed
+
+
+def main():
+    """
+    Run the benchmark
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    cold, warm = [], []
+    for _ in range(args.runs):
+        with tempfile.TemporaryDirectory() as cache:
+            cold.append(launch(cache))
+            warm.append(launch(cache))
+
+    for name, times in (("cold", cold), ("warm", warm)):
+        ms = [t * 1000 for t in times]
+        print(
+            f"{name}: time to first frame median {statistics.median(ms):.0f} ms "
+            f"min {min(ms):.0f} ms max {max(ms):.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
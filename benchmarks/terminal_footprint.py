@@ -0,0 +1,126 @@
+"""
+Memory and CPU of the terminal clock next to the Tk app
+
+Runs terminal.py in a pseudo terminal with a 2 minute level running, so the
+seconds tick for the first minute and the tenths for the second, and reads
+its peak memory and CPU time when it exits. The Tk app is measured the same
+way for as long if there is a display, showing its landing page.
+
+    python benchmarks/terminal_footprint.py --seconds 120
+"""
+
+import argparse
+import os
+import pty
+import resource
+import select
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def measure_terminal(game, seconds):
+    """
+    Run the terminal clock and stop it with q
+
+    Args:
+        game (str): Game file
+        seconds (float): How long to let it run
+
+    Returns:
+        usage (tuple): Peak memory in MB, CPU seconds and bytes written to the terminal
+    """
+    pid, fd = pty.fork()
+    if pid == 0:
+        os.environ["TERM"] = "xterm-256color"
+        os.execv(
+            sys.executable,
+            [sys.executable, os.path.join(ROOT, "terminal.py"), game, "--start"],
+        )
+    written = 0
+    stop_at = time.monotonic() + seconds
+    while time.monotonic() < stop_at:
+        ready, _, _ = select.select([fd], [], [], 0.1)
+        if ready:
+            written += len(os.read(fd, 65536))
+    os.write(fd, b"q")
+    try:
+        while os.read(fd, 65536):
+            pass
+    except OSError:
+        pass
+    _, status, usage = os.wait4(pid, 0)
+    os.close(fd)
+    if status:
+        raise RuntimeError(f"terminal.py exited with status {status}")
+    return usage.ru_maxrss / 1024, usage.ru_utime + usage.ru_stime, written
+
+
+def measure_tk(seconds):
+    """
+    Run the Tk app, it closes itself after the time given
+
+    Args:
+        seconds (float): How long to let it run
+
+    Returns:
+        usage (tuple|None): Peak memory in MB and CPU seconds, None without a display
+    """
+    if not os.environ.get("DISPLAY") and sys.platform.startswith("linux"):
+        return None
+    env = dict(os.environ, POKER_TIME_STARTUP_BENCH=str(int(seconds * 1000)))
+    before = resource.getrusage(resource.RUSAGE_CHILDREN)
+    subprocess.run(
+        [sys.executable, "main.py"],
+        cwd=ROOT,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        check=True,
+    )
+    after = resource.getrusage(resource.RUSAGE_CHILDREN)
+    cpu = (after.ru_utime + after.ru_stime) - (before.ru_utime + before.ru_stime)
+    # ru_maxrss of children is the largest child so far, the terminal clock
+    # ran first and is far smaller
+    return after.ru_maxrss / 1024, cpu
+
+
+def main():
+    """
+    Run the benchmark
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--seconds", type=float, default=120.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as folder:
+        game = os.path.join(folder, "game.csv")
+        with open(game, "w", encoding="utf-8") as f:
+            f.write("1,2,25,50,0\n2,20,50,100,0\n")
+        memory, cpu, written = measure_terminal(game, args.seconds)
+    print(
+        f"terminal: peak {memory:.1f} MB, {cpu:.2f} s CPU "
+        f"({cpu / args.seconds * 100:.2f}%), {written / 1024:.1f} KB drawn "
+        f"in {args.seconds:.0f} s"
+    )
+    tk_usage = measure_tk(args.seconds)
+    if tk_usage is None:
+        print("tk: skipped, no display")
+    else:
+        memory, cpu = tk_usage
+        print(
+            f"tk: peak {memory:.1f} MB, {cpu:.2f} s CPU "
+            f"({cpu / args.seconds * 100:.2f}%) in {args.seconds:.0f} s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""
+Load test for the broadcast server
+
+Starts server.py with a running clock, connects a swarm of stand-in display
+clients and reports how long each pushed change took to reach them.
+
+    python benchmarks/ws_swarm.py --clients 500 --seconds 10
+"""
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import statistics
+import struct
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+async def client(host, port, latencies, ready):
+    """
+    Stand-in display, records the delay of every delta it receives
+
+    Args:
+        host (str): Server address
+        port (int): Server port
+        latencies (arr[float]): Shared list of propagation delays in seconds
+        ready (asyncio.Event): Set once the snapshot has arrived
+
+    Returns:
+        None
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    key = base64.b64encode(os.urandom(16)).decode()
+    writer.write(
+        (
+            f"GET /ws HTTP/1.1\r\nHost: {host}:{port}\r\nUpgrade: websocket\r\n"
+            f"Connection: Upgrade\r\nSec-WebSocket-Key: {key}\r\n"
+            "Sec-WebSocket-Version: 13\r\n\r\n"
+        ).encode()
+    )
+    await reader.readuntil(b"\r\n\r\n")
+    try:
+        while True:
+            _, second = await reader.readexactly(2)
+            length = second & 0x7F
+            if length == 126:
+                (length,) = struct.unpack("!H", await reader.readexactly(2))
+            message = json.loads(await reader.readexactly(length))
+            if message["type"] == "snapshot":
+                ready.set()
+            else:
+                latencies.append(time.time() - message["ts"])
+    finally:
+        writer.close()
+
+
+async def swarm(host, port, clients, seconds):
+    """
+    Connect the swarm and collect latencies for a while
+
+    Args:
+        host (str): Server address
+        port (int): Server port
+        clients (int): Number of clients
+        seconds (float): How long to measure for once connected
+
+    Returns:
+        latencies (arr[float]): Propagation delays in seconds
+    """
+    latencies = []
+    readies = [asyncio.Event() for _ in range(clients)]
+    tasks = [
+        asyncio.create_task(client(host, port, latencies, ready)) for ready in readies
+    ]
+    started = time.perf_counter()
+    await asyncio.gather(*(ready.wait() for ready in readies))
+    print(f"{clients} clients connected in {time.perf_counter() - started:.2f}s")
+    latencies.clear()
+    await asyncio.sleep(seconds)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return latencies
+
+
+def main():
+    """
+    Run the load test
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--port", type=int, default=8799)
+    args = parser.parse_args()
+
+    with tempfile.NamedTemporaryFile("w", suffix=".csv", delete=False) as f:
+        f.write("1,20,25,50\n2,20,50,100\n")
+    server = subprocess.Popen(
+        [sys.executable, "server.py", f.name, "--port", str(args.port), "--start"],
+        cwd=ROOT,
+    )
+    try:
+        time.sleep(1)
+        latencies = asyncio.run(
+            swarm("127.0.0.1", args.port, args.clients, args.seconds)
+        )
+    finally:
+        server.terminate()
+        server.wait()
+        os.unlink(f.name)
+
+    latencies.sort()
+    ms = [x * 1000 for x in latencies]
+    print(f"messages received: {len(ms)}")
+    if ms:
+        print(
+            f"propagation ms: median {statistics.median(ms):.2f} "
+            f"p99 {ms[int(len(ms) * 0.99) - 1]:.2f} max {ms[-1]:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,800 @@
+"""
+Clock primitives for Poker Time
+
+Nothing in this module depends on Tkinter so it can be used headless.
+"""
+
+import math
+import time
+from collections import namedtuple
+from functools import lru_cache
+
+from schedule import as_schedule
+
+FINE_SECONDS = 60
+
+
+class GameState:
+    """
+    Keeps track of what round it is and the blinds
+    Use for reference in other classes so there is no mixup
+
+    Values are read straight from the schedule columns, nothing is copied
+    when the round changes
+    """
+
+    def __init__(self, rounds):
+        self.rounds = as_schedule(rounds)
+        self.round_index = 0
+
+    @property
+    def round_num(self):
+        """Number of the current round"""
+        return self.rounds.nums[self.round_index]
+
+    @property
+    def time(self):
+        """Length of the current round in minutes"""
+        return self.rounds.times[self.round_index]
+
+    @property
+    def s_blind(self):
+        """Small blind of the current round"""
+        return self.rounds.s_blinds[self.round_index]
+
+    @property
+    def b_blind(self):
+        """Big blind of the current round"""
+        return self.rounds.b_blinds[self.round_index]
+
+    @property
+    def ante(self):
+        """Ante of the current round"""
+        return self.rounds.antes[self.round_index]
+
+    @property
+    def is_break(self):
+        """True if the current round is a break"""
+        return bool(self.rounds.breaks[self.round_index])
+
+    def next_round(self):
+        """
+        Increment round counter
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if len(self.rounds) > self.round_index + 1:
+            self.round_index += 1
+
+    def previous_round(self):
+        """
+        Decrement round counter
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self.round_index > 0:
+            self.round_index -= 1
+
+    def restart_game(self):
+        """
+        Set round counter to zero
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.round_index = 0
+
+    def update_rounds(self, rounds):
+        """
+        Update round values when a change is made in the game editor
+
+        Args:
+            rounds (BlindSchedule): New rounds to be applied to the GameState instance
+
+        Returns:
+            None
+        """
+        self.rounds = as_schedule(rounds)
+        self.round_index = min(self.round_index, len(self.rounds) - 1)
+
+    def seek(self, elapsed):
+        """
+        Jump to the round that is scheduled to be running at a point in the game
+
+        Args:
+            elapsed (float): Seconds since the start of the first round
+
+        Returns:
+            remaining (float): Seconds left in that round
+        """
+        self.round_index, played = self.rounds.time_index().find(elapsed)
+        return self.time * 60 - played
+
+    def round_start(self, index):
+        """
+        Scheduled time from the start of the game to the start of a round
+
+        Args:
+            index (int): Round index
+
+        Returns:
+            seconds (int): Total length of every earlier round
+        """
+        return self.rounds.time_index().start(index)
+
+
+class Countdown:
+    """
+    Deadline based countdown
+
+    Stores an absolute monotonic deadline instead of decrementing a counter,
+    so a late tick never adds to the time shown on the clock
+    """
+
+    def __init__(self, duration, clock=time.monotonic):
+        self.clock = clock
+        self.duration = duration
+        self.deadline = None
+        self.paused_remaining = duration
+        self.expected_tick = None
+        self.last_lag = 0.0
+        self.max_lag = 0.0
+        self.drift_corrected = 0.0
+
+    @property
+    def is_paused(self):
+        """True while the countdown is not running"""
+        return self.deadline is None
+
+    def start(self):
+        """
+        Start or resume the countdown from the time remaining
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self.deadline is None:
+            now = self.clock()
+            self.deadline = now + self.paused_remaining
+            self.expected_tick = now
+
+    def pause(self):
+        """
+        Pause the countdown keeping the exact time remaining
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self.deadline is not None:
+            self.paused_remaining = max(0.0, self.deadline - self.clock())
+            self.deadline = None
+            self.expected_tick = None
+
+    def reset(self, duration=None, remaining=None):
+        """
+        Stop the countdown and set it back to a full duration
+
+        Args:
+            duration (float, optional): New duration in seconds
+            remaining (float, optional): Time left if not the full duration
+
+        Returns:
+            None
+        """
+        if duration is not None:
+            self.duration = duration
+        self.deadline = None
+        self.expected_tick = None
+        self.paused_remaining = self.duration if remaining is None else remaining
+
+    def add(self, seconds):
+        """
+        Add time to the countdown, or take it away if negative
+
+        Args:
+            seconds (float): Seconds to add
+
+        Returns:
+            None
+        """
+        remaining = max(0.0, self.remaining() + seconds)
+        if self.deadline is None:
+            self.paused_remaining = remaining
+        else:
+            self.deadline = self.clock() + remaining
+
+    def remaining(self):
+        """
+        Exact time remaining
+
+        Args:
+            None
+
+        Returns:
+            remaining (float): Seconds left, never negative
+        """
+        if self.deadline is None:
+            return self.paused_remaining
+        return max(0.0, self.deadline - self.clock())
+
+    def remaining_seconds(self):
+        """
+        Time remaining as shown on the clock
+
+        Rounded up so a fresh 20 minute level reads 20:00 for its first second
+
+        Args:
+            None
+
+        Returns:
+            remaining (int): Whole seconds left
+        """
+        return math.ceil(self.remaining() - 1e-9)
+
+    def tick(self):
+        """
+        Record a tick and measure how late it arrived
+
+        Args:
+            None
+
+        Returns:
+            remaining (int): Whole seconds left
+        """
+        if self.expected_tick is not None:
+            lag = max(0.0, self.clock() - self.expected_tick)
+            self.last_lag = lag
+            self.max_lag = max(self.max_lag, lag)
+            self.drift_corrected += lag
+        return self.remaining_seconds()
+
+    def next_tick_delay(self, step=1.0):
+        """
+        Milliseconds until the displayed time next changes
+
+        Also records when that tick is expected so its lag can be measured
+
+        Args:
+            step (float, optional): Display resolution in seconds
+
+        Returns:
+            delay (int): Delay in milliseconds, at least 1
+        """
+        remaining = self.remaining()
+        units = math.ceil(remaining / step - 1e-9)
+        until_boundary = remaining - (units - 1) * step
+        delay = max(1, math.ceil(until_boundary * 1000))
+        if self.deadline is not None:
+            self.expected_tick = self.clock() + delay / 1000
+        return delay
+
+
+ClockState = namedtuple(
+    "ClockState",
+    [
+        "round_index",
+        "round_num",
+        "s_blind",
+        "b_blind",
+        "ante",
+        "is_break",
+        "remaining",
+        "level_elapsed",
+        "elapsed",
+        "is_paused",
+        "is_expired",
+        "tenths",
+    ],
+)
+
+
+class TournamentClock:
+    """
+    Headless tournament clock
+
+    Owns the GameState and the level Countdown and tells subscribers what happened.
+    It never schedules itself, a driver (Tk, a loop, a test) calls update() when
+    next_tick_delay() says the display is due to change.
+
+    In the last fine_seconds of a level the display counts tenths of a
+    second and ticks ten times a second, otherwise it ticks once a second.
+
+    Events passed to subscribers:
+        resume, pause, tick, expire, reset, level_up, level_down, break_start,
+        add_time, restart, schedule, seek, restore
+    """
+
+    def __init__(self, rounds, clock=time.monotonic):
+        self.clock = clock
+        self.game_state = GameState(rounds)
+        self.countdown = Countdown(self.game_state.time * 60, clock)
+        self.subscribers = []
+        self.completed = 0.0
+        self.is_expired = False
+        self.fine_seconds = FINE_SECONDS
+        self.shown = self.countdown.remaining_seconds()
+        self.shown_tenths = None
+        self.state = self.compute_state()
+
+    def subscribe(self, callback):
+        """
+        Register a callback for clock events
+
+        Args:
+            callback (func): Called as callback(event, state)
+
+        Returns:
+            callback (func): The callback, so it can be used as a decorator
+        """
+        self.subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback):
+        """
+        Remove a previously registered callback
+
+        Args:
+            callback (func): Callback to remove
+
+        Returns:
+            None
+        """
+        if callback in self.subscribers:
+            self.subscribers.remove(callback)
+
+    def compute_state(self):
+        """
+        Build a snapshot of the clock
+
+        Args:
+            None
+
+        Returns:
+            state (ClockState): Current clock state
+        """
+        countdown = self.countdown
+        level_elapsed = countdown.duration - countdown.remaining()
+        return ClockState(
+            self.game_state.round_index,
+            self.game_state.round_num,
+            self.game_state.s_blind,
+            self.game_state.b_blind,
+            self.game_state.ante,
+            self.game_state.is_break,
+            self.shown,
+            level_elapsed,
+            self.completed + level_elapsed,
+            countdown.is_paused,
+            self.is_expired,
+            self.tenths(),
+        )
+
+    def tenths(self):
+        """
+        Tenths of a second left when the level is in its final stretch
+
+        Args:
+            None
+
+        Returns:
+            tenths (int|None): Tenths left rounded up, None outside the final stretch
+        """
+        remaining = self.countdown.remaining()
+        if remaining > self.fine_seconds:
+            return None
+        return math.ceil(remaining * 10 - 1e-9)
+
+    def emit(self, event):
+        """
+        Compute the state once and hand it to every subscriber
+
+        Args:
+            event (str): Name of the event
+
+        Returns:
+            state (ClockState): State passed to subscribers
+        """
+        self.state = self.compute_state()
+        for callback in list(self.subscribers):
+            callback(event, self.state)
+        return self.state
+
+    @property
+    def is_running(self):
+        """True while the level countdown is running"""
+        return not self.countdown.is_paused and not self.is_expired
+
+    def start(self):
+        """
+        Start or resume the level countdown
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self.countdown.is_paused and not self.is_expired:
+            self.countdown.start()
+            self.emit("resume")
+
+    def pause(self):
+        """
+        Pause the level countdown
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self.is_running:
+            self.countdown.pause()
+            self.shown = self.countdown.remaining_seconds()
+            self.emit("pause")
+
+    def toggle(self):
+        """
+        Start/pause/reset from a single control
+
+        if paused start, if expired reset, otherwise pause
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self.countdown.is_paused and not self.is_expired:
+            self.start()
+        elif self.is_expired:
+            self.reset_timer()
+        else:
+            self.pause()
+
+    def load_level(self, event):
+        """
+        Reset the countdown to the current level and announce it
+
+        Args:
+            event (str): Event to emit
+
+        Returns:
+            None
+        """
+        self.countdown.reset(self.game_state.time * 60)
+        self.is_expired = False
+        self.shown = self.countdown.remaining_seconds()
+        self.emit(event)
+        if event == "level_up" and self.game_state.is_break:
+            self.emit("break_start")
+
+    def reset_timer(self):
+        """
+        Put the current level back to its full length
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.load_level("reset")
+
+    def next_round(self):
+        """
+        Advance to the next level
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        index = self.game_state.round_index
+        self.completed += self.countdown.duration - self.countdown.remaining()
+        self.game_state.next_round()
+        self.load_level("level_up" if self.game_state.round_index != index else "reset")
+
+    def previous_round(self):
+        """
+        Go back to the previous level
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        index = self.game_state.round_index
+        self.game_state.previous_round()
+        if self.game_state.round_index == index:
+            self.load_level("reset")
+            return
+        self.completed = self.game_state.round_start(self.game_state.round_index)
+        self.load_level("level_down")
+
+    def add_time(self, seconds):
+        """
+        Add time to the current level, or take it away if negative
+
+        A running clock keeps running and an expired level starts counting
+        again if time is added
+
+        Args:
+            seconds (float): Seconds to add
+
+        Returns:
+            None
+        """
+        self.countdown.add(seconds)
+        self.shown = self.countdown.remaining_seconds()
+        self.is_expired = self.shown <= 0 and self.is_expired
+        self.emit("add_time")
+
+    def restart_game(self):
+        """
+        Go back to the first level
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.completed = 0.0
+        self.game_state.restart_game()
+        self.load_level("restart")
+
+    def update_rounds(self, rounds):
+        """
+        Apply an edited schedule
+
+        A running clock keeps running with the time it has left. Only when the
+        current level's own length changes does its time left move with it,
+        keeping the time already played in the level
+
+        Args:
+            rounds (BlindSchedule): New rounds
+
+        Returns:
+            None
+        """
+        index = self.game_state.round_index
+        duration = self.countdown.duration
+        self.game_state.update_rounds(rounds)
+        new_duration = self.game_state.time * 60
+        if self.game_state.round_index != index:
+            self.completed = self.game_state.round_start(self.game_state.round_index)
+            self.load_level("schedule")
+            return
+        if new_duration != duration:
+            running = self.is_running
+            remaining = max(0.0, new_duration - duration + self.countdown.remaining())
+            self.countdown.reset(new_duration, remaining)
+            self.is_expired = self.is_expired and remaining <= 0
+            self.shown = self.countdown.remaining_seconds()
+            if running:
+                self.countdown.start()
+        self.emit("schedule")
+
+    def seek(self, elapsed):
+        """
+        Put the clock where it should be a given time into the tournament
+
+        A running clock keeps running from the new position
+
+        Args:
+            elapsed (float): Seconds since the start of the first level
+
+        Returns:
+            None
+        """
+        running = self.is_running
+        remaining = self.game_state.seek(elapsed)
+        self.completed = self.game_state.round_start(self.game_state.round_index)
+        self.countdown.reset(self.game_state.time * 60, remaining)
+        self.is_expired = False
+        self.shown = self.countdown.remaining_seconds()
+        if running:
+            self.countdown.start()
+        self.emit("seek")
+
+    def restore(self, round_index, remaining, running, completed):
+        """
+        Put the clock back into a saved position
+
+        Args:
+            round_index (int): Level to return to
+            remaining (float): Seconds left in that level
+            running (bool): Start the countdown after restoring
+            completed (float): Seconds played in earlier levels
+
+        Returns:
+            None
+        """
+        self.game_state.round_index = min(round_index, len(self.game_state.rounds) - 1)
+        self.completed = completed
+        self.countdown.reset(self.game_state.time * 60, remaining)
+        self.is_expired = False
+        self.shown = self.countdown.remaining_seconds()
+        if running:
+            self.countdown.start()
+        self.emit("restore")
+
+    def projected_start(self, index, now=None):
+        """
+        Wall clock time a level is expected to start, assuming no more pauses
+
+        Args:
+            index (int): Level index
+            now (float, optional): Current time.time(), read if not given
+
+        Returns:
+            start (float|None): Unix time of the start or None for past levels
+        """
+        current = self.game_state.round_index
+        if index <= current:
+            return None
+        now = time.time() if now is None else now
+        return (
+            now
+            + self.countdown.remaining()
+            + self.game_state.round_start(index)
+            - self.game_state.round_start(current + 1)
+        )
+
+    def update(self):
+        """
+        Advance the clock to now
+
+        Emits tick when the displayed time changes and expire when time runs out
+
+        Args:
+            None
+
+        Returns:
+            state (ClockState): Current clock state
+        """
+        if not self.is_running:
+            return self.state
+        remaining = self.countdown.tick()
+        tenths = self.tenths()
+        if remaining != self.shown or tenths != self.shown_tenths:
+            self.shown = remaining
+            self.shown_tenths = tenths
+            if remaining > 0:
+                return self.emit("tick")
+        if remaining <= 0:
+            self.is_expired = True
+            return self.emit("expire")
+        return self.state
+
+    def next_tick_delay(self):
+        """
+        Milliseconds until update() should next be called
+
+        Args:
+            None
+
+        Returns:
+            delay (int|None): Delay in milliseconds or None when nothing is due
+        """
+        if not self.is_running:
+            return None
+        fine = self.countdown.remaining() <= self.fine_seconds
+        return self.countdown.next_tick_delay(0.1 if fine else 1.0)
+
+    def run(self, sleep=time.sleep):
+        """
+        Drive the clock without a GUI until the level expires or is paused
+
+        Args:
+            sleep (func, optional): Sleep function taking seconds
+
+        Returns:
+            state (ClockState): Final clock state
+        """
+        delay = self.next_tick_delay()
+        while delay is not None:
+            sleep(delay / 1000)
+            self.update()
+            delay = self.next_tick_delay()
+        return self.state
+
+
+def parse_clock_time(text):
+    """
+    Parse a time like 2:13 or 2:13:30 into seconds
+
+    Args:
+        text (str): Hours and minutes with optional seconds
+
+    Returns:
+        seconds (int): Time in seconds
+    """
+    parts = [int(part) for part in text.strip().split(":")]
+    if not 2 <= len(parts) <= 3 or min(parts) < 0:
+        raise ValueError(text)
+    hours, minutes, seconds = (parts + [0])[:3]
+    return hours * 3600 + minutes * 60 + seconds
+
+
+@lru_cache(maxsize=4096)
+def format_time(seconds):
+    """
+    Format time for readable display, built once per value and reused
+
+    Args:
+        seconds (int): Time in seconds
+
+    Returns:
+        time (str): Time in a readable clock format mm:ss, h:mm:ss from an hour
+    """
+    hours, rest = divmod(seconds, 3600)
+    mins, secs = divmod(rest, 60)
+    return f"{hours}:{mins:02d}:{secs:02d}" if hours else f"{mins}:{secs:02d}"
+
+
+@lru_cache(maxsize=1024)
+def format_tenths(tenths):
+    """
+    Format time to a tenth of a second for the final stretch of a level
+
+    Args:
+        tenths (int): Time in tenths of a second
+
+    Returns:
+        time (str): Time in the format m:ss.t
+    """
+    secs, tenth = divmod(tenths, 10)
+    return f"{format_time(secs)}.{tenth}"
+
+
+def state_text(state):
+    """
+    Text the clock should show for a state, with tenths in the final minute
+
+    Args:
+        state (ClockState): Clock state
+
+    Returns:
+        time (str): Clock text
+    """
+    if state.tenths is None:
+        return format_time(state.remaining)
+    return format_tenths(state.tenths)
+
+
+def base_state(state):
+    """
+    Visual state to show when the screen is not flashing
+
+    Args:
+        state (ClockState): Clock state
+
+    Returns:
+        name (str): Visual state name
+    """
+    if state.is_break:
+        return "break"
+    if 0 < state.remaining <= FINE_SECONDS:
+        return "final_minute"
+    return "normal"
@@ -0,0 +1,199 @@
+"""
+Secondary display for Poker Time
+
+Shows the clock the main window publishes with POKER_TIME_SHARED set, for
+example on a second projector. Runs no timer logic of its own, it maps the
+shared state read only and counts down from the last published deadline.
+
+    python display.py [state file]
+"""
+
+import argparse
+import math
+import sys
+import tkinter as tk
+
+from clock import ClockState, base_state
+from main import BG_COLOR, ClockFace
+from sharedstate import StateReader
+
+POLL_MS = 100
+FINE_MS = 60_000
+
+
+class SharedClock:
+    """
+    Read only stand in for a TournamentClock backed by the shared state
+    """
+
+    def __init__(self, reader):
+        self.reader = reader
+        self.shared = reader.read()
+
+    def refresh(self):
+        """
+        Read the shared state again if the main clock published since
+
+        Args:
+            None
+
+        Returns:
+            changed (bool): True if a new state was read
+        """
+        if not self.reader.changed():
+            return False
+        shared = self.reader.read()
+        if shared is None:
+            return False
+        self.shared = shared
+        return True
+
+    def remaining_ms(self):
+        """
+        Milliseconds left in the level right now
+
+        Args:
+            None
+
+        Returns:
+            remaining (float): Milliseconds left
+        """
+        return StateReader.remaining(self.shared)
+
+    @property
+    def state(self):
+        """
+        Current state in the same shape the TournamentClock reports
+
+        Args:
+            None
+
+        Returns:
+            state (ClockState): Clock state
+        """
+        shared = self.shared
+        remaining_ms = self.remaining_ms()
+        return ClockState(
+            shared.round_index,
+            shared.round_num,
+            shared.s_blind,
+            shared.b_blind,
+            shared.ante,
+            shared.is_break,
+            math.ceil(remaining_ms / 1000),
+            0,
+            0,
+            shared.is_paused,
+            shared.is_expired,
+            math.ceil(remaining_ms / 100) if remaining_ms <= FINE_MS else None,
+        )
+
+    def next_change(self):
+        """
+        Milliseconds until the shown time changes or the state should be checked
+
+        Args:
+            None
+
+        Returns:
+            delay (int): Milliseconds until the next poll
+        """
+        if self.shared.is_paused or self.shared.is_expired:
+            return POLL_MS
+        remaining_ms = self.remaining_ms()
+        step = 100 if remaining_ms <= FINE_MS else 1000
+        return min(POLL_MS, math.ceil(remaining_ms % step) + 1)
+
+
+class DisplayPage:
+    """
+    Game page layout without controls, driven by a SharedClock
+    """
+
+    def __init__(self, root, reader):
+        self.root = root
+        self.clock = SharedClock(reader)
+        self.shown = None
+        self.alert = False
+        self.after_id = None
+
+        self.root.columnconfigure(0, weight=1)
+        self.root.rowconfigure((0, 1, 2, 3), weight=1)
+        self.face = ClockFace(self, 1, 1)
+        self.timer = self.face.timer
+        self.visual_states = self.face.visual_states()
+        self.draw(self.clock.state)
+        self.poll()
+
+    def draw(self, state):
+        """
+        Update the labels that changed since the last draw
+
+        Args:
+            state (ClockState): Clock state
+
+        Returns:
+            None
+        """
+        self.timer.show(state)
+        shown = (state.round_num, state.s_blind, state.b_blind)
+        if shown != self.shown:
+            self.shown = shown
+            self.face.show_round(*shown)
+        alert = self.clock.shared.alert
+        if alert and not self.alert:
+            self.visual_states.play(["alert_on", "alert_off"] * 10, 500)
+        elif not alert:
+            if self.alert:
+                self.visual_states.stop()
+            self.visual_states.apply(base_state(state))
+        self.alert = alert
+
+    def poll(self):
+        """
+        Tk after() callback, redraws and schedules the next poll
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.clock.refresh()
+        self.draw(self.clock.state)
+        self.after_id = self.root.after(self.clock.next_change(), self.poll)
+
+
+def main():
+    """
+    Run a secondary display from the command line
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Poker Time secondary display")
+    parser.add_argument(
+        "path", nargs="?", help="state file, the main window's default if not given"
+    )
+    args = parser.parse_args()
+
+    try:
+        reader = StateReader(args.path)
+    except (OSError, ValueError) as e:
+        sys.exit(f"No shared clock state to show: {e}")
+    if reader.read() is None:
+        sys.exit("The shared clock state never settled")
+    root = tk.Tk()
+    root.title("Poker Time Display")
+    root.geometry("1200x900")
+    root.configure(bg=BG_COLOR)
+    DisplayPage(root, reader)
+    root.mainloop()
+    reader.close()
+
+
+if __name__ == "__main__":
+    main()
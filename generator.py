@@ -0,0 +1,172 @@
+"""
+Blind structure generator for Poker Time
+
+Builds thousands of candidate blind progressions at once as NumPy arrays,
+rounds them to amounts the chip set can pay, scores every candidate on
+smoothness, denomination fit and projected end time, and returns the best.
+
+Tournaments are limited to MAX_LEVELS levels so the candidate arrays stay a
+few megabytes, and structures whose big blinds would not fit a schedule
+column are never offered.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from schedule import MAX_VALUE, BlindSchedule
+
+DEFAULT_DENOMINATIONS = (25, 100, 500, 1000, 5000)
+END_STACK_BBS = 20
+SPARE_LEVELS = 3
+MAX_LEVELS = 500
+MAX_BLIND = MAX_VALUE // 4
+WEIGHTS = {"smoothness": 1.0, "fit": 2.0, "end": 4.0}
+
+Structure = namedtuple("Structure", ["rounds", "score", "end_minutes"])
+
+
+def candidate_grid(start_bbs, ratios, curves):
+    """
+    Every combination of the search parameters as flat arrays
+
+    Args:
+        start_bbs (arr[float]): Starting big blinds
+        ratios (arr[float]): Growth from one level to the next
+        curves (arr[float]): Change in growth across the tournament
+
+    Returns:
+        grid (tuple): start_bbs, ratios and curves as arrays of equal length
+    """
+    grid = np.meshgrid(start_bbs, ratios, curves, indexing="ij")
+    return tuple(axis.ravel() for axis in grid)
+
+
+def round_to_chips(raw_sb, denominations):
+    """
+    Round small blinds to amounts the chip set can pay
+
+    Each small blind is rounded to a multiple of the largest chip worth no
+    more than half of it, so it never needs a handful of small chips
+
+    Args:
+        raw_sb (ndarray): Small blinds before rounding
+        denominations (ndarray): Chip values, sorted ascending
+
+    Returns:
+        small_blinds (ndarray): Rounded small blinds
+    """
+    slot = np.searchsorted(denominations, raw_sb / 2, side="right") - 1
+    unit = denominations[np.clip(slot, 0, len(denominations) - 1)]
+    return np.maximum(unit, np.round(raw_sb / unit) * unit)
+
+
+def score_candidates(raw_sb, small_blinds, level_minutes, end_bb, target_minutes):
+    """
+    Score candidate progressions, lower is better
+
+    Args:
+        raw_sb (ndarray): Small blinds before rounding, one row per candidate
+        small_blinds (ndarray): Rounded small blinds, same shape
+        level_minutes (int): Length of every level
+        end_bb (float): Big blind at which the tournament is expected to end
+        target_minutes (int): Wanted length of the tournament
+
+    Returns:
+        scores (tuple): Total score, projected end level and end time per candidate
+    """
+    steps = np.log(small_blinds[:, 1:] / small_blinds[:, :-1])
+    smoothness = steps.std(axis=1) + 2.0 * (steps <= 0).mean(axis=1)
+    fit = (np.abs(small_blinds - raw_sb) / raw_sb).mean(axis=1)
+
+    reached = 2 * small_blinds >= end_bb
+    finished = reached.any(axis=1)
+    end_level = np.where(finished, reached.argmax(axis=1) + 1, small_blinds.shape[1])
+    end_minutes = end_level * level_minutes
+    end = np.abs(end_minutes - target_minutes) / target_minutes
+    end = np.where(finished, end, end + 10.0)
+
+    total = (
+        WEIGHTS["smoothness"] * smoothness + WEIGHTS["fit"] * fit + WEIGHTS["end"] * end
+    )
+    return total, end_level, end_minutes
+
+
+def generate_structures(
+    starting_stack,
+    players,
+    target_minutes,
+    level_minutes,
+    denominations=DEFAULT_DENOMINATIONS,
+    count=3,
+):
+    """
+    Generate the best blind structures for a tournament
+
+    Args:
+        starting_stack (int): Chips each player starts with
+        players (int): Number of players
+        target_minutes (int): Wanted length of the tournament
+        level_minutes (int): Length of every level
+        denominations (iter[int], optional): Chip values in the set
+        count (int, optional): Number of structures to return
+
+    Returns:
+        structures (arr[Structure]): Best structures first, ValueError if
+            the details are out of range or no structure fits
+    """
+    if min(starting_stack, players, target_minutes, level_minutes) <= 0:
+        raise ValueError("stack, players and times must be positive")
+    if starting_stack * players > MAX_BLIND:
+        raise ValueError("there are too many chips in play")
+    chips = np.array(sorted(set(denominations)), dtype=float)
+    if chips.size == 0 or chips[0] <= 0:
+        raise ValueError("denominations must be positive")
+    if chips[-1] > MAX_BLIND:
+        raise ValueError("denominations are too large")
+
+    target_levels = max(2, round(target_minutes / level_minutes))
+    levels = 2 * target_levels + SPARE_LEVELS
+    if levels > MAX_LEVELS:
+        raise ValueError(
+            f"that needs more than {MAX_LEVELS} levels, use longer levels "
+            "or a shorter tournament"
+        )
+    end_bb = starting_stack * players / END_STACK_BBS
+
+    start_bbs, ratios, curves = candidate_grid(
+        np.geomspace(starting_stack / 400, starting_stack / 25, 24),
+        np.linspace(1.1, 1.8, 50),
+        np.linspace(-0.5, 0.5, 5),
+    )
+    k = np.arange(levels, dtype=float)
+    growth = np.log(ratios)[:, None] * k * (1 + curves[:, None] * k / levels)
+    raw_sb = np.maximum(start_bbs[:, None] / 2 * np.exp(growth), chips[0])
+    small_blinds = round_to_chips(raw_sb, chips)
+
+    total, end_level, end_minutes = score_candidates(
+        raw_sb, small_blinds, level_minutes, end_bb, target_minutes
+    )
+    structures = []
+    seen = set()
+    for i in np.argsort(total, kind="stable"):
+        size = min(levels, int(end_level[i]) + SPARE_LEVELS)
+        if small_blinds[i, :size].max() > MAX_BLIND:
+            continue
+        blinds = small_blinds[i, :size].astype(np.int64)
+        key = blinds.tobytes()
+        if key in seen:
+            continue
+        seen.add(key)
+        rounds = BlindSchedule.from_columns(
+            range(1, size + 1),
+            [level_minutes] * size,
+            blinds.tolist(),
+            (blinds * 2).tolist(),
+        )
+        structures.append(Structure(rounds, float(total[i]), int(end_minutes[i])))
+        if len(structures) == count:
+            break
+    if not structures:
+        raise ValueError("the blinds would grow too large")
+    return structures
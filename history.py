@@ -0,0 +1,199 @@
+"""
+Edit history for Poker Time blind schedules
+
+Every saved version of a schedule is kept as an immutable Snapshot. A
+snapshot splits the levels into chunks of CHUNK levels, one small array per
+column in each chunk, and a new snapshot reuses every chunk of the one
+before it that did not change. Editing one level of a 500 level schedule
+therefore stores one chunk and a tuple of chunk references, not a copy of
+the whole schedule, and any number of versions can be kept.
+"""
+
+from datetime import datetime
+
+from schedule import COLUMNS, BlindSchedule
+
+CHUNK = 32
+NAMES = tuple(COLUMNS.values())
+
+
+class Snapshot:
+    """
+    Immutable schedule made of shared chunks
+
+    Never modify a chunk in place, other snapshots may hold it
+    """
+
+    __slots__ = ("chunks", "size")
+
+    def __init__(self, chunks, size):
+        self.chunks = chunks
+        self.size = size
+
+    @classmethod
+    def from_schedule(cls, schedule, base=None):
+        """
+        Capture a schedule, sharing the chunks it has in common with base
+
+        Args:
+            schedule (BlindSchedule): Schedule to capture
+            base (Snapshot, optional): Earlier snapshot to share chunks with
+
+        Returns:
+            snapshot (Snapshot): New snapshot, or base itself if nothing changed
+        """
+        columns = [getattr(schedule, name) for name in NAMES]
+        size = len(schedule)
+        old = base.chunks if base is not None else ()
+        chunks = []
+        for number, start in enumerate(range(0, size, CHUNK)):
+            chunk = tuple(column[start : start + CHUNK] for column in columns)
+            if number < len(old) and old[number] == chunk:
+                chunk = old[number]
+            chunks.append(chunk)
+        if (
+            base is not None
+            and size == base.size
+            and all(new is shared for new, shared in zip(chunks, old))
+        ):
+            return base
+        return cls(tuple(chunks), size)
+
+    def __len__(self):
+        return self.size
+
+    def to_schedule(self):
+        """
+        Mutable schedule with the levels of this snapshot
+
+        Args:
+            None
+
+        Returns:
+            schedule (BlindSchedule): New schedule
+        """
+        schedule = BlindSchedule()
+        for position, name in enumerate(NAMES):
+            column = getattr(schedule, name)
+            for chunk in self.chunks:
+                column.extend(chunk[position])
+        return schedule
+
+
+class History:
+    """
+    Undo and redo history of a schedule
+
+    record() adds a version after the current one and drops anything that
+    had been undone, undo(), redo() and jump() move between versions
+    """
+
+    def __init__(self, schedule=None):
+        self.entries = []
+        self.position = -1
+        if schedule is not None:
+            self.record(schedule, "Start")
+
+    @property
+    def current(self):
+        """Snapshot at the current position, None if nothing is recorded"""
+        return self.entries[self.position][0] if self.entries else None
+
+    def can_undo(self):
+        """
+        Whether there is an earlier version
+
+        Args:
+            None
+
+        Returns:
+            can_undo (bool): True if undo() would move
+        """
+        return self.position > 0
+
+    def can_redo(self):
+        """
+        Whether there is a later version
+
+        Args:
+            None
+
+        Returns:
+            can_redo (bool): True if redo() would move
+        """
+        return self.position < len(self.entries) - 1
+
+    def record(self, schedule, label):
+        """
+        Add a version of the schedule after the current one
+
+        Args:
+            schedule (BlindSchedule): Schedule as it is now
+            label (str): What changed, shown in the history list
+
+        Returns:
+            recorded (bool): False if the schedule matches the current version
+        """
+        snapshot = Snapshot.from_schedule(schedule, self.current)
+        if snapshot is self.current:
+            return False
+        del self.entries[self.position + 1 :]
+        self.entries.append((snapshot, label, datetime.now()))
+        self.position += 1
+        return True
+
+    def jump(self, position):
+        """
+        Move to any recorded version
+
+        Args:
+            position (int): Version index, 0 is the oldest
+
+        Returns:
+            schedule (BlindSchedule): Schedule of that version
+        """
+        if not 0 <= position < len(self.entries):
+            raise IndexError("no such version")
+        self.position = position
+        return self.current.to_schedule()
+
+    def undo(self):
+        """
+        Move to the previous version
+
+        Args:
+            None
+
+        Returns:
+            schedule (BlindSchedule|None): Schedule of that version, None if
+                there is none
+        """
+        return self.jump(self.position - 1) if self.can_undo() else None
+
+    def redo(self):
+        """
+        Move to the next version
+
+        Args:
+            None
+
+        Returns:
+            schedule (BlindSchedule|None): Schedule of that version, None if
+                there is none
+        """
+        return self.jump(self.position + 1) if self.can_redo() else None
+
+    def labels(self):
+        """
+        Description of every version for a history list
+
+        Args:
+            None
+
+        Returns:
+            labels (arr[str]): Time, what changed and the number of levels
+        """
+        return [
+            f"{when:%H:%M:%S}  {label} ({len(snapshot)} levels)"
+            for snapshot, label, when in self.entries
+        ]
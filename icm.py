@@ -0,0 +1,177 @@
+"""
+ICM payout calculator for Poker Time
+
+Works out each player's share of the remaining prize money from their
+stack using the Malmuth-Harville model, where a player's chance of
+finishing in the next best place is their share of the chips still in play.
+
+Small fields are solved exactly with a DP over the sets of players that have
+already taken the top places, one layer of sets per paid place. Larger
+fields sample finishing orders instead and report the error of the estimate.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+EXACT_LIMIT = 18
+SAMPLES = 40000
+MIN_SAMPLES = 1000
+SAMPLE_CELLS = 4000000
+CHUNK_CELLS = 1000000
+Z_95 = 1.96
+
+ICMResult = namedtuple("ICMResult", ["equity", "error", "exact"])
+
+
+def check_inputs(stacks, payouts):
+    """
+    Validate stacks and payouts and put them in arrays
+
+    Args:
+        stacks (iter[int]): Chips of each player still in
+        payouts (iter[float]): Prize for each remaining place, best first
+
+    Returns:
+        inputs (tuple): Stacks as floats and payouts padded with zeros to one per player
+    """
+    stacks = np.asarray(list(stacks), dtype=float)
+    payouts = np.asarray(list(payouts), dtype=float)
+    if not stacks.size or stacks.min() <= 0:
+        raise ValueError("every player needs chips")
+    if payouts.size and payouts.min() < 0:
+        raise ValueError("payouts can not be negative")
+    paid = np.zeros(stacks.size)
+    paid[: min(stacks.size, payouts.size)] = payouts[: stacks.size]
+    return stacks, paid
+
+
+def exact_icm(stacks, payouts):
+    """
+    Exact ICM equity
+
+    prob[mask] is the chance that the players in mask took the top places,
+    in any order. Only sets smaller than the number of paid places are
+    visited, so unpaid places cost nothing.
+
+    Args:
+        stacks (iter[int]): Chips of each player still in
+        payouts (iter[float]): Prize for each remaining place, best first
+
+    Returns:
+        equity (ndarray): Expected prize of each player
+    """
+    stacks, payouts = check_inputs(stacks, payouts)
+    count = stacks.size
+    if count > EXACT_LIMIT + 4:
+        raise ValueError(f"too many players for an exact result ({count})")
+    size = 1 << count
+    chips = np.zeros(size)
+    taken = np.zeros(size, dtype=np.int8)
+    for i in range(count):
+        bit = 1 << i
+        chips[bit : 2 * bit] = chips[:bit] + stacks[i]
+        taken[bit : 2 * bit] = taken[:bit] + 1
+    total = stacks.sum()
+    places = int(np.flatnonzero(payouts).max()) + 1 if payouts.any() else 0
+
+    prob = np.zeros(size)
+    prob[0] = 1.0
+    equity = np.zeros(count)
+    for place in range(places):
+        masks = np.flatnonzero(taken == place)
+        reach = prob[masks] / (total - chips[masks])
+        for i in range(count):
+            bit = 1 << i
+            free = (masks & bit) == 0
+            share = reach[free] * stacks[i]
+            equity[i] += share.sum() * payouts[place]
+            if place + 1 < places:
+                prob[masks[free] | bit] += share
+    return equity
+
+
+def sampled_icm(stacks, payouts, samples=SAMPLES, seed=0):
+    """
+    ICM equity estimated from random finishing orders
+
+    Sorting exponential draws divided by stack gives an order with exactly
+    the Malmuth-Harville probabilities. Large fields draw fewer orders so
+    the time stays interactive, the error grows to match.
+
+    Args:
+        stacks (iter[int]): Chips of each player still in
+        payouts (iter[float]): Prize for each remaining place, best first
+        samples (int, optional): Most finishing orders to draw
+        seed (int, optional): Random seed
+
+    Returns:
+        result (ICMResult): Equity and its 95% error for each player
+    """
+    stacks, payouts = check_inputs(stacks, payouts)
+    count = stacks.size
+    places = int(np.flatnonzero(payouts).max()) + 1 if payouts.any() else 0
+    if not places:
+        return ICMResult(np.zeros(count), np.zeros(count), False)
+    samples = min(samples, max(MIN_SAMPLES, SAMPLE_CELLS // count))
+    prizes = payouts[:places]
+    rng = np.random.default_rng(seed)
+    total = np.zeros(count)
+    squares = np.zeros(count)
+    chunk = max(1, CHUNK_CELLS // count)
+    done = 0
+    while done < samples:
+        rows = min(chunk, samples - done)
+        keys = rng.exponential(size=(rows, count)) / stacks
+        if places < count:
+            top = np.argpartition(keys, places - 1, axis=1)[:, :places]
+        else:
+            top = np.tile(np.arange(count), (rows, 1))
+        order = np.take_along_axis(
+            top, np.argsort(np.take_along_axis(keys, top, axis=1), axis=1), axis=1
+        )
+        players = order.ravel()
+        total += np.bincount(players, np.tile(prizes, rows), count)
+        squares += np.bincount(players, np.tile(prizes * prizes, rows), count)
+        done += rows
+    mean = total / samples
+    variance = np.maximum(squares / samples - mean * mean, 0)
+    return ICMResult(mean, Z_95 * np.sqrt(variance / samples), False)
+
+
+def icm(stacks, payouts, samples=SAMPLES, seed=0):
+    """
+    ICM equity, exact for small fields and sampled for large ones
+
+    Args:
+        stacks (iter[int]): Chips of each player still in
+        payouts (iter[float]): Prize for each remaining place, best first
+        samples (int, optional): Finishing orders to draw when sampling
+        seed (int, optional): Random seed when sampling
+
+    Returns:
+        result (ICMResult): Equity, its 95% error (zero when exact) and
+            whether it is exact
+    """
+    stacks = list(stacks)
+    if len(stacks) <= EXACT_LIMIT:
+        equity = exact_icm(stacks, payouts)
+        return ICMResult(equity, np.zeros(len(stacks)), True)
+    return sampled_icm(stacks, payouts, samples, seed)
+
+
+def chip_chop(stacks, payouts):
+    """
+    Chip chop deal, everyone is paid the lowest remaining prize and the rest
+    is split by chip count
+
+    Args:
+        stacks (iter[int]): Chips of each player still in
+        payouts (iter[float]): Prize for each remaining place, best first
+
+    Returns:
+        shares (ndarray): Prize of each player
+    """
+    stacks, payouts = check_inputs(stacks, payouts)
+    floor = payouts.min()
+    return floor + (payouts.sum() - floor * stacks.size) * stacks / stacks.sum()
@@ -0,0 +1,264 @@
+"""
+Streaming importer for game structure files
+
+Reads CSV or TSV files one line at a time, with or without a header line.
+Bad lines are reported with their line number instead of stopping the import.
+"""
+
+import csv
+import io
+import itertools
+
+from schedule import MAX_VALUE, BlindSchedule
+
+MAX_ERRORS = 100
+HEADER_NAMES = {
+    "num": ("round", "rounds", "level", "num", "#"),
+    "time": ("time", "minutes", "mins", "duration", "length"),
+    "s_blind": ("small blind", "small", "sb", "s_blind", "smallblind"),
+    "b_blind": ("big blind", "big", "bb", "b_blind", "bigblind"),
+    "ante": ("ante", "antes", "bb ante"),
+    "is_break": ("break", "is_break"),
+}
+POSITIONS = {"num": 0, "time": 1, "s_blind": 2, "b_blind": 3, "ante": 4, "is_break": 5}
+TRUE_WORDS = ("1", "y", "yes", "true", "x", "break")
+SEPARATORS = str.maketrans("", "", ", _'")
+
+
+class ImportReport:
+    """
+    Result of importing a structure file
+
+    Keeps every parsed round and the first MAX_ERRORS problems, error_count
+    still counts all of them
+    """
+
+    def __init__(self):
+        self.rounds = BlindSchedule()
+        self.errors = []
+        self.error_count = 0
+        self.has_header = False
+
+    def add_error(self, line_num, message):
+        """
+        Record a problem with a line
+
+        Args:
+            line_num (int): Line number in the file, starting at 1
+            message (str): What was wrong
+
+        Returns:
+            None
+        """
+        self.error_count += 1
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append((line_num, message))
+
+    def summary(self, limit=10):
+        """
+        Human readable list of the first errors
+
+        Args:
+            limit (int, optional): Number of errors to list
+
+        Returns:
+            summary (str): One error per line
+        """
+        lines = [f"Line {line_num}: {message}" for line_num, message in self.errors]
+        lines = lines[:limit]
+        if self.error_count > limit:
+            lines.append(f"...and {self.error_count - limit} more")
+        return "\n".join(lines)
+
+
+def parse_int(text):
+    """
+    Parse a whole number allowing whitespace and thousands separators
+
+    Numbers too large for a schedule column are rejected here rather than
+    failing when they are stored
+
+    Args:
+        text (str): Field text such as " 1,000 "
+
+    Returns:
+        value (int): Parsed number
+    """
+    cleaned = text.translate(SEPARATORS)
+    try:
+        value = int(cleaned)
+    except ValueError:
+        number = float(cleaned)
+        if not number.is_integer():
+            raise
+        value = int(number)
+    if abs(value) > MAX_VALUE:
+        raise ValueError(f"{text} is too large")
+    return value
+
+
+def header_columns(row):
+    """
+    Work out which column holds each field from a header row
+
+    Args:
+        row (arr[str]): Header fields
+
+    Returns:
+        columns (dict): Field name to column index, None if this is not a header
+    """
+    names = [field.strip().lower() for field in row]
+    columns = {}
+    for field, aliases in HEADER_NAMES.items():
+        for index, name in enumerate(names):
+            if name in aliases:
+                columns[field] = index
+                break
+    if "time" not in columns or "b_blind" not in columns:
+        return None
+    return columns
+
+
+def sniff_dialect(sample):
+    """
+    Guess the delimiter of a structure file
+
+    Args:
+        sample (str): Start of the file
+
+    Returns:
+        dialect (csv.Dialect): Dialect to read the file with
+    """
+    try:
+        return csv.Sniffer().sniff(sample, delimiters=",\t;")
+    except csv.Error:
+        return csv.excel_tab if "\t" in sample else csv.excel
+
+
+def optional_field(row, columns, field):
+    """
+    Text of a column that may be missing from the file or the row
+
+    Args:
+        row (arr[str]): Fields of the line
+        columns (dict): Field name to column index
+        field (str): Field to read
+
+    Returns:
+        text (str): Field text, empty if missing
+    """
+    index = columns.get(field)
+    if index is None or index >= len(row):
+        return ""
+    return row[index]
+
+
+def parse_row(row, columns, count):
+    """
+    Parse one line, tolerating short rows and unusual number formats
+
+    Args:
+        row (arr[str]): Fields of the line
+        columns (dict): Field name to column index
+        count (int): Number of rounds parsed so far
+
+    Returns:
+        level (tuple): num, time, s_blind, b_blind, ante, is_break
+    """
+    if len(row) <= max(columns["time"], columns["b_blind"]):
+        raise ValueError("missing time or big blind")
+    try:
+        time = parse_int(row[columns["time"]])
+        b_blind = parse_int(row[columns["b_blind"]])
+        s_blind = parse_int(optional_field(row, columns, "s_blind") or "0")
+        ante = parse_int(optional_field(row, columns, "ante") or "0")
+        num = parse_int(optional_field(row, columns, "num") or str(count + 1))
+    except ValueError as e:
+        raise ValueError("values must be whole numbers") from e
+    if min(time, s_blind, b_blind, ante) < 0:
+        raise ValueError("values can not be negative")
+    is_break = optional_field(row, columns, "is_break").strip().lower()
+    return num, time, s_blind, b_blind, ante, is_break in TRUE_WORDS
+
+
+def read_rounds(f, report):
+    """
+    Parse rounds from a file one line at a time into report.rounds
+
+    Well formed lines take a fast path that appends straight to the schedule
+    columns, anything else is parsed by parse_row so odd lines cost extra
+    without slowing down the rest
+
+    Args:
+        f (file): Open text file
+        report (ImportReport): Collects the rounds, header flag and any errors
+
+    Returns:
+        None
+    """
+    sample = f.read(4096)
+    sample += f.readline()
+    reader = csv.reader(itertools.chain(io.StringIO(sample), f), sniff_dialect(sample))
+    append = report.rounds.append
+    columns = POSITIONS
+    width = num_i = time_i = s_blind_i = b_blind_i = ante_i = break_i = None
+    first = True
+    for row in reader:
+        if len(row) == width:
+            try:
+                num = int(row[num_i].translate(SEPARATORS))
+                time = int(row[time_i].translate(SEPARATORS))
+                s_blind = int(row[s_blind_i].translate(SEPARATORS))
+                b_blind = int(row[b_blind_i].translate(SEPARATORS))
+                ante = 0 if ante_i is None else int(row[ante_i].translate(SEPARATORS))
+            except ValueError:
+                pass
+            else:
+                if (
+                    min(time, s_blind, b_blind, ante) >= 0
+                    and max(abs(num), time, s_blind, b_blind, ante) <= MAX_VALUE
+                ):
+                    is_break = (
+                        break_i is not None
+                        and row[break_i].strip().lower() in TRUE_WORDS
+                    )
+                    append(num, time, s_blind, b_blind, ante, is_break)
+                    continue
+        if not "".join(row).strip():
+            continue
+        if first:
+            first = False
+            header = header_columns(row)
+            if header is not None:
+                report.has_header = True
+                columns = header
+                continue
+        try:
+            append(*parse_row(row, columns, len(report.rounds)))
+        except ValueError as e:
+            report.add_error(reader.line_num, str(e))
+            continue
+        if width is None and "num" in columns and "s_blind" in columns:
+            width = len(row)
+            num_i, time_i = columns["num"], columns["time"]
+            s_blind_i, b_blind_i = columns["s_blind"], columns["b_blind"]
+            ante_i = columns.get("ante")
+            ante_i = ante_i if ante_i is not None and ante_i < width else None
+            break_i = columns.get("is_break")
+            break_i = break_i if break_i is not None and break_i < width else None
+
+
+def import_structure(path):
+    """
+    Import a structure file
+
+    Args:
+        path (str): Path to a CSV or TSV file
+
+    Returns:
+        report (ImportReport): Parsed rounds and any errors
+    """
+    report = ImportReport()
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        read_rounds(f, report)
+    return report
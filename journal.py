@@ -0,0 +1,293 @@
+"""
+Crash safe session journal for Poker Time
+
+Every clock event except ticks is appended to a journal file by a background
+thread, with fsync batched to once per second. The schedule and clock are
+also saved in a snapshot every so often, after which the journal starts
+again, so resuming only ever reads one snapshot and a short journal tail.
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+from collections import namedtuple
+from pathlib import Path
+
+from schedule import COLUMNS, BlindSchedule
+
+SavedSession = namedtuple("SavedSession", ["rounds", "state"])
+STATE_KEYS = frozenset(
+    ("seq", "round_index", "remaining", "running", "expired", "completed", "wall")
+)
+
+
+class Journal:
+    """
+    Append-only record of a TournamentClock
+
+    Recording only puts an entry on a queue, all file work happens on the
+    writer thread so the tick path never waits for the disk
+    """
+
+    def __init__(self, folder, snapshot_every=100, sync_interval=1.0):
+        self.folder = Path(folder)
+        self.journal_path = self.folder / "journal.jsonl"
+        self.snapshot_path = self.folder / "snapshot.json"
+        self.snapshot_every = snapshot_every
+        self.sync_interval = sync_interval
+        self.queue = queue.SimpleQueue()
+        self.clock = None
+        self.seq = 0
+        self.since_snapshot = 0
+        self.thread = threading.Thread(target=self.write_loop, daemon=True)
+        self.thread.start()
+
+    def attach(self, tournament_clock):
+        """
+        Start recording a clock, replacing any clock recorded before
+
+        Args:
+            tournament_clock (TournamentClock): Clock to record
+
+        Returns:
+            None
+        """
+        if self.clock is not None:
+            self.clock.unsubscribe(self.on_clock_event)
+        self.clock = tournament_clock
+        tournament_clock.subscribe(self.on_clock_event)
+        self.save_snapshot("attach")
+
+    def entry(self, event):
+        """
+        Everything needed to put the clock back the way it is now
+
+        Args:
+            event (str): Clock event name
+
+        Returns:
+            entry (dict): Journal entry
+        """
+        self.seq += 1
+        return {
+            "seq": self.seq,
+            "event": event,
+            "round_index": self.clock.game_state.round_index,
+            "remaining": self.clock.countdown.remaining(),
+            "running": self.clock.is_running,
+            "expired": self.clock.is_expired,
+            "completed": self.clock.completed,
+            "wall": time.time(),
+        }
+
+    def on_clock_event(self, event, _state):
+        """
+        Clock subscriber, queues an entry or a snapshot
+
+        Args:
+            event (str): Clock event name
+            _state (ClockState): Unused, the clock is read directly
+
+        Returns:
+            None
+        """
+        if event == "tick":
+            return
+        if event == "schedule" or self.since_snapshot >= self.snapshot_every:
+            self.save_snapshot(event)
+        else:
+            self.since_snapshot += 1
+            self.queue.put(("entry", self.entry(event)))
+
+    def save_snapshot(self, event):
+        """
+        Queue a snapshot of the schedule and the clock
+
+        Args:
+            event (str): Clock event that caused the snapshot
+
+        Returns:
+            None
+        """
+        self.since_snapshot = 0
+        self.queue.put(
+            ("snapshot", (self.entry(event), self.clock.game_state.rounds.copy()))
+        )
+
+    def write_loop(self):
+        """
+        Writer thread, keeps a journal file open until it has to start again
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.folder.mkdir(parents=True, exist_ok=True)
+        mode = "a"
+        while True:
+            with open(self.journal_path, mode, encoding="utf-8") as f:
+                if not self.append_entries(f):
+                    return
+            mode = "w"
+
+    def append_entries(self, f):
+        """
+        Append queued entries to the journal, syncing at most once per interval
+
+        Args:
+            f (file): Open journal file
+
+        Returns:
+            more (bool): True after a snapshot or clear, when the journal
+                should start again, False once the journal is closed
+        """
+        dirty = False
+        last_sync = time.monotonic()
+        while True:
+            try:
+                kind, data = self.queue.get(timeout=self.sync_interval)
+            except queue.Empty:
+                kind, data = None, None
+            if kind == "entry":
+                f.write(json.dumps(data, separators=(",", ":")) + "\n")
+                dirty = True
+            elif kind == "snapshot":
+                self.write_snapshot(*data)
+                return True
+            elif kind == "clear":
+                self.snapshot_path.unlink(missing_ok=True)
+                return True
+            if dirty and (
+                kind in (None, "close")
+                or time.monotonic() - last_sync >= self.sync_interval
+            ):
+                f.flush()
+                os.fsync(f.fileno())
+                dirty = False
+                last_sync = time.monotonic()
+            if kind == "close":
+                return False
+
+    def write_snapshot(self, entry, rounds):
+        """
+        Write a snapshot atomically
+
+        Args:
+            entry (dict): Clock entry
+            rounds (BlindSchedule): Copy of the schedule
+
+        Returns:
+            None
+        """
+        data = {
+            "state": entry,
+            "rounds": {
+                name: getattr(rounds, name).tolist() for name in COLUMNS.values()
+            },
+        }
+        partial = self.snapshot_path.with_suffix(".tmp")
+        with open(partial, "w", encoding="utf-8") as f:
+            json.dump(data, f, separators=(",", ":"))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(partial, self.snapshot_path)
+
+    def close(self):
+        """
+        Flush everything to disk and stop the writer thread
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self.thread.is_alive():
+            self.queue.put(("close", None))
+            self.thread.join(timeout=5)
+
+    def clear(self):
+        """
+        Forget the saved session
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.queue.put(("clear", None))
+
+
+def load_session(folder):
+    """
+    Rebuild the last session from its snapshot and journal tail
+
+    A snapshot that is missing or does not have the expected shape counts as
+    no session, and the journal is read up to its first bad line
+
+    Args:
+        folder (str): Journal folder
+
+    Returns:
+        session (SavedSession|None): Saved rounds and clock state, None if there is none
+    """
+    folder = Path(folder)
+    try:
+        with open(folder / "snapshot.json", "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+        state = snapshot["state"]
+        columns = snapshot["rounds"]
+        rounds = BlindSchedule.from_columns(
+            *(columns[name] for name in COLUMNS.values())
+        )
+        if not STATE_KEYS <= state.keys():
+            return None
+    except (OSError, ValueError, KeyError, TypeError, AttributeError, OverflowError):
+        return None
+    try:
+        with open(folder / "journal.jsonl", "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    break
+                if not isinstance(entry, dict) or not STATE_KEYS <= entry.keys():
+                    break
+                if entry["seq"] > state["seq"]:
+                    state = entry
+    except OSError:
+        pass
+    if not rounds:
+        return None
+    return SavedSession(rounds, state)
+
+
+def resume(tournament_clock, state, now=None):
+    """
+    Put a clock back where a saved session left it
+
+    A clock that was running has the time since it was saved taken off
+
+    Args:
+        tournament_clock (TournamentClock): Clock to restore
+        state (dict): Saved clock state
+        now (float, optional): Current time.time(), read if not given
+
+    Returns:
+        None
+    """
+    now = time.time() if now is None else now
+    remaining = state["remaining"]
+    if state["running"]:
+        remaining -= max(0.0, now - state["wall"])
+    tournament_clock.restore(
+        state["round_index"],
+        max(0.0, remaining),
+        state["running"] or state["expired"],
+        state["completed"],
+    )
@@ -0,0 +1,520 @@
+"""
+LAN clock synchronization for Poker Time
+
+One instance is the authority and any number of followers copy its clock
+over UDP. Every reply from the authority carries its level deadline on its
+own monotonic clock, and followers work out how far their monotonic clock
+is from the authority's the way NTP does:
+
+    offset = ((t1 - t0) + (t2 - t3)) / 2
+    delay = (t3 - t0) - (t2 - t1)
+
+t0 and t3 are when the follower sent the request and got the reply, t1 and
+t2 when the authority got it and answered. Of the last few samples the one
+with the smallest delay is trusted, since queuing only ever adds delay and
+the fastest round trip is the most symmetric one.
+
+Followers then count down to the authority's deadline moved onto their own
+clock, instead of their own ticks, so every display changes at the same
+moment. The authority also pushes its state as soon as it changes, so a
+pause or a new level shows up everywhere within one network hop.
+
+Followers have to be running the same game as the authority, only the level
+index is sent. The authority only answers followers on private network
+addresses, and at most MAX_FOLLOWERS of them at a time.
+"""
+
+import collections
+import ipaddress
+import socket
+import struct
+import threading
+import time
+
+DEFAULT_PORT = 8767
+MAGIC = b"PKSY"
+PING = 1
+STATE = 2
+PING_PACKET = struct.Struct("<4sBq")
+STATE_PACKET = struct.Struct("<4sBqqqQiqqdBB")
+PING_INTERVAL = 0.5
+FAST_PINGS = 8
+FAST_INTERVAL = 0.05
+FILTER_SAMPLES = 8
+FOLLOWER_TIMEOUT = 10.0
+MAX_FOLLOWERS = 256
+TOLERANCE = 0.002
+POLL_MS = 10
+
+Snapshot = collections.namedtuple(
+    "Snapshot",
+    [
+        "sequence",
+        "round_index",
+        "deadline_ns",
+        "remaining_ns",
+        "completed",
+        "running",
+        "expired",
+    ],
+)
+
+
+def parse_sync(text):
+    """
+    Read the sync setting, "serve" or "serve:port" for the authority and
+    "host" or "host:port" to follow one
+
+    Args:
+        text (str): Setting text
+
+    Returns:
+        role (str): "authority" or "follower"
+        address (tuple): Address to listen on or to follow
+    """
+    host, _, port = text.strip().partition(":")
+    port = int(port) if port else DEFAULT_PORT
+    if host == "serve":
+        return "authority", ("0.0.0.0", port)
+    return "follower", (host, port)
+
+
+def is_lan_address(host):
+    """
+    Whether an address is on a private network, loopback or link local
+
+    Args:
+        host (str): IP address
+
+    Returns:
+        private (bool): True if followers there are answered
+    """
+    try:
+        return ipaddress.ip_address(host).is_private
+    except ValueError:
+        return False
+
+
+def to_ns(seconds):
+    """
+    Clock seconds as whole nanoseconds for the wire
+
+    Args:
+        seconds (float): Time on a monotonic clock in seconds
+
+    Returns:
+        nanoseconds (int): The same time in nanoseconds
+    """
+    return round(seconds * 1e9)
+
+
+class SyncAuthority:
+    """
+    Answers followers with the state of a TournamentClock and pushes changes
+
+    attach() has to be called from the thread that owns the clock, the
+    socket is read on a background thread that only reads the last snapshot
+    """
+
+    def __init__(self, address=("0.0.0.0", DEFAULT_PORT), clock=time.monotonic):
+        self.address = address
+        self.clock = clock
+        self.tournament_clock = None
+        self.sequence = time.time_ns()
+        self.snapshot = None
+        self.followers = {}
+        self.sock = None
+
+    def start(self):
+        """
+        Open the socket and answer followers on a background thread
+
+        Args:
+            None
+
+        Returns:
+            address (tuple): Address actually listened on
+        """
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.bind(self.address)
+        self.address = self.sock.getsockname()
+        threading.Thread(target=self.serve_loop, daemon=True).start()
+        return self.address
+
+    def attach(self, tournament_clock):
+        """
+        Start sharing a clock, replacing any clock shared before
+
+        Args:
+            tournament_clock (TournamentClock): Clock to share
+
+        Returns:
+            None
+        """
+        if self.tournament_clock is not None:
+            self.tournament_clock.unsubscribe(self.on_clock_event)
+        self.tournament_clock = tournament_clock
+        tournament_clock.subscribe(self.on_clock_event)
+        self.on_clock_event("attach", tournament_clock.state)
+
+    def on_clock_event(self, event, _state):
+        """
+        Clock subscriber, takes a new snapshot and pushes it on every change
+
+        Ticks are skipped, they never move the deadline
+
+        Args:
+            event (str): Clock event name
+            _state (ClockState): Unused, the countdown is read directly
+
+        Returns:
+            None
+        """
+        if event == "tick":
+            return
+        tournament_clock = self.tournament_clock
+        countdown = tournament_clock.countdown
+        self.sequence += 1
+        self.snapshot = Snapshot(
+            self.sequence,
+            tournament_clock.game_state.round_index,
+            0 if countdown.deadline is None else to_ns(countdown.deadline),
+            to_ns(countdown.remaining()),
+            tournament_clock.completed,
+            tournament_clock.is_running,
+            tournament_clock.is_expired,
+        )
+        self.push()
+
+    def pack(self, t0, t1):
+        """
+        State packet for the current snapshot
+
+        Args:
+            t0 (int): Follower send time to echo, 0 for a push
+            t1 (int): Time the request arrived, 0 for a push
+
+        Returns:
+            packet (bytes): Packet to send
+        """
+        return STATE_PACKET.pack(
+            MAGIC, STATE, t0, t1, to_ns(self.clock()), *self.snapshot
+        )
+
+    def prune(self, now):
+        """
+        Forget followers not heard from for FOLLOWER_TIMEOUT
+
+        Args:
+            now (float): Current time on the authority's clock
+
+        Returns:
+            None
+        """
+        for address, seen in list(self.followers.items()):
+            if now - seen > FOLLOWER_TIMEOUT:
+                self.followers.pop(address, None)
+
+    def admit(self, address, now):
+        """
+        Note a ping from a follower, if it may follow
+
+        Args:
+            address (tuple): Follower address
+            now (float): Current time on the authority's clock
+
+        Returns:
+            admitted (bool): True if the ping should be answered
+        """
+        if address not in self.followers:
+            if not is_lan_address(address[0]):
+                return False
+            self.prune(now)
+            if len(self.followers) >= MAX_FOLLOWERS:
+                return False
+        self.followers[address] = now
+        return True
+
+    def push(self):
+        """
+        Send the snapshot to every follower heard from recently
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self.sock is None:
+            return
+        self.prune(self.clock())
+        for address in list(self.followers):
+            try:
+                self.sock.sendto(self.pack(0, 0), address)
+            except OSError:
+                pass
+
+    def serve_loop(self):
+        """
+        Answer every ping from an admitted follower with the time it
+        arrived, the time of the answer and the snapshot
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        sock = self.sock
+        while True:
+            try:
+                data, address = sock.recvfrom(64)
+            except OSError:
+                return
+            t1 = to_ns(self.clock())
+            if len(data) != PING_PACKET.size or self.snapshot is None:
+                continue
+            magic, kind, t0 = PING_PACKET.unpack(data)
+            if magic != MAGIC or kind != PING:
+                continue
+            if not self.admit(address, self.clock()):
+                continue
+            try:
+                sock.sendto(self.pack(t0, t1), address)
+            except OSError:
+                pass
+
+    def close(self):
+        """
+        Stop sharing
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self.tournament_clock is not None:
+            self.tournament_clock.unsubscribe(self.on_clock_event)
+        if self.sock is not None:
+            self.sock.close()
+
+
+class SyncFollower:
+    """
+    Keeps a TournamentClock on the deadline of an authority
+
+    The socket is read on background threads that only store the latest
+    offset and snapshot, poll() applies them and has to be called from the
+    thread that owns the clock, attach_loop() does that from a Tk event loop
+    """
+
+    def __init__(self, address, clock=time.monotonic):
+        self.address = address
+        self.clock = clock
+        self.tournament_clock = None
+        self.samples = collections.deque(maxlen=FILTER_SAMPLES)
+        self.offset_ns = None
+        self.delay_ns = None
+        self.snapshot = None
+        self.applied = None
+        self.sock = None
+        self.stopped = threading.Event()
+        self.root = None
+        self.after_id = None
+
+    def start(self):
+        """
+        Start pinging the authority and reading its answers
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.sock.connect(self.address)
+        threading.Thread(target=self.receive_loop, daemon=True).start()
+        threading.Thread(target=self.ping_loop, daemon=True).start()
+
+    def attach(self, tournament_clock):
+        """
+        Follow with a clock, replacing any clock followed before
+
+        Args:
+            tournament_clock (TournamentClock): Clock to keep in step
+
+        Returns:
+            None
+        """
+        self.tournament_clock = tournament_clock
+        self.applied = None
+
+    def ping_loop(self):
+        """
+        Ping quickly until the filter is full, then every PING_INTERVAL
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        sock = self.sock
+        sent = 0
+        while not self.stopped.is_set():
+            try:
+                sock.send(PING_PACKET.pack(MAGIC, PING, to_ns(self.clock())))
+            except OSError:
+                pass
+            sent += 1
+            self.stopped.wait(FAST_INTERVAL if sent < FAST_PINGS else PING_INTERVAL)
+
+    def receive_loop(self):
+        """
+        Take a time sample from every answer and keep the newest snapshot
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        sock = self.sock
+        while True:
+            try:
+                data = sock.recv(128)
+            except OSError:
+                if self.stopped.is_set():
+                    return
+                continue
+            t3 = to_ns(self.clock())
+            if len(data) != STATE_PACKET.size:
+                continue
+            magic, kind, t0, t1, t2, *values = STATE_PACKET.unpack(data)
+            if magic != MAGIC or kind != STATE:
+                continue
+            if t0:
+                self.add_sample(t0, t1, t2, t3)
+            snapshot = Snapshot(*values)
+            if self.snapshot is None or snapshot.sequence >= self.snapshot.sequence:
+                self.snapshot = snapshot
+
+    def add_sample(self, t0, t1, t2, t3):
+        """
+        Record one round trip and pick the offset of the fastest recent one
+
+        Args:
+            t0 (int): Follower send time
+            t1 (int): Authority receive time
+            t2 (int): Authority send time
+            t3 (int): Follower receive time
+
+        Returns:
+            None
+        """
+        delay = (t3 - t0) - (t2 - t1)
+        offset = ((t1 - t0) + (t2 - t3)) // 2
+        self.samples.append((delay, offset))
+        self.delay_ns, self.offset_ns = min(self.samples)
+
+    def target(self, snapshot, offset_ns):
+        """
+        Time the followed level should have left, on this machine's clock
+
+        Args:
+            snapshot (Snapshot): Authority state
+            offset_ns (int): Authority clock minus this clock
+
+        Returns:
+            remaining (float): Seconds left
+        """
+        if not snapshot.running:
+            return snapshot.remaining_ns / 1e9
+        deadline = (snapshot.deadline_ns - offset_ns) / 1e9
+        return max(0.0, deadline - self.clock())
+
+    def poll(self):
+        """
+        Bring the clock in line with the latest snapshot
+
+        A new snapshot is restored, a drifting deadline is moved once it is
+        off by more than TOLERANCE. The move goes straight to the countdown
+        so it emits no clock event, subscribers only see the ticks
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        snapshot, offset_ns = self.snapshot, self.offset_ns
+        tournament_clock = self.tournament_clock
+        if snapshot is None or offset_ns is None or tournament_clock is None:
+            return
+        remaining = self.target(snapshot, offset_ns)
+        if snapshot.sequence != self.applied:
+            self.applied = snapshot.sequence
+            if (
+                snapshot.expired
+                and tournament_clock.is_expired
+                and snapshot.round_index == tournament_clock.game_state.round_index
+            ):
+                return
+            tournament_clock.restore(
+                snapshot.round_index,
+                remaining,
+                snapshot.running or snapshot.expired,
+                snapshot.completed,
+            )
+            if snapshot.expired:
+                tournament_clock.update()
+            return
+        if snapshot.running and tournament_clock.is_running:
+            error = remaining - tournament_clock.countdown.remaining()
+            if abs(error) > TOLERANCE:
+                tournament_clock.countdown.add(error)
+
+    def attach_loop(self, root):
+        """
+        Poll from a Tk event loop every POLL_MS
+
+        Args:
+            root (tk.Tk): Tk root window
+
+        Returns:
+            None
+        """
+        self.root = root
+        self.on_after()
+
+    def on_after(self):
+        """
+        Tk after() callback, polls and schedules the next poll
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.poll()
+        self.after_id = self.root.after(POLL_MS, self.on_after)
+
+    def close(self):
+        """
+        Stop following
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.stopped.set()
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+        if self.sock is not None:
+            self.sock.close()
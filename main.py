@@ -2,16 +2,41 @@
 Poker Time is a simple timer application built for poker tournaments.
 """
 
-import sys
+import atexit
+import hashlib
+import io
+import multiprocessing
 import os
-import math
-import csv
+import queue
+import sys
+import threading
 import tkinter as tk
-from tkinter import filedialog
+from datetime import datetime
 from pathlib import Path
-from PIL import Image, ImageTk
+from tkinter import filedialog, messagebox, simpledialog
+
+from clock import Countdown, base_state, parse_clock_time, state_text
+from history import History
+from importer import import_structure, parse_int
+from journal import Journal, load_session, resume
+from lansync import SyncAuthority, SyncFollower, parse_sync
+from remote import RemoteControl, parse_address
+from schedule import MAX_VALUE, BlindSchedule
+from scheduler import ClockScheduler
+from seating import Seating
+from sharedstate import StatePublisher
+from tracker import Tracker
 
 BG_COLOR = "#0B6623"
+MAX_TABLE_MOVES = 50
+ROUND_FIELDS = ("num", "time", "s_blind", "b_blind", "ante")
+STATE_COLORS = {
+    "normal": (BG_COLOR, "black"),
+    "alert_on": ("black", "black"),
+    "alert_off": ("white", "white"),
+    "break": ("#1B3F8B", "black"),
+    "final_minute": ("#8B1A1A", "black"),
+}
 
 
 def resource_path(relative_path):
@@ -29,6 +54,156 @@ def resource_path(relative_path):
     return os.path.join(os.path.abspath("."), relative_path)
 
 
+def set_entry_text(entry, value):
+    """
+    Set the text of an entry only if it differs from what is shown
+
+    Args:
+        entry (tk.Entry): Entry to update
+        value (int|str): Value to show
+
+    Returns:
+        changed (bool): True if the entry was rewritten
+    """
+    text = str(value)
+    if entry.get() == text:
+        return False
+    entry.delete(0, tk.END)
+    entry.insert(tk.END, text)
+    return True
+
+
+def parse_table_text(text):
+    """
+    Split text copied from a spreadsheet into rows of cells
+
+    Args:
+        text (str): Tab separated cells, one row per line
+
+    Returns:
+        rows (arr[arr[str]]): Cell text by row
+    """
+    return [
+        [cell.strip() for cell in line.split("\t")]
+        for line in text.rstrip("\r\n").splitlines()
+    ]
+
+
+def parse_stack_line(line):
+    """
+    Split a line of the deal calculator into a name and a chip count
+
+    The name ends at a tab or the first colon, otherwise the chips are the
+    last word, so "Alice: 1,000", "Alice\t1,000", "Alice, 1,000" and
+    "1,000" all read the way they look
+
+    Args:
+        line (str): One player
+
+    Returns:
+        stack (tuple): Name, empty if not given, and chips
+    """
+    if "\t" in line:
+        name, _, chips = line.strip().rpartition("\t")
+    elif ":" in line:
+        name, _, chips = line.partition(":")
+    else:
+        name, _, chips = line.strip().rpartition(" ")
+    return name.strip().rstrip(",").strip(), parse_int(chips)
+
+
+def fill_series(start, step, count, every=1):
+    """
+    Values for a run of levels, the same value, adding or multiplying by a
+    step every few levels
+
+    Args:
+        start (float): First value
+        step (str): Blank for the same value, "+25" or "-25" to add, "x2" to
+            multiply
+        count (int): Number of values
+        every (int, optional): Levels between steps
+
+    Returns:
+        values (arr[int]): Values rounded to whole numbers, ValueError if one
+            does not fit a schedule column
+    """
+    step = step.replace(" ", "").lower()
+    if step[:1] in ("x", "*"):
+        factor, delta = float(step[1:]), 0.0
+    else:
+        factor, delta = 1.0, float(step.translate({ord(","): None}) or 0)
+    if every < 1:
+        raise ValueError(every)
+    values = []
+    value = float(start)
+    for index in range(count):
+        if index and index % every == 0:
+            value = value * factor + delta
+        if not abs(value) <= MAX_VALUE:
+            raise ValueError(value)
+        values.append(round(value))
+    return values
+
+
+def cache_dir():
+    """
+    Folder for files Poker Time can rebuild if they are deleted
+
+    Args:
+        None
+
+    Returns:
+        path (Path): Cache folder, POKER_TIME_CACHE_DIR if set
+    """
+    if os.environ.get("POKER_TIME_CACHE_DIR"):
+        return Path(os.environ["POKER_TIME_CACHE_DIR"])
+    return Path(os.environ.get("LOCALAPPDATA") or Path.home() / ".cache") / "PokerTime"
+
+
+def session_dir():
+    """
+    Folder holding the journal of the running game
+
+    Args:
+        None
+
+    Returns:
+        path (Path): Session folder, POKER_TIME_SESSION_DIR if set
+    """
+    if os.environ.get("POKER_TIME_SESSION_DIR"):
+        return Path(os.environ["POKER_TIME_SESSION_DIR"])
+    return Path.home() / "Documents" / "PokerTime" / "session"
+
+
+def scaled_image_path(source, size):
+    """
+    Path of a PNG copy of an image scaled to size, made on first use
+
+    Cached copies are keyed by the hash of the source file and the size, so
+    later launches load them with Tk directly and never import PIL.
+    Does not touch Tk so it is safe to call from a worker thread.
+
+    Args:
+        source (str): Path of the source image
+        size (tuple): Width and height in pixels
+
+    Returns:
+        path (Path): Path of the scaled PNG
+    """
+    data = Path(source).read_bytes()
+    digest = hashlib.sha256(data).hexdigest()[:16]
+    cached = cache_dir() / f"{Path(source).stem}_{digest}_{size[0]}x{size[1]}.png"
+    if not cached.exists():
+        from PIL import Image  # pylint: disable=import-outside-toplevel
+
+        cached.parent.mkdir(parents=True, exist_ok=True)
+        partial = cached.with_suffix(f".{threading.get_ident()}.tmp")
+        Image.open(io.BytesIO(data)).resize(size).save(partial, "PNG")
+        os.replace(partial, cached)
+    return cached
+
+
 class PokerTime:
     """
     Main Function
@@ -41,27 +216,186 @@ class PokerTime:
         self.root.title("Poker Time")
         self.root.geometry("1200x900")
         self.root.configure(bg=BG_COLOR)
+        self.scheduler = ClockScheduler()
+        self.scheduler.attach(self.root)
         self.is_landing_page = True
         self.rounds = None
+        self.history = History()
+        saved = load_session(session_dir())
+        self.journal = Journal(session_dir())
+        atexit.register(self.journal.close)
+        self.remote = None
+        if os.environ.get("POKER_TIME_REMOTE") is not None:
+            self.start_remote(os.environ["POKER_TIME_REMOTE"])
+        self.sync = None
+        if os.environ.get("POKER_TIME_SYNC"):
+            role, address = parse_sync(os.environ["POKER_TIME_SYNC"])
+            if role == "authority":
+                self.sync = SyncAuthority(address)
+            else:
+                self.sync = SyncFollower(address)
+                self.sync.attach_loop(self.root)
+            self.sync.start()
+            atexit.register(self.sync.close)
+        self.shared = None
+        if os.environ.get("POKER_TIME_SHARED") is not None:
+            path = os.environ["POKER_TIME_SHARED"]
+            self.shared = StatePublisher(None if path in ("", "1") else path)
+            atexit.register(self.shared.close)
+        self.metrics = None
+        if os.environ.get("POKER_TIME_METRICS") is not None:
+            self.start_metrics(os.environ["POKER_TIME_METRICS"])
         self.landing_page = LandingPage(self)
+        if os.environ.get("POKER_TIME_STARTUP_BENCH"):
+            self.root.after_idle(self.report_first_frame)
+        elif saved is not None:
+            self.root.after_idle(self.offer_resume, saved)
         self.root.mainloop()
 
+    def offer_resume(self, saved):
+        """
+        Ask to carry on with the game from the last session
+
+        Args:
+            saved (SavedSession): Saved rounds and clock state
+
+        Returns:
+            None
+        """
+        if not messagebox.askyesno(
+            "Resume Game", "Poker Time was closed during a game. Resume it?"
+        ):
+            self.journal.clear()
+            return
+        self.rounds = saved.rounds
+        game_page = GamePage(self)
+        resume(game_page.clock, saved.state)
+
+    def start_remote(self, address):
+        """
+        Listen for remote control commands
+
+        Args:
+            address (str): POKER_TIME_REMOTE, a socket path or host:port
+
+        Returns:
+            None
+        """
+        try:
+            self.remote = RemoteControl(
+                parse_address(address),
+                token=os.environ.get("POKER_TIME_REMOTE_TOKEN") or None,
+            )
+            self.remote.start()
+        except (OSError, ValueError) as e:
+            self.remote = None
+            messagebox.showwarning("Remote Control", f"Remote control is off: {e}")
+            return
+        self.remote.attach(self.root)
+        if self.remote.token and not os.environ.get("POKER_TIME_REMOTE_TOKEN"):
+            messagebox.showinfo(
+                "Remote Control",
+                f"Clients must send this line first:\n\nauth {self.remote.token}",
+            )
+
+    def start_metrics(self, port):
+        """
+        Turn on timing instrumentation, its /metrics endpoint and the F12
+        debug overlay
+
+        Args:
+            port (str): Port for the endpoint, "1" for the default port
+
+        Returns:
+            None
+        """
+        import metrics  # pylint: disable=import-outside-toplevel
+
+        self.metrics = metrics.Metrics()
+        metrics.instrument_ticks(self.metrics, Countdown)
+        metrics.instrument_callbacks(
+            self.metrics,
+            {
+                "countdown": (GamePage, "on_clock_event"),
+                "flash": (VisualStates, "apply"),
+                "editor_refresh": (EditorPage, "refresh_editor"),
+                "table_render": (VirtualTable, "render"),
+                "scheduler": (ClockScheduler, "run_due"),
+            },
+        )
+        metrics.probe_loop(self.metrics, self.root)
+        metrics.serve(
+            self.metrics, metrics.DEFAULT_PORT if port in ("", "1") else int(port)
+        )
+        overlay = DebugOverlay(self.root, self.metrics)
+        self.root.bind_all("<F12>", lambda event: overlay.toggle())
+
+    def report_first_frame(self):
+        """
+        Print when the first frame has been drawn and quit, used by
+        benchmarks/startup.py
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.root.update_idletasks()
+        print("first frame", flush=True)
+        self.root.after(int(os.environ["POKER_TIME_STARTUP_BENCH"]), self.root.destroy)
 
-class Round:
-    """
-    Round object
 
-    Games will be stored as an array of round objects
+class DebugOverlay:
     """
+    Timing stats drawn over the bottom left of the main window
+    """
+
+    def __init__(self, root, registry):
+        self.root = root
+        self.registry = registry
+        self.label = None
+
+    def toggle(self):
+        """
+        Show or hide the overlay
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self.label is not None and self.label.winfo_exists():
+            self.label.destroy()
+            self.label = None
+            return
+        self.label = tk.Label(
+            self.root,
+            bg="black",
+            fg="#00FF00",
+            justify="left",
+            font=("Courier", 10),
+        )
+        self.label.place(relx=0, rely=1, anchor="sw")
+        self.refresh()
+
+    def refresh(self):
+        """
+        Redraw the stats every half second while shown
 
-    def __init__(self, num, time=0, s_blind=0, b_blind=0):
-        self.num = num
-        self.time = time
-        self.s_blind = s_blind
-        self.b_blind = b_blind
+        Args:
+            None
 
-    def __str__(self):
-        return f"Round: {self.num}\nTime: {self.time}\nSmall Blind: {self.s_blind}\nBig Blind: {self.b_blind}"
+        Returns:
+            None
+        """
+        if self.label is None or not self.label.winfo_exists():
+            self.label = None
+            return
+        self.label.configure(text=self.registry.summary() or "No measurements yet")
+        self.label.lift()
+        self.root.after(500, self.refresh)
 
 
 class LandingPage:
@@ -94,12 +428,10 @@ class LandingPage:
         )
         title.pack(fill="both", expand=True, padx=10, pady=10)
 
-        image_path = resource_path("assets/landing_page_img.jpg")
-        image_file = Image.open(image_path).resize((800, 500))
-        image = ImageTk.PhotoImage(image_file)
-        stock_image = tk.Label(image_frame, image=image)
-        stock_image.image = image
-        stock_image.pack(expand=True)
+        self.stock_image = tk.Label(image_frame, bg=BG_COLOR)
+        self.stock_image.pack(expand=True)
+        self.image_queue = queue.SimpleQueue()
+        self.root.after_idle(self.load_image)
 
         new_game_button = tk.Button(
             button_frame,
@@ -114,6 +446,53 @@ class LandingPage:
         )
         new_game_button.pack(fill="both", expand=True, padx=10, pady=10)
 
+    def load_image(self):
+        """
+        Start preparing the landing image once the window is on screen
+
+        The scaled image is made on a worker thread and handed back through
+        a queue since Tk may only be used from the main thread
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+
+        def prepare():
+            try:
+                path = scaled_image_path(
+                    resource_path("assets/landing_page_img.jpg"), (800, 500)
+                )
+            except (OSError, ImportError):
+                path = None
+            self.image_queue.put(path)
+
+        threading.Thread(target=prepare, daemon=True).start()
+        self.show_image()
+
+    def show_image(self):
+        """
+        Show the landing image when the worker thread has finished
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        try:
+            path = self.image_queue.get_nowait()
+        except queue.Empty:
+            self.root.after(20, self.show_image)
+            return
+        if path is None or not self.stock_image.winfo_exists():
+            return
+        image = tk.PhotoImage(file=str(path))
+        self.stock_image.configure(image=image)
+        self.stock_image.image = image
+
     def destroy(self):
         """
         Destroy the landing page once a game is started
@@ -149,91 +528,40 @@ class MenuBar:
         )
         option_menu.add_command(
             label="Game Overview",
-            command=lambda: GameOverview(self.root, game_page.game_state.rounds),
+            command=lambda: GameOverview(
+                self.root, game_page.game_state.rounds, game_page.clock
+            ),
+        )
+        option_menu.add_command(
+            label="Players", command=lambda: PlayersWindow(game_page)
+        )
+        option_menu.add_command(label="Tables", command=game_page.show_tables)
+        option_menu.add_command(
+            label="Deal Calculator", command=lambda: DealCalculator(self.root)
         )
+        option_menu.add_command(label="Jump To Time", command=game_page.jump_to_time)
         option_menu.add_command(label="Restart Game", command=game_page.restart_game)
+        option_menu.add_command(label="New Table", command=game_page.new_table)
         option_menu.add_command(label="Exit", command=sys.exit)
 
 
-class GameState:
-    """
-    Keeps track of what round it is and the blinds
-    Use for reference in other classes so there is no mixup
-    """
-
-    def __init__(self, rounds):
-        self.rounds = rounds
-        self.round_index = 0
-        self.round_num = self.rounds[self.round_index].num
-        self.time = self.rounds[self.round_index].time
-        self.s_blind = self.rounds[self.round_index].s_blind
-        self.b_blind = self.rounds[self.round_index].b_blind
-
-    def next_round(self):
-        """
-        Increment round counter and update values
-
-        Args:
-            None
-
-        Returns:
-            None
-        """
-        if len(self.rounds) > self.round_index + 1:
-            self.round_index += 1
-        self.round_num = self.rounds[self.round_index].num
-        self.time = self.rounds[self.round_index].time
-        self.s_blind = self.rounds[self.round_index].s_blind
-        self.b_blind = self.rounds[self.round_index].b_blind
-
-    def restart_game(self):
-        """
-        Set round counter to zero and update values
-
-        Args:
-            None
-
-        Returns:
-            None
-        """
-        self.round_index = 0
-        self.round_num = self.rounds[self.round_index].num
-        self.time = self.rounds[self.round_index].time
-        self.s_blind = self.rounds[self.round_index].s_blind
-        self.b_blind = self.rounds[self.round_index].b_blind
-
-    def update_rounds(self, rounds):
-        """
-        Update round values when a change is made in the game editor
-
-        Args:
-            rounds (arr[Round]): New rounds to be applied to the GameState instance
-
-        Returns:
-            None
-        """
-        self.rounds = rounds
-        self.round_index = min(self.round_index, len(rounds) - 1)
-        self.round_num = self.rounds[self.round_index].num
-        self.time = self.rounds[self.round_index].time
-        self.s_blind = self.rounds[self.round_index].s_blind
-        self.b_blind = self.rounds[self.round_index].b_blind
-
-
 class Timer:
     """
     Timer object
 
-    Handles start/stop formatting and other logic
+    Shows the time of the game page's TournamentClock
+    Ticks are driven by the shared ClockScheduler, never counted
+    Clock strings are built once and reused, and the label is only updated
+    when its text changes
     """
 
     def __init__(self, container, game_page):
         self.root = game_page.root
         self.game_page = game_page
+        self.clock = game_page.clock
 
-        self.is_paused = True
-        self.time_remaining = game_page.game_state.time * 60
-        self.time_var = tk.StringVar(value=self.format_time(self.time_remaining))
+        self.text = state_text(self.clock.state)
+        self.time_var = tk.StringVar(value=self.text)
         self.timer_label = tk.Label(
             container,
             textvariable=self.time_var,
@@ -256,64 +584,34 @@ class Timer:
         Returns:
             None
         """
-        if self.is_paused:
-            self.unpause()
-            self.game_page.timer_button.set_text("Pause Timer")
-            self.countdown()
-        elif self.time_remaining == 0:
-            self.pause()
-            self.game_page.stop_flashing()
-            self.time_remaining = self.game_page.game_state.time * 60
-            self.time_var.set(self.format_time(self.time_remaining))
-            self.game_page.timer_button.set_text("Start Timer")
-        else:
-            self.pause()
-            self.game_page.timer_button.set_text("Resume Timer")
-
-    def pause(self):
-        """Pause timer"""
-        self.is_paused = True
+        self.clock.toggle()
 
-    def unpause(self):
-        """Unpause timer"""
-        self.is_paused = False
-
-    def countdown(self):
+    def drift_corrected(self):
         """
-        Timer countdown
+        Total event loop lag absorbed by the deadline so far
 
         Args:
             None
 
         Returns:
-            None
+            drift (float): Seconds a tick counting timer would have fallen behind
         """
-        if self.time_remaining > 0 and not self.is_paused:
-            self.time_var.set(self.format_time(self.time_remaining))
-            self.time_remaining -= 1
-            self.root.after(1000, self.countdown)
-        elif self.is_paused:
-            pass
-        else:
-            self.time_var.set("0:00")
-            self.game_page.timer_button.set_text("Reset Timer")
-            self.game_page.flash_screen()
+        return self.clock.countdown.drift_corrected
 
-    def format_time(self, time):
+    def show(self, state):
         """
-        Format time for reable display
+        Show the time of a state, leaving the label alone if the text is the same
 
         Args:
-            time (int): Time in seconds
+            state (ClockState): Clock state
 
         Returns:
-            time (str): Time in a readable clock format mm:ss
+            None
         """
-        mins = time / 60
-        secs = time % 60
-        if secs < 10:
-            secs = "0" + str(secs)
-        return f"{math.floor(mins)}:{secs}"
+        text = state_text(state)
+        if text != self.text:
+            self.text = text
+            self.time_var.set(text)
 
 
 class TimerButton:
@@ -349,178 +647,379 @@ class TimerButton:
         self.timer_button_text.set(value=text)
 
 
-class GamePage:
-    """
-    Main game page
+class VisualStates:
     """
+    Named looks for a group of widgets
 
-    def __init__(self, poker_time):
-        self.root = poker_time.root
-
-        if poker_time.rounds is not None:
-            poker_time.landing_page.destroy()
-            poker_time.is_landing_page = False
-
-        if not poker_time.is_landing_page:
-            self.game_state = GameState(poker_time.rounds)
-
-            self.round_num = tk.StringVar(value=f"Round: {self.game_state.round_num}")
-            self.s_blind = tk.StringVar(
-                value=f"Small Blind: {self.game_state.s_blind:,}"
-            )
-            self.b_blind = tk.StringVar(value=f"Big Blind: {self.game_state.b_blind:,}")
-
-            MenuBar(self)
-            self.root.columnconfigure((0, 1, 2), weight=1)
-            self.root.rowconfigure((0, 1, 2, 3), weight=1)
-
-            self.round_frame = tk.Frame(self.root, bg=BG_COLOR)
-            self.round_frame.grid(row=0, column=0, columnspan=3, sticky="NESW")
-            self.button_frame = tk.Frame(self.root, bg=BG_COLOR)
-            self.button_frame.grid(row=1, column=2, rowspan=2, sticky="NESW")
-            self.time_frame = tk.Frame(self.root, bg=BG_COLOR)
-            self.time_frame.grid(
-                row=1, column=0, rowspan=2, columnspan=2, sticky="NESW"
-            )
-            self.blind_frame = tk.Frame(self.root, bg=BG_COLOR)
-            self.blind_frame.grid(row=3, column=0, columnspan=2, sticky="NESW")
-
-            self.round_number_label = tk.Label(
-                self.round_frame,
-                textvariable=self.round_num,
-                bg="black",
-                fg="white",
-                font=("Arial", 60, "bold"),
-            )
-            self.round_number_label.pack(fill="both", expand=True)
-            self.timer = Timer(self.time_frame, self)
-            self.timer_button = TimerButton(self.button_frame, self)
-            next_button = tk.Button(
-                self.button_frame,
-                text="Next Round",
-                command=self.next_round,
-                bg="black",
-                fg="white",
-                font=("Arial", 30, "bold"),
-                relief="raised",
-            )
-            next_button.pack(fill="both", expand=True, pady=50, padx=10)
-            reset_button = tk.Button(
-                self.button_frame,
-                text="Reset Timer",
-                command=self.restart_timer,
-                bg="red",
-                fg="white",
-                font=("Arial", 30, "bold"),
-                relief="raised",
-            )
-            reset_button.pack(fill="both", expand=True, pady=50, padx=10)
-            s_blind_label = tk.Label(
-                self.blind_frame,
-                textvariable=self.s_blind,
-                bg="black",
-                fg="white",
-                relief="raised",
-                font=("Arial", 30, "bold"),
-            )
-            s_blind_label.pack(side="left", fill="both", expand=True, pady=10, padx=50)
-            b_blind_label = tk.Label(
-                self.blind_frame,
-                textvariable=self.b_blind,
-                bg="red",
-                fg="white",
-                relief="raised",
-                font=("Arial", 30, "bold"),
-            )
-            b_blind_label.pack(side="right", fill="both", expand=True, pady=10, padx=50)
+    Each state maps widgets to the options they should have. Switching state
+    only configures the options that differ from the current state, using a
+    change list worked out once per pair of states, and all of it happens in
+    one callback so Tk repaints once.
+    """
 
-            self.is_flashing = False
+    def __init__(self, root):
+        self.root = root
+        self.states = {}
+        self.changes = {}
+        self.current = None
+        self.after_id = None
 
-    def flash_screen(self, duration=10, speed=500):
+    def define(self, name, styles):
         """
-        Flashes screen on timer completion
+        Add or replace a state
 
         Args:
-            duration (int, optional): number of screen flash cycles
-            speed (int, optional): time between flashes in miliseconds
+            name (str): State name
+            styles (dict): Widget to dict of options
 
         Returns:
             None
         """
-        self.is_flashing = True
-        self.flash_1(duration, speed)
+        self.states[name] = styles
+        self.changes.clear()
 
-    def stop_flashing(self):
+    def change_list(self, old, new):
         """
-        Stops screen flashing
+        Options to configure when going from one state to another
 
         Args:
-            None
+            old (str|None): Current state, None configures everything
+            new (str): Next state
 
         Returns:
-            None
+            changes (arr[tuple]): Widget and options pairs
         """
-        self.is_flashing = False
-
-    def flash_1(self, duration, speed):
+        key = (old, new)
+        if key not in self.changes:
+            before = self.states.get(old, {})
+            changes = []
+            for widget, options in self.states[new].items():
+                current = before.get(widget, {})
+                diff = {k: v for k, v in options.items() if current.get(k) != v}
+                if diff:
+                    changes.append((widget, diff))
+            self.changes[key] = changes
+        return self.changes[key]
+
+    def apply(self, name):
         """
-        First part of flash sequence
-        should not be called directly
+        Switch to a state
 
         Args:
-            duration (int): number of screen flash cycles
-            speed (int): time between flashes in miliseconds
+            name (str): State name
 
         Returns:
             None
         """
-        if duration > 0 and self.is_flashing:
-            self.root.configure(bg="black")
-            self.round_frame.configure(bg="black")
-            self.round_number_label.configure(bg="black")
-            self.button_frame.configure(bg="black")
-            self.time_frame.configure(bg="black")
-            self.timer.timer_label.configure(bg="black")
-            self.blind_frame.configure(bg="black")
-            self.root.after(speed, lambda: self.flash_2(duration, speed))
-        else:
-            self.root.configure(bg=BG_COLOR)
-            self.round_frame.configure(bg=BG_COLOR)
-            self.round_number_label.configure(bg="black")
-            self.button_frame.configure(bg=BG_COLOR)
-            self.time_frame.configure(bg=BG_COLOR)
-            self.timer.timer_label.configure(bg=BG_COLOR)
-            self.blind_frame.configure(bg=BG_COLOR)
+        if name == self.current:
+            return
+        for widget, options in self.change_list(self.current, name):
+            widget.configure(**options)
+        self.current = name
 
-    def flash_2(self, duration, speed):
+    def play(self, pattern, interval, on_done=None):
         """
-        Second part of flash sequence
-        should not be called directly
+        Step through a sequence of states with one callback per frame
 
         Args:
-            duration (int): number of screen flash cycles
-            speed (int): time between flashes in miliseconds
+            pattern (arr[str]): State names in order
+            interval (int): Milliseconds between frames
+            on_done (func, optional): Called after the last frame
 
         Returns:
             None
         """
-        if self.is_flashing:
-            self.root.configure(bg="white")
-            self.round_frame.configure(bg="white")
-            self.round_number_label.configure(bg="white")
-            self.button_frame.configure(bg="white")
-            self.time_frame.configure(bg="white")
-            self.timer.timer_label.configure(bg="white")
-            self.blind_frame.configure(bg="white")
-            self.root.after(speed, lambda: self.flash_1(duration - 1, speed))
-        else:
-            self.root.configure(bg=BG_COLOR)
-            self.round_frame.configure(bg=BG_COLOR)
-            self.round_number_label.configure(bg="black")
-            self.button_frame.configure(bg=BG_COLOR)
-            self.time_frame.configure(bg=BG_COLOR)
-            self.timer.timer_label.configure(bg=BG_COLOR)
-            self.blind_frame.configure(bg=BG_COLOR)
+        self.stop()
+
+        def frame(index):
+            if index < len(pattern):
+                self.apply(pattern[index])
+                self.after_id = self.root.after(interval, frame, index + 1)
+            else:
+                self.after_id = None
+                if on_done is not None:
+                    on_done()
+
+        frame(0)
+
+    def stop(self):
+        """
+        Stop a pattern that is playing
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+
+
+class ClockFace:
+    """
+    Round banner, clock and blinds, the part of the game page that
+    secondary displays show too
+
+    Laid out on the grid of the page's root, the page needs root and clock set
+    """
+
+    def __init__(self, page, banner_span, span):
+        self.root = page.root
+        state = page.clock.state
+        self.round_num = tk.StringVar(value=f"Round: {state.round_num}")
+        self.s_blind = tk.StringVar(value=f"Small Blind: {state.s_blind:,}")
+        self.b_blind = tk.StringVar(value=f"Big Blind: {state.b_blind:,}")
+
+        self.round_frame = tk.Frame(self.root, bg=BG_COLOR)
+        self.round_frame.grid(row=0, column=0, columnspan=banner_span, sticky="NESW")
+        self.time_frame = tk.Frame(self.root, bg=BG_COLOR)
+        self.time_frame.grid(row=1, column=0, rowspan=2, columnspan=span, sticky="NESW")
+        self.blind_frame = tk.Frame(self.root, bg=BG_COLOR)
+        self.blind_frame.grid(row=3, column=0, columnspan=span, sticky="NESW")
+
+        self.round_number_label = tk.Label(
+            self.round_frame,
+            textvariable=self.round_num,
+            bg="black",
+            fg="white",
+            font=("Arial", 60, "bold"),
+        )
+        self.round_number_label.pack(fill="both", expand=True)
+        self.timer = Timer(self.time_frame, page)
+        s_blind_label = tk.Label(
+            self.blind_frame,
+            textvariable=self.s_blind,
+            bg="black",
+            fg="white",
+            relief="raised",
+            font=("Arial", 30, "bold"),
+        )
+        s_blind_label.pack(side="left", fill="both", expand=True, pady=10, padx=50)
+        b_blind_label = tk.Label(
+            self.blind_frame,
+            textvariable=self.b_blind,
+            bg="red",
+            fg="white",
+            relief="raised",
+            font=("Arial", 30, "bold"),
+        )
+        b_blind_label.pack(side="right", fill="both", expand=True, pady=10, padx=50)
+
+    def visual_states(self, *widgets):
+        """
+        Visual states over the face and other widgets of the page
+
+        Args:
+            widgets (tk.Widget): Page widgets that take the page colour
+
+        Returns:
+            visual_states (VisualStates): States for the page
+        """
+        visual_states = VisualStates(self.root)
+        page = (
+            self.root,
+            self.round_frame,
+            self.time_frame,
+            self.timer.timer_label,
+            self.blind_frame,
+        ) + widgets
+        for name, (page_bg, banner_bg) in STATE_COLORS.items():
+            styles = {widget: {"bg": page_bg} for widget in page}
+            styles[self.round_number_label] = {"bg": banner_bg}
+            visual_states.define(name, styles)
+        return visual_states
+
+    def show_round(self, round_num, s_blind, b_blind):
+        """
+        Show the round number and blinds
+
+        Args:
+            round_num (int): Round number
+            s_blind (int): Small blind
+            b_blind (int): Big blind
+
+        Returns:
+            None
+        """
+        self.round_num.set(f"Round: {round_num}")
+        self.s_blind.set(f"Small Blind: {s_blind:,}")
+        self.b_blind.set(f"Big Blind: {b_blind:,}")
+
+
+class GamePage:
+    """
+    Main game page
+    """
+
+    def __init__(self, poker_time, window=None, rounds=None):
+        self.poker_time = poker_time
+        self.root = poker_time.root if window is None else window
+
+        if window is None and poker_time.rounds is not None:
+            poker_time.landing_page.destroy()
+            poker_time.is_landing_page = False
+
+        if not poker_time.is_landing_page:
+            self.clock = poker_time.scheduler.add_clock(
+                poker_time.rounds if rounds is None else rounds
+            )
+            self.game_state = self.clock.game_state
+            if window is None:
+                self.history = poker_time.history
+                self.history.record(self.game_state.rounds, "Start Game")
+            else:
+                self.history = History(self.game_state.rounds)
+
+            MenuBar(self)
+            self.root.columnconfigure((0, 1, 2), weight=1)
+            self.root.rowconfigure((0, 1, 2, 3), weight=1)
+
+            self.face = ClockFace(self, 3, 2)
+            self.timer = self.face.timer
+            self.button_frame = tk.Frame(self.root, bg=BG_COLOR)
+            self.button_frame.grid(row=1, column=2, rowspan=2, sticky="NESW")
+            self.timer_button = TimerButton(self.button_frame, self)
+            next_button = tk.Button(
+                self.button_frame,
+                text="Next Round",
+                command=self.next_round,
+                bg="black",
+                fg="white",
+                font=("Arial", 30, "bold"),
+                relief="raised",
+            )
+            next_button.pack(fill="both", expand=True, pady=50, padx=10)
+            reset_button = tk.Button(
+                self.button_frame,
+                text="Reset Timer",
+                command=self.restart_timer,
+                bg="red",
+                fg="white",
+                font=("Arial", 30, "bold"),
+                relief="raised",
+            )
+            reset_button.pack(fill="both", expand=True, pady=50, padx=10)
+
+            self.tracker = Tracker()
+            self.stats = tk.StringVar()
+            self.stats_frame = tk.Frame(self.root, bg=BG_COLOR)
+            self.stats_frame.grid(row=3, column=2, sticky="NESW")
+            tk.Label(
+                self.stats_frame,
+                textvariable=self.stats,
+                bg="black",
+                fg="white",
+                justify="left",
+                font=("Arial", 16, "bold"),
+            ).pack(fill="both", expand=True, pady=10, padx=10)
+            self.tracker.subscribe(lambda event, entry: self.refresh_stats())
+            self.refresh_stats()
+
+            self.seating = Seating()
+            self.table_moves = []
+            self.tables_window = None
+            self.seating.attach(self.clock, self.on_table_moves)
+            self.tracker.subscribe(self.seat_entry)
+
+            self.is_flashing = False
+            self.visual_states = self.face.visual_states(
+                self.button_frame, self.stats_frame
+            )
+            self.visual_states.apply(base_state(self.clock.state))
+            self.clock.subscribe(self.on_clock_event)
+            if window is None:
+                poker_time.journal.attach(self.clock)
+                if poker_time.remote is not None:
+                    poker_time.remote.clock = self.clock
+                if poker_time.shared is not None:
+                    poker_time.shared.attach(self.clock)
+                if poker_time.sync is not None:
+                    poker_time.sync.attach(self.clock)
+
+    def flash_screen(self, duration=10, speed=500):
+        """
+        Flashes screen on timer completion
+
+        Args:
+            duration (int, optional): number of screen flash cycles
+            speed (int, optional): time between flashes in miliseconds
+
+        Returns:
+            None
+        """
+        self.is_flashing = True
+        self.set_alert(True)
+        self.visual_states.play(
+            ["alert_on", "alert_off"] * duration, speed, self.stop_flashing
+        )
+
+    def stop_flashing(self):
+        """
+        Stops screen flashing
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.is_flashing = False
+        self.set_alert(False)
+        self.visual_states.stop()
+        self.visual_states.apply(base_state(self.clock.state))
+
+    def set_alert(self, alert):
+        """
+        Tell secondary displays whether this page is flashing
+
+        Args:
+            alert (bool): True while flashing
+
+        Returns:
+            None
+        """
+        shared = self.poker_time.shared
+        if shared is not None and shared.clock is self.clock:
+            shared.set_alert(alert)
+
+    def on_clock_event(self, event, state):
+        """
+        Update the page when the clock reports a change
+
+        Args:
+            event (str): Clock event name
+            state (ClockState): Clock state at the time of the event
+
+        Returns:
+            None
+        """
+        self.timer.show(state)
+        if event in ("tick", "break_start"):
+            if not self.is_flashing:
+                self.visual_states.apply(base_state(state))
+            return
+        if event == "resume":
+            self.timer_button.set_text("Pause Timer")
+        elif event == "pause":
+            self.timer_button.set_text("Resume Timer")
+        elif event == "expire":
+            self.timer_button.set_text("Reset Timer")
+            self.flash_screen()
+        else:
+            self.refresh_round_values()
+            if state.is_expired:
+                return
+            self.stop_flashing()
+            if not state.is_paused:
+                self.timer_button.set_text("Pause Timer")
+            elif event in ("seek", "restore", "schedule"):
+                self.timer_button.set_text(
+                    "Resume Timer" if state.level_elapsed > 0 else "Start Timer"
+                )
+            elif event != "add_time":
+                self.timer_button.set_text("Start Timer")
 
     def refresh_round_values(self):
         """
@@ -532,16 +1031,1207 @@ class GamePage:
         Returns:
             None
         """
-        self.timer.time_remaining = self.game_state.time * 60
-        self.timer.time_var.set(value=self.timer.format_time(self.timer.time_remaining))
-        self.timer_button.set_text("Start Timer")
-        self.round_num.set(f"Round: {self.game_state.round_num}")
-        self.s_blind.set(f"Small Blind: {self.game_state.s_blind:,}")
-        self.b_blind.set(f"Big Blind: {self.game_state.b_blind:,}")
+        game_state = self.game_state
+        self.face.show_round(
+            game_state.round_num, game_state.s_blind, game_state.b_blind
+        )
+        self.refresh_stats()
+
+    def seat_entry(self, event, entry):
+        """
+        Tracker subscriber, keeps the seating in step with the players once
+        seats have been drawn
+
+        Knock outs leave a seat and may move players, new entries and
+        players who rebuy after being knocked out are given a seat
+
+        Args:
+            event (str): Tracker event name
+            entry (Entry): Entry that changed
+
+        Returns:
+            None
+        """
+        if not self.seating.tables:
+            return
+        seated = entry.name in self.seating.where
+        if event == "eliminate" and seated:
+            self.on_table_moves(self.seating.eliminate(entry.name))
+        elif event in ("register", "rebuy") and not seated:
+            self.on_table_moves(self.seating.add(entry.name))
+
+    def on_table_moves(self, moves):
+        """
+        Record moves for the floor and show them in the Tables window,
+        opening it if it is closed
+
+        Args:
+            moves (arr[Move]): Moves to make, in order
+
+        Returns:
+            None
+        """
+        if not moves:
+            if self.tables_window is not None:
+                self.tables_window.refresh()
+            return
+        self.table_moves[:0] = reversed(moves)
+        del self.table_moves[MAX_TABLE_MOVES:]
+        self.show_tables()
+
+    def show_tables(self):
+        """
+        Open the Tables window, or refresh it if it is open
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self.tables_window is None:
+            self.tables_window = TablesWindow(self)
+        else:
+            self.tables_window.refresh()
+            self.tables_window.window.lift()
+
+    def refresh_stats(self):
+        """
+        Refresh the player stats, O(1) since the tracker keeps running totals
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        stats = self.tracker.stats(self.game_state.b_blind)
+        if not stats.entries:
+            self.stats.set("Players: 0")
+            return
+        self.stats.set(
+            f"Players: {stats.remaining:,} / {stats.entries:,}\n"
+            f"Avg Stack: {stats.average_stack:,.0f} ({stats.average_bbs:,.1f} BB)\n"
+            f"Prize Pool: {stats.prize_pool:,.0f}"
+        )
+
+    def next_round(self):
+        """
+        Starts next round
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.clock.next_round()
+
+    def restart_game(self):
+        """
+        Restarts game from round 1
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.clock.restart_game()
+
+    def restart_timer(self):
+        """
+        Puts the current round back to its full time
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.clock.reset_timer()
+
+    def jump_to_time(self):
+        """
+        Asks how far into the tournament it is and moves the clock there
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        text = simpledialog.askstring(
+            "Jump To Time",
+            "Time since the start of the game (h:mm or h:mm:ss)",
+            parent=self.root,
+        )
+        if not text:
+            return
+        try:
+            elapsed = parse_clock_time(text)
+        except ValueError:
+            messagebox.showerror("Jump To Time", f"{text} is not a time like 2:13")
+            return
+        self.clock.seek(elapsed)
+
+    def new_table(self):
+        """
+        Opens another table with its own clock and a copy of this game's rounds
+
+        All tables share the one scheduler so they never disturb each other
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        window = tk.Toplevel(self.poker_time.root)
+        window.title(f"Poker Time - Table {len(self.poker_time.scheduler) + 1}")
+        window.geometry("1200x900")
+        window.configure(bg=BG_COLOR)
+        table = GamePage(self.poker_time, window, self.game_state.rounds.copy())
+        window.protocol("WM_DELETE_WINDOW", table.close_table)
+
+    def close_table(self):
+        """
+        Closes a table window and stops scheduling its clock
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.stop_flashing()
+        self.poker_time.scheduler.remove(self.clock)
+        self.root.destroy()
+
+
+class VirtualTable:
+    """
+    Scrolling table that only has widgets for the rows on screen
+
+    Cell values come from get_cell(row, column) and edits are handed back
+    through set_cell(row, column, text). When the table scrolls the same row
+    widgets are rebound to new rows so memory stays flat for any row count.
+    bindings maps events to callbacks taking the row and column of the entry
+    the event happened in.
+    """
+
+    def __init__(
+        self, container, columns, get_cell, set_cell=None, row_count=0, bindings=None
+    ):
+        self.columns = columns
+        self.get_cell = get_cell
+        self.set_cell = set_cell
+        self.bindings = bindings or {}
+        self.row_count = row_count
+        self.top = 0
+        self.row_height = None
+        self.rows = []
+        self.bound = []
+
+        self.frame = tk.Frame(container, bg=BG_COLOR)
+        self.frame.columnconfigure(0, weight=1)
+        self.frame.rowconfigure(0, weight=1)
+        self.body = tk.Frame(self.frame, bg=BG_COLOR)
+        self.body.grid(row=0, column=0, sticky="NESW")
+        self.scrollbar = tk.Scrollbar(self.frame, orient="vertical", command=self.yview)
+        self.scrollbar.grid(row=0, column=1, sticky="NS")
+
+        for column, (heading, bg, _, _) in enumerate(columns):
+            self.body.columnconfigure(column, weight=1, uniform="column")
+            tk.Label(self.body, text=heading, bg=bg, fg="white").grid(
+                row=0, column=column, sticky="NESW"
+            )
+        self.bind_wheel(self.body)
+        self.body.bind("<Configure>", self.on_resize)
+        self.resize(20)
+
+    def bind_wheel(self, widget):
+        """
+        Scroll the table with the mouse wheel over a widget
+
+        Args:
+            widget (tk.Widget): Widget to bind
+
+        Returns:
+            None
+        """
+        widget.bind("<MouseWheel>", lambda e: self.scroll(-1 if e.delta > 0 else 1))
+        widget.bind("<Button-4>", lambda e: self.scroll(-1))
+        widget.bind("<Button-5>", lambda e: self.scroll(1))
+
+    def add_row(self):
+        """
+        Add a row of widgets to the bottom of the pool
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        index = len(self.rows) + 1
+        widgets = []
+        for column, (_, bg, width, editable) in enumerate(self.columns):
+            if editable and self.set_cell is not None:
+                widget = tk.Entry(self.body, width=width, bg=bg, fg="white")
+                for event, callback in self.bindings.items():
+                    widget.bind(
+                        event, lambda e, callback=callback: self.dispatch(callback, e)
+                    )
+            else:
+                widget = tk.Label(self.body, width=width, bg=bg, fg="white")
+            widget.grid(row=index, column=column, sticky="NESW")
+            self.bind_wheel(widget)
+            widgets.append(widget)
+        self.rows.append(widgets)
+        self.bound.append(None)
+        if self.row_height is None:
+            self.row_height = max(widget.winfo_reqheight() for widget in widgets)
+
+    def dispatch(self, callback, event):
+        """
+        Hand an event on an entry to its callback with the cell it is in
+
+        Args:
+            callback (func): Callback taking the row and column
+            event (tk.Event): Event on an entry
+
+        Returns:
+            result (str|None): What the callback returns, "break" stops Tk's
+                own handling of the event
+        """
+        cell = self.cell_of(event.widget)
+        return None if cell is None else callback(*cell)
+
+    def cell_of(self, widget):
+        """
+        Row and column a widget of the table is showing
+
+        Args:
+            widget (tk.Widget): Widget to look up
+
+        Returns:
+            cell (tuple|None): Row and column, None if it is not a bound cell
+        """
+        for widgets, row in zip(self.rows, self.bound):
+            if row is not None and widget in widgets:
+                return row, widgets.index(widget)
+        return None
+
+    def resize(self, visible):
+        """
+        Grow or shrink the pool of row widgets
+
+        Args:
+            visible (int): Number of rows that fit on screen
+
+        Returns:
+            None
+        """
+        self.commit()
+        while len(self.rows) < visible:
+            self.add_row()
+        while len(self.rows) > visible:
+            for widget in self.rows.pop():
+                widget.destroy()
+            self.bound.pop()
+        self.scroll_to(self.top)
+
+    def on_resize(self, event):
+        """
+        Fit the pool to the new height of the table
+
+        Args:
+            event (tk.Event): Configure event
+
+        Returns:
+            None
+        """
+        visible = max(1, event.height // self.row_height - 1)
+        if visible != len(self.rows):
+            self.resize(visible)
+
+    def commit(self):
+        """
+        Hand the text of every bound entry back through set_cell
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self.set_cell is None:
+            return
+        for widgets, row in zip(self.rows, self.bound):
+            if row is None:
+                continue
+            for column, widget in enumerate(widgets):
+                if isinstance(widget, tk.Entry):
+                    self.set_cell(row, column, widget.get())
+
+    def render(self):
+        """
+        Bind the row widgets to the rows starting at the top of the view
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        for index, widgets in enumerate(self.rows):
+            row = self.top + index
+            if row >= self.row_count:
+                if self.bound[index] is not None:
+                    for widget in widgets:
+                        widget.grid_remove()
+                    self.bound[index] = None
+                continue
+            if self.bound[index] is None:
+                for widget in widgets:
+                    widget.grid()
+            self.bound[index] = row
+            for column, widget in enumerate(widgets):
+                value = self.get_cell(row, column)
+                if isinstance(widget, tk.Entry):
+                    set_entry_text(widget, value)
+                elif str(widget.cget("text")) != str(value):
+                    widget.configure(text=value)
+        if self.row_count:
+            self.scrollbar.set(
+                self.top / self.row_count,
+                min(1.0, (self.top + len(self.rows)) / self.row_count),
+            )
+        else:
+            self.scrollbar.set(0, 1)
+
+    def scroll_to(self, top):
+        """
+        Show the rows starting at top
+
+        Args:
+            top (int): First row to show
+
+        Returns:
+            None
+        """
+        self.commit()
+        self.top = max(0, min(top, self.row_count - len(self.rows)))
+        self.render()
+
+    def scroll(self, rows):
+        """
+        Scroll by a number of rows
+
+        Args:
+            rows (int): Rows to scroll, negative scrolls up
+
+        Returns:
+            None
+        """
+        self.scroll_to(self.top + rows)
+
+    def yview(self, *args):
+        """
+        Scrollbar command
+
+        Args:
+            args (tuple): moveto fraction or scroll amount and unit
+
+        Returns:
+            None
+        """
+        if args[0] == "moveto":
+            self.scroll_to(int(float(args[1]) * self.row_count))
+        elif args[2] == "pages":
+            self.scroll(int(args[1]) * len(self.rows))
+        else:
+            self.scroll(int(args[1]))
+
+    def set_row_count(self, row_count):
+        """
+        Show a new number of rows, discarding text in the entries on screen
+
+        Args:
+            row_count (int): Number of rows in the table
+
+        Returns:
+            None
+        """
+        self.row_count = row_count
+        self.top = max(0, min(self.top, row_count - len(self.rows)))
+        self.render()
+
+
+class EditorPage:
+    """
+    Game editor window
+
+    create a new game or edit an existing one
+    import or export game files as csv
+    """
+
+    def __init__(self, ctx, new=False, from_landing_page=False):
+        window = tk.Toplevel(ctx.root)
+        self.window = window
+        self.ctx = ctx
+        self.history = ctx.history
+        self.from_landing_page = from_landing_page
+        if new:
+            window.title("New Game")
+            self.rounds = BlindSchedule()
+        else:
+            window.title("Edit Game")
+            self.rounds = self.ctx.game_state.rounds
+
+        window.geometry("800x600")
+        window.configure(bg=BG_COLOR)
+        window.columnconfigure((0, 1, 2, 3, 4, 5), weight=1)
+        window.rowconfigure(1, weight=1)
+
+        round_column_heading = tk.Frame(window, bg="red")
+        round_column_heading.grid(row=0, column=1, sticky="NESW")
+        round_column_label = tk.Label(
+            round_column_heading, text="Rounds:", bg="red", fg="white"
+        )
+        round_column_label.pack(fill="both", expand=True, side="left")
+        self.num_rounds_entry = tk.Entry(
+            round_column_heading, width=2, bg="red", fg="white"
+        )
+        self.num_rounds_entry.pack(fill="both", expand=True, side="right")
+        self.num_rounds_entry.insert(tk.END, len(self.rounds))
+        self.num_rounds_entry.bind("<Return>", lambda event: self.set_round_count())
+        self.num_rounds_entry.bind("<FocusOut>", lambda event: self.set_round_count())
+
+        self.edits = {}
+        self.table = VirtualTable(
+            window,
+            (
+                ("Round", "red", 4, False),
+                ("Time", "black", 6, True),
+                ("Small Blind", "red", 10, True),
+                ("Big Blind", "black", 10, True),
+                ("Ante", "red", 8, True),
+            ),
+            self.get_cell,
+            self.set_cell,
+            len(self.rounds),
+            {"<<Paste>>": self.paste},
+        )
+        self.table.frame.grid(row=1, column=1, columnspan=4, sticky="NESW")
+
+        button_frame = tk.Frame(window, bg=BG_COLOR)
+        button_frame.grid(row=2, column=1, columnspan=4, sticky="NESW")
+        tk.Button(
+            button_frame,
+            text="Save Game",
+            command=self.save_game,
+            bg="black",
+            fg="white",
+        ).pack(side="left", fill="both", expand=True)
+        tk.Button(
+            button_frame,
+            text="Export Game",
+            command=self.export_game,
+            bg="red",
+            fg="white",
+        ).pack(side="left", fill="both", expand=True)
+        tk.Button(
+            button_frame,
+            text="Import Game",
+            command=self.import_game,
+            bg="black",
+            fg="white",
+        ).pack(side="left", fill="both", expand=True)
+        tk.Button(
+            button_frame,
+            text="Generate",
+            command=lambda: GeneratorDialog(
+                window, lambda rounds: self.load_rounds(rounds, "Generate")
+            ),
+            bg="red",
+            fg="white",
+        ).pack(side="left", fill="both", expand=True)
+        tk.Button(
+            button_frame,
+            text="Fill",
+            command=lambda: FillDialog(window, self),
+            bg="red",
+            fg="white",
+        ).pack(side="left", fill="both", expand=True)
+        tk.Button(
+            button_frame,
+            text="Undo",
+            command=self.undo,
+            bg="red",
+            fg="white",
+        ).pack(side="left", fill="both", expand=True)
+        tk.Button(
+            button_frame,
+            text="Redo",
+            command=self.redo,
+            bg="black",
+            fg="white",
+        ).pack(side="left", fill="both", expand=True)
+        tk.Button(
+            button_frame,
+            text="History",
+            command=self.show_history,
+            bg="red",
+            fg="white",
+        ).pack(side="left", fill="both", expand=True)
+        if from_landing_page:
+            tk.Button(
+                button_frame,
+                text="Start Game",
+                command=lambda: GamePage(self.ctx),
+                bg="red",
+                fg="white",
+            ).pack(side="left", fill="both", expand=True)
+        window.bind("<Control-z>", lambda event: self.undo())
+        window.bind("<Control-y>", lambda event: self.redo())
+        window.bind("<Control-Z>", lambda event: self.redo())
+
+    def get_cell(self, row, column):
+        """
+        Value shown in a cell of the editor table
+
+        Args:
+            row (int): Row index
+            column (int): Column index
+
+        Returns:
+            value (int|str): Text typed into the cell, or the saved value
+        """
+        text = self.edits.get((row, column))
+        if text is not None:
+            return text
+        return self.saved_value(row, column)
+
+    def saved_value(self, row, column):
+        """
+        Value a cell has in the saved game
+
+        Args:
+            row (int): Row index
+            column (int): Column index
+
+        Returns:
+            value (int): Saved value, the round number or 0 past the last round
+        """
+        if row < len(self.rounds):
+            return self.rounds.column(ROUND_FIELDS[column])[row]
+        return row + 1 if column == 0 else 0
+
+    def set_cell(self, row, column, text):
+        """
+        Keep text typed into a cell of the editor table until the game is saved
+
+        Args:
+            row (int): Row index
+            column (int): Column index
+            text (str): Text in the entry
+
+        Returns:
+            None
+        """
+        if text == str(self.saved_value(row, column)):
+            self.edits.pop((row, column), None)
+        else:
+            self.edits[(row, column)] = text
+
+    def set_cells(self, cells):
+        """
+        Change many cells at once with a single redraw of the table
+
+        Rows past the end are added, as if the round count had been changed
+
+        Args:
+            cells (iter[tuple]): Row, column and text of every cell
+
+        Returns:
+            None
+        """
+        self.table.commit()
+        row_count = self.table.row_count
+        for row, column, text in cells:
+            self.set_cell(row, column, text)
+            row_count = max(row_count, row + 1)
+        if row_count != self.table.row_count:
+            set_entry_text(self.num_rounds_entry, row_count)
+        self.table.set_row_count(row_count)
+
+    def set_round_count(self):
+        """
+        Show the number of rows typed into the Rounds entry without saving
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        try:
+            row_count = int(self.num_rounds_entry.get())
+        except ValueError:
+            row_count = -1
+        if row_count < 0:
+            set_entry_text(self.num_rounds_entry, self.table.row_count)
+            return
+        if row_count != self.table.row_count:
+            self.table.commit()
+            self.table.set_row_count(row_count)
+
+    def paste(self, row, column):
+        """
+        Paste rows and columns copied from a spreadsheet, starting at a cell
+
+        Text without tabs or line breaks is left to the entry
+
+        Args:
+            row (int): Row of the entry pasted into
+            column (int): Column of the entry pasted into
+
+        Returns:
+            result (str|None): "break" if the paste was handled here
+        """
+        try:
+            text = self.window.clipboard_get()
+        except tk.TclError:
+            return None
+        if "\t" not in text and "\n" not in text:
+            return None
+        self.set_cells(
+            (row + down, column + across, value)
+            for down, values in enumerate(parse_table_text(text))
+            for across, value in enumerate(values)
+            if column + across < len(ROUND_FIELDS)
+        )
+        return "break"
+
+    def refresh_editor(self):
+        """
+        Refresh editor screen when changes are made
+
+        Only the rows on screen have widgets, they are updated in place and
+        cells whose text has not changed are left alone
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        set_entry_text(self.num_rounds_entry, len(self.rounds))
+        self.edits.clear()
+        self.table.set_row_count(len(self.rounds))
+
+    def save_game(self):
+        """
+        Save editor values
+
+        Unedited rows are copied column by column, only edited rows are parsed
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        try:
+            num_rounds = int(self.num_rounds_entry.get())
+        except ValueError:
+            self.num_rounds_entry.delete(0, tk.END)
+            self.num_rounds_entry.insert(tk.END, len(self.rounds))
+            num_rounds = len(self.rounds)
+        self.table.commit()
+        rounds = self.rounds[:num_rounds]
+        while len(rounds) < num_rounds:
+            rounds.append(len(rounds) + 1)
+        rounds.set_column("num", range(1, num_rounds + 1))
+        for i in sorted({row for row, _ in self.edits if row < num_rounds}):
+            try:
+                rounds.set_level(
+                    i,
+                    **{
+                        ROUND_FIELDS[column]: parse_int(str(self.get_cell(i, column)))
+                        for column in range(1, len(ROUND_FIELDS))
+                    },
+                )
+            except ValueError:
+                rounds.set_level(i, time=0, s_blind=0, b_blind=0, ante=0)
+        self.apply_rounds(rounds, "Save")
+
+    def export_game(self):
+        """
+        Export game as CSV
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        documents_dir = Path.home() / "Documents"
+        poker_dir = documents_dir / "PokerTime"
+        poker_dir.mkdir(parents=True, exist_ok=True)
+
+        self.save_game()
+
+        file = filedialog.asksaveasfilename(
+            defaultextension=".csv",
+            initialdir=poker_dir,
+            title="Choose where to save the game file.",
+            filetypes=(("CVS files", "*.csv"), ("All files", "*.*")),
+        )
+
+        if self.from_landing_page:
+            source = self.ctx.rounds
+        else:
+            source = self.ctx.game_state.rounds
+
+        if file:
+            with open(file, "w", newline="", encoding="utf-8") as f:
+                source.write_csv(f)
+
+    def import_game(self):
+        """
+        Import a game from a CSV file
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        documents_dir = Path.home() / "Documents"
+        poker_dir = documents_dir / "PokerTime"
+        poker_dir.mkdir(parents=True, exist_ok=True)
+
+        file = filedialog.askopenfilename(
+            initialdir=poker_dir,
+            title="Select a file",
+            filetypes=(
+                ("CVS files", "*.csv"),
+                ("TSV files", "*.tsv *.txt"),
+                ("All files", "*.*"),
+            ),
+        )
+
+        if not file:
+            return
+
+        report = import_structure(file)
+        rounds = report.rounds
+        if report.error_count:
+            messagebox.showwarning(
+                "Import Game",
+                f"{report.error_count} line(s) could not be imported:\n\n"
+                + report.summary(),
+            )
+        if rounds:
+            self.load_rounds(rounds, "Import")
+
+    def load_rounds(self, rounds, label="Load"):
+        """
+        Replace the game with a new set of rounds
+
+        Args:
+            rounds (BlindSchedule): New rounds
+            label (str, optional): What to call the change in the history
+
+        Returns:
+            None
+        """
+        self.apply_rounds(rounds, label)
+
+    def apply_rounds(self, rounds, label=None):
+        """
+        Put a set of rounds into the game and the editor
+
+        Args:
+            rounds (BlindSchedule): New rounds
+            label (str, optional): Records the change in the history, None
+                when moving through the history itself
+
+        Returns:
+            None
+        """
+        if self.from_landing_page:
+            self.ctx.rounds = rounds
+        else:
+            self.ctx.clock.update_rounds(rounds)
+        self.rounds = rounds
+        if label is not None:
+            self.history.record(rounds, label)
+        self.refresh_editor()
+
+    def undo(self):
+        """
+        Go back to the game as it was before the last change
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        rounds = self.history.undo()
+        if rounds is not None:
+            self.apply_rounds(rounds)
+
+    def redo(self):
+        """
+        Put back a change taken away by undo
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        rounds = self.history.redo()
+        if rounds is not None:
+            self.apply_rounds(rounds)
+
+    def show_history(self):
+        """
+        List every version of the game, selecting one goes straight to it
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        window = tk.Toplevel(self.window)
+        window.title("History")
+        window.configure(bg=BG_COLOR)
+        versions = tk.Listbox(
+            window, bg="black", fg="white", width=40, exportselection=False
+        )
+        versions.pack(fill="both", expand=True, padx=10, pady=10)
+        versions.insert(tk.END, *self.history.labels())
+        if self.history.entries:
+            versions.selection_set(self.history.position)
+            versions.see(self.history.position)
+
+        def on_select(_event):
+            selected = versions.curselection()
+            if selected and selected[0] != self.history.position:
+                self.apply_rounds(self.history.jump(selected[0]))
+
+        versions.bind("<<ListboxSelect>>", on_select)
+
+
+class GeneratorDialog:
+    """
+    Blind structure generator window
+
+    Asks for the tournament details and offers the best generated structures
+    """
+
+    FIELDS = (
+        ("Starting Stack", "10000"),
+        ("Players", "20"),
+        ("Length (minutes)", "240"),
+        ("Level Length (minutes)", "20"),
+        ("Chips", "25, 100, 500, 1000, 5000"),
+    )
+
+    def __init__(self, parent, on_choose):
+        self.window = tk.Toplevel(parent)
+        self.window.title("Generate Structure")
+        self.window.configure(bg=BG_COLOR)
+        self.window.columnconfigure(1, weight=1)
+        self.on_choose = on_choose
+        self.entries = []
+        for row, (label, default) in enumerate(self.FIELDS):
+            tk.Label(self.window, text=label, bg=BG_COLOR, fg="white").grid(
+                row=row, column=0, sticky="W", padx=10, pady=2
+            )
+            entry = tk.Entry(self.window)
+            entry.insert(tk.END, default)
+            entry.grid(row=row, column=1, sticky="EW", padx=10, pady=2)
+            self.entries.append(entry)
+        tk.Button(
+            self.window,
+            text="Generate",
+            command=self.generate,
+            bg="black",
+            fg="white",
+        ).grid(row=len(self.FIELDS), column=0, columnspan=2, sticky="EW", padx=10)
+        self.results = tk.Frame(self.window, bg=BG_COLOR)
+        self.results.grid(row=len(self.FIELDS) + 1, column=0, columnspan=2, sticky="EW")
+
+    def generate(self):
+        """
+        Generate structures and list them with a button to use each one
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        from generator import generate_structures  # pylint: disable=import-outside-toplevel
+
+        try:
+            stack, players, length, level = (
+                int(entry.get()) for entry in self.entries[:4]
+            )
+            chips = [int(chip) for chip in self.entries[4].get().split(",")]
+        except ValueError:
+            messagebox.showwarning(
+                "Generate Structure",
+                "Enter whole numbers, with chip values separated by commas.",
+                parent=self.window,
+            )
+            return
+        try:
+            structures = generate_structures(stack, players, length, level, chips)
+        except ValueError as e:
+            messagebox.showwarning(
+                "Generate Structure",
+                f"Can't generate a structure: {e}.",
+                parent=self.window,
+            )
+            return
+        for child in self.results.winfo_children():
+            child.destroy()
+        for structure in structures:
+            rounds = structure.rounds
+            blinds = ", ".join(
+                f"{s_blind:,}/{b_blind:,}"
+                for s_blind, b_blind in zip(rounds.s_blinds[:4], rounds.b_blinds[:4])
+            )
+            tk.Button(
+                self.results,
+                text=f"{len(rounds)} levels, ends in about "
+                f"{structure.end_minutes} minutes: {blinds}, ...",
+                command=lambda rounds=rounds: self.choose(rounds),
+                bg="black",
+                fg="white",
+            ).pack(fill="x", padx=10, pady=2)
+
+    def choose(self, rounds):
+        """
+        Load a generated structure into the editor and close the window
+
+        Args:
+            rounds (BlindSchedule): Chosen structure
+
+        Returns:
+            None
+        """
+        self.on_choose(rounds)
+        self.window.destroy()
+
+
+class FillDialog:
+    """
+    Fill a run of cells in one column of the editor
+
+    Fills down with a blank step, or steps the value every few levels,
+    such as x2 every 3 levels to double the blinds every third level
+    """
+
+    COLUMNS = ("Time", "Small Blind", "Big Blind", "Ante")
+    FIELDS = ("From Round", "To Round", "Start Value", "Step (+25, -5, x2)", "Every")
+
+    def __init__(self, parent, editor):
+        self.window = tk.Toplevel(parent)
+        self.window.title("Fill")
+        self.window.configure(bg=BG_COLOR)
+        self.window.columnconfigure(1, weight=1)
+        self.editor = editor
+        row, column = editor.table.cell_of(parent.focus_get()) or (0, 3)
+        self.column = tk.StringVar(value=self.COLUMNS[max(0, column - 1)])
+        tk.Label(self.window, text="Column", bg=BG_COLOR, fg="white").grid(
+            row=0, column=0, sticky="W", padx=10, pady=2
+        )
+        tk.OptionMenu(self.window, self.column, *self.COLUMNS).grid(
+            row=0, column=1, sticky="EW", padx=10, pady=2
+        )
+        defaults = (
+            row + 1,
+            editor.table.row_count,
+            editor.get_cell(row, column),
+            "",
+            1,
+        )
+        self.entries = []
+        for index, (label, default) in enumerate(zip(self.FIELDS, defaults), 1):
+            tk.Label(self.window, text=label, bg=BG_COLOR, fg="white").grid(
+                row=index, column=0, sticky="W", padx=10, pady=2
+            )
+            entry = tk.Entry(self.window)
+            entry.insert(tk.END, default)
+            entry.grid(row=index, column=1, sticky="EW", padx=10, pady=2)
+            self.entries.append(entry)
+        tk.Button(
+            self.window,
+            text="Fill",
+            command=self.fill,
+            bg="black",
+            fg="white",
+        ).grid(row=len(self.FIELDS) + 1, column=0, columnspan=2, sticky="EW", padx=10)
+
+    def fill(self):
+        """
+        Put the series into the editor in one batch and close the window
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        first, last, start, step, every = (entry.get() for entry in self.entries)
+        try:
+            first, last, every = int(first), int(last), int(every)
+            if first < 1 or last < first:
+                raise ValueError(first)
+            values = fill_series(parse_int(start), step, last - first + 1, every)
+        except ValueError:
+            messagebox.showwarning(
+                "Fill",
+                "Enter round numbers with From before To, a whole number to "
+                "start from and a step like +25, -5 or x2.",
+                parent=self.window,
+            )
+            return
+        column = self.COLUMNS.index(self.column.get()) + 1
+        self.editor.set_cells(
+            (first - 1 + offset, column, str(value))
+            for offset, value in enumerate(values)
+        )
+        self.window.destroy()
+
+
+class GameOverview:
+    """
+    Basic overview page to see all round data
+
+    When given the running clock it also shows when each upcoming round is
+    expected to start
+    """
+
+    def __init__(self, root, rounds, clock=None):
+        window = tk.Toplevel(root)
+        window.title("Game Overview")
+        window.geometry("800x600")
+        window.configure(bg=BG_COLOR)
+
+        window.columnconfigure(0, weight=1)
+        window.rowconfigure(0, weight=1)
+
+        columns = [rounds.column(field) for field in ROUND_FIELDS]
+        now = datetime.now().timestamp()
+
+        def get_cell(row, column):
+            if column == len(columns):
+                start = clock.projected_start(row, now) if clock else None
+                if start is None:
+                    return ""
+                return datetime.fromtimestamp(start).strftime("%H:%M")
+            if column == 0 and rounds.breaks[row]:
+                return "Break"
+            return columns[column][row]
+
+        table = VirtualTable(
+            window,
+            (
+                ("Round", "red", 4, False),
+                ("Time", "black", 6, False),
+                ("Small Blind", "red", 10, False),
+                ("Big Blind", "black", 10, False),
+                ("Ante", "red", 8, False),
+                ("Starts", "black", 8, False),
+            ),
+            get_cell,
+            row_count=len(rounds),
+        )
+        table.frame.grid(row=0, column=0, sticky="NESW", padx=10, pady=10)
+
+        self.window = window
+        self.rounds = rounds
+        self.results = queue.SimpleQueue()
+        self.cancel = None
+        window.protocol("WM_DELETE_WINDOW", self.close)
+        sim_frame = tk.Frame(window, bg=BG_COLOR)
+        sim_frame.grid(row=1, column=0, sticky="NESW", padx=10, pady=(0, 10))
+        self.entries = []
+        for label, default in (("Players", "20"), ("Starting Stack", "10000")):
+            tk.Label(sim_frame, text=label, bg=BG_COLOR, fg="white").pack(side="left")
+            entry = tk.Entry(sim_frame, width=8)
+            entry.insert(tk.END, default)
+            entry.pack(side="left", padx=(2, 10))
+            self.entries.append(entry)
+        self.simulate_button = tk.Button(
+            sim_frame,
+            text="Simulate Length",
+            command=self.simulate,
+            bg="black",
+            fg="white",
+        )
+        self.simulate_button.pack(side="left")
+        self.sim_text = tk.StringVar()
+        tk.Label(
+            window,
+            textvariable=self.sim_text,
+            bg=BG_COLOR,
+            fg="white",
+            justify="left",
+        ).grid(row=2, column=0, sticky="W", padx=10, pady=(0, 10))
+
+    def simulate(self):
+        """
+        Simulate the length of the tournament on a worker thread, or cancel
+        the simulation that is running
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self.cancel is not None:
+            self.stop_simulation()
+            self.sim_text.set("Simulation cancelled")
+            return
+        try:
+            players, stack = (int(entry.get()) for entry in self.entries)
+        except ValueError:
+            self.sim_text.set("Players and starting stack must be whole numbers")
+            return
 
-    def next_round(self):
+        cancel = threading.Event()
+
+        def run():
+            from simulator import simulate  # pylint: disable=import-outside-toplevel
+
+            try:
+                result = simulate(self.rounds, players, stack, cancel=cancel)
+            except ValueError as e:
+                result = e
+            self.results.put((cancel, result))
+
+        self.cancel = cancel
+        self.simulate_button.configure(text="Cancel")
+        self.sim_text.set("Simulating...")
+        threading.Thread(target=run, daemon=True).start()
+        self.show_simulation()
+
+    def stop_simulation(self):
         """
-        Starts next round
+        Cancel the running simulation, its worker processes are stopped
 
         Args:
             None
@@ -549,14 +2239,14 @@ class GamePage:
         Returns:
             None
         """
-        self.timer.pause()
-        self.stop_flashing()
-        self.game_state.next_round()
-        self.refresh_round_values()
+        if self.cancel is not None:
+            self.cancel.set()
+            self.cancel = None
+        self.simulate_button.configure(text="Simulate Length")
 
-    def restart_game(self):
+    def close(self):
         """
-        Restarts game from round 1
+        Cancel any simulation and close the window
 
         Args:
             None
@@ -564,143 +2254,143 @@ class GamePage:
         Returns:
             None
         """
-        self.timer.pause()
-        self.stop_flashing()
-        self.game_state.restart_game()
-        self.refresh_round_values()
+        self.stop_simulation()
+        self.window.destroy()
 
-    def restart_timer(self):
-        self.timer.pause()
-        self.stop_flashing()
-        self.timer.time_remaining = self.timer.game_page.game_state.time * 60
-        self.timer.time_var.set(self.timer.format_time(self.timer.time_remaining))
-        self.timer.game_page.timer_button.set_text("Start Timer")
+    def show_simulation(self):
+        """
+        Show the simulation result when the worker thread has finished
+
+        Args:
+            None
 
+        Returns:
+            None
+        """
+        if not self.window.winfo_exists():
+            return
+        try:
+            cancel, result = self.results.get_nowait()
+        except queue.Empty:
+            cancel, result = None, None
+        if cancel is None or cancel is not self.cancel:
+            # nothing yet, or the result of a cancelled run
+            if self.cancel is not None:
+                self.window.after(100, self.show_simulation)
+            return
+        self.stop_simulation()
+        if isinstance(result, ValueError):
+            self.sim_text.set(str(result))
+            return
+
+        def clock(minutes):
+            return f"{int(minutes) // 60}:{int(minutes) % 60:02d}"
+
+        minutes, levels = result.finish_minutes, result.finish_level
+        text = (
+            f"{result.trials:,} simulated tournaments\n"
+            f"Length: median {clock(minutes[50])}, "
+            f"middle half {clock(minutes[25])} to {clock(minutes[75])}, "
+            f"80% between {clock(minutes[10])} and {clock(minutes[90])}\n"
+            f"Final round: median {levels[50]:.0f}, "
+            f"80% between {levels[10]:.0f} and {levels[90]:.0f}"
+        )
+        if result.cut_short:
+            text += (
+                f"\n{result.cut_short:,} were still running after "
+                f"{result.max_hours} hours and were cut short there, "
+                "the blinds may be too small for the stacks"
+            )
+        self.sim_text.set(text)
 
-class EditorPage:
+
+class PlayersWindow:
     """
-    Game editor window
+    Player tracker window
 
-    create a new game or edit an existing one
-    import or export game files as csv
+    Set prices, register players and record rebuys, add-ons and knock outs
     """
 
-    def __init__(self, ctx, new=False, from_landing_page=False):
-        window = tk.Toplevel(ctx.root)
-        self.ctx = ctx
-        self.from_landing_page = from_landing_page
-        if new:
-            window.title("New Game")
-            self.rounds = []
-        else:
-            window.title("Edit Game")
-            self.rounds = self.ctx.game_state.rounds
+    SETTINGS = (
+        ("Buy-in", "buy_in"),
+        ("Stack", "stack"),
+        ("Rebuy", "rebuy_cost"),
+        ("Rebuy Chips", "rebuy_chips"),
+        ("Add-on", "addon_cost"),
+        ("Add-on Chips", "addon_chips"),
+    )
 
+    def __init__(self, game_page):
+        window = tk.Toplevel(game_page.root)
+        window.title("Players")
         window.geometry("800x600")
         window.configure(bg=BG_COLOR)
-        window.columnconfigure((0, 1, 2, 3, 4, 5), weight=1)
-
-        round_column_heading = tk.Frame(window, bg="red")
-        round_column_heading.grid(row=0, column=1, sticky="NESW")
-        self.round_column = tk.Frame(window, bg="red")
-        self.round_column.grid(row=1, column=1, sticky="NESW")
-
-        time_column_heading = tk.Frame(window, bg="black")
-        time_column_heading.grid(row=0, column=2, sticky="NESW")
-        self.time_column = tk.Frame(window, bg="black")
-        self.time_column.grid(row=1, column=2, sticky="NESW")
-
-        s_blind_column_heading = tk.Frame(window, bg="red")
-        s_blind_column_heading.grid(row=0, column=3, sticky="NESW")
-        self.s_blind_column = tk.Frame(window, bg="red")
-        self.s_blind_column.grid(row=1, column=3, sticky="NESW")
-
-        b_blind_column_heading = tk.Frame(window, bg="black")
-        b_blind_column_heading.grid(row=0, column=4, sticky="NESW")
-        self.b_blind_column = tk.Frame(window, bg="black")
-        self.b_blind_column.grid(row=1, column=4, sticky="NESW")
-
-        round_column_label = tk.Label(
-            round_column_heading, text="Rounds:", bg="red", fg="white"
-        )
-        round_column_label.pack(fill="both", expand=True, side="left")
-        self.num_rounds_entry = tk.Entry(
-            round_column_heading, width=2, bg="red", fg="white"
-        )
-        self.num_rounds_entry.pack(fill="both", expand=True, side="right")
-        self.num_rounds_entry.insert(tk.END, len(self.rounds))
-        time_column_label = tk.Label(
-            time_column_heading, text="Time", bg="black", fg="white"
-        )
-        time_column_label.pack(fill="both", expand=True)
-        s_blind_column_label = tk.Label(
-            s_blind_column_heading, text="Small Blind", bg="red", fg="white"
-        )
-        s_blind_column_label.pack(fill="both", expand=True)
-        b_blind_column_label = tk.Label(
-            b_blind_column_heading, text="Big Blind", bg="black", fg="white"
-        )
-        b_blind_column_label.pack(fill="both", expand=True)
-
-        self.time_list = []
-        self.s_blind_list = []
-        self.b_blind_list = []
-
-        for index, r in enumerate(self.rounds):
-            tk.Label(self.round_column, text=r.num, bg="red", fg="white").pack(
-                fill="both", expand=True
+        window.columnconfigure(0, weight=1)
+        window.rowconfigure(2, weight=1)
+        self.tracker = game_page.tracker
+
+        settings_frame = tk.Frame(window, bg=BG_COLOR)
+        settings_frame.grid(row=0, column=0, sticky="EW", padx=10, pady=(10, 0))
+        self.settings = {}
+        for column, (label, attr) in enumerate(self.SETTINGS):
+            tk.Label(settings_frame, text=label, bg=BG_COLOR, fg="white").grid(
+                row=0, column=column
             )
-            self.time_list.append(
-                tk.Entry(self.time_column, width=6, bg="black", fg="white")
-            )
-            self.time_list[index].pack(fill="both", expand=True)
-            self.time_list[index].insert(tk.END, r.time)
-            self.s_blind_list.append(
-                tk.Entry(self.s_blind_column, width=10, bg="red", fg="white")
-            )
-            self.s_blind_list[index].pack(fill="both", expand=True)
-            self.s_blind_list[index].insert(tk.END, r.s_blind)
-            self.b_blind_list.append(
-                tk.Entry(self.b_blind_column, width=10, bg="black", fg="white")
-            )
-            self.b_blind_list[index].pack(fill="both", expand=True)
-            self.b_blind_list[index].insert(tk.END, r.b_blind)
-
-        button_frame = tk.Frame(window, bg=BG_COLOR)
-        button_frame.grid(row=2, column=1, columnspan=4, sticky="NESW")
-        tk.Button(
-            button_frame,
-            text="Save Game",
-            command=self.save_game,
-            bg="black",
-            fg="white",
-        ).pack(side="left", fill="both", expand=True)
-        tk.Button(
-            button_frame,
-            text="Export Game",
-            command=self.export_game,
-            bg="red",
-            fg="white",
-        ).pack(side="left", fill="both", expand=True)
+            entry = tk.Entry(settings_frame, width=10)
+            entry.insert(tk.END, getattr(self.tracker, attr))
+            entry.grid(row=1, column=column, padx=2)
+            self.settings[attr] = entry
         tk.Button(
-            button_frame,
-            text="Import Game",
-            command=self.import_game,
+            settings_frame,
+            text="Set Prices",
+            command=self.set_prices,
             bg="black",
             fg="white",
-        ).pack(side="left", fill="both", expand=True)
-        if from_landing_page:
+        ).grid(row=1, column=len(self.SETTINGS), padx=2)
+
+        action_frame = tk.Frame(window, bg=BG_COLOR)
+        action_frame.grid(row=1, column=0, sticky="EW", padx=10, pady=10)
+        self.name_entry = tk.Entry(action_frame)
+        self.name_entry.pack(side="left", fill="x", expand=True)
+        self.name_entry.bind("<Return>", lambda event: self.act(self.tracker.register))
+        for text, action, bg in (
+            ("Register", self.tracker.register, "red"),
+            ("Rebuy", self.tracker.rebuy, "black"),
+            ("Add-on", self.tracker.addon, "red"),
+            ("Knock Out", self.tracker.eliminate, "black"),
+        ):
             tk.Button(
-                button_frame,
-                text="Start Game",
-                command=lambda: GamePage(self.ctx),
-                bg="red",
+                action_frame,
+                text=text,
+                command=lambda action=action: self.act(action),
+                bg=bg,
                 fg="white",
-            ).pack(side="left", fill="both", expand=True)
+            ).pack(side="left", padx=2)
+
+        self.table = VirtualTable(
+            window,
+            (
+                ("Player", "red", 16, False),
+                ("Chips Bought", "black", 12, False),
+                ("Rebuys", "red", 6, False),
+                ("Add-ons", "black", 6, False),
+                ("Place", "red", 6, False),
+            ),
+            self.get_cell,
+            row_count=len(self.tracker.names),
+        )
+        self.table.frame.grid(row=2, column=0, sticky="NESW", padx=10)
+        self.status = tk.StringVar()
+        tk.Label(window, textvariable=self.status, bg=BG_COLOR, fg="white").grid(
+            row=3, column=0, sticky="W", padx=10, pady=(0, 10)
+        )
+        self.tracker.subscribe(self.on_tracker_event)
+        self.window = window
+        window.protocol("WM_DELETE_WINDOW", self.close)
 
-    def refresh_editor(self):
+    def close(self):
         """
-        Refresh editor screen when changes are made
+        Stop following the tracker and close the window
 
         Args:
             None
@@ -708,42 +2398,12 @@ class EditorPage:
         Returns:
             None
         """
-        for widget in self.round_column.winfo_children():
-            widget.destroy()
-        self.time_list.clear()
-        for widget in self.time_column.winfo_children():
-            widget.destroy()
-        self.s_blind_list.clear()
-        for widget in self.s_blind_column.winfo_children():
-            widget.destroy()
-        self.b_blind_list.clear()
-        for widget in self.b_blind_column.winfo_children():
-            widget.destroy()
-        self.num_rounds_entry.delete(0, tk.END)
-        self.num_rounds_entry.insert(tk.END, len(self.rounds))
-        for index, r in enumerate(self.rounds):
-            tk.Label(self.round_column, text=r.num, bg="red", fg="white").pack(
-                fill="both", expand=True
-            )
-            self.time_list.append(
-                tk.Entry(self.time_column, width=6, bg="black", fg="white")
-            )
-            self.time_list[index].pack(fill="both", expand=True)
-            self.time_list[index].insert(tk.END, r.time)
-            self.s_blind_list.append(
-                tk.Entry(self.s_blind_column, width=10, bg="red", fg="white")
-            )
-            self.s_blind_list[index].pack(fill="both", expand=True)
-            self.s_blind_list[index].insert(tk.END, r.s_blind)
-            self.b_blind_list.append(
-                tk.Entry(self.b_blind_column, width=10, bg="black", fg="white")
-            )
-            self.b_blind_list[index].pack(fill="both", expand=True)
-            self.b_blind_list[index].insert(tk.END, r.b_blind)
+        self.tracker.unsubscribe(self.on_tracker_event)
+        self.window.destroy()
 
-    def save_game(self):
+    def set_prices(self):
         """
-        Save editor values
+        Use new prices and chip amounts for purchases from now on
 
         Args:
             None
@@ -752,70 +2412,155 @@ class EditorPage:
             None
         """
         try:
-            num_rounds = int(self.num_rounds_entry.get())
+            values = {attr: int(entry.get()) for attr, entry in self.settings.items()}
         except ValueError:
-            self.num_rounds_entry.delete(0, tk.END)
-            self.num_rounds_entry.insert(tk.END, len(self.rounds))
-            num_rounds = len(self.rounds)
-        rounds = []
-        for i in range(num_rounds):
-            try:
-                rounds.append(
-                    Round(
-                        i + 1,
-                        int(self.time_list[i].get()),
-                        int(self.s_blind_list[i].get()),
-                        int(self.b_blind_list[i].get()),
-                    )
-                )
-            except IndexError:
-                rounds.append(Round(i + 1))
-            except ValueError:
-                rounds.append(Round(i + 1))
-        if self.from_landing_page:
-            self.ctx.rounds = rounds
-        else:
-            self.ctx.game_state.update_rounds(rounds)
-            self.ctx.refresh_round_values()
-        self.rounds = rounds
-        self.refresh_editor()
+            self.status.set("Prices and chips must be whole numbers")
+            return
+        for attr, value in values.items():
+            setattr(self.tracker, attr, value)
+        self.status.set("Prices set")
 
-    def export_game(self):
+    def act(self, action):
         """
-        Export game as CSV
+        Apply a tracker action to the player named in the entry
 
         Args:
+            action (callable): Tracker method taking the player name
+
+        Returns:
             None
+        """
+        name = self.name_entry.get().strip()
+        if not name:
+            return
+        try:
+            action(name)
+        except KeyError:
+            self.status.set(f"{name} is not registered")
+            return
+        except ValueError as e:
+            self.status.set(str(e))
+            return
+        self.name_entry.delete(0, tk.END)
+        self.status.set("")
+
+    def on_tracker_event(self, event, _entry):
+        """
+        Show a change to the entries, only the rows on screen are redrawn
+
+        Args:
+            event (str): Tracker event name
+            _entry (Entry): Unused
 
         Returns:
             None
         """
-        documents_dir = Path.home() / "Documents"
-        poker_dir = documents_dir / "PokerTime"
-        poker_dir.mkdir(parents=True, exist_ok=True)
+        if event == "register":
+            self.table.set_row_count(len(self.tracker.names))
+        else:
+            self.table.render()
 
-        self.save_game()
+    def get_cell(self, row, column):
+        """
+        Value shown in a cell of the players table
 
-        file = filedialog.asksaveasfilename(
-            defaultextension=".csv",
-            initialdir=poker_dir,
-            title="Choose where to save the game file.",
-            filetypes=(("CVS files", "*.csv"), ("All files", "*.*")),
+        Args:
+            row (int): Entry index
+            column (int): Column index
+
+        Returns:
+            value (str): Cell text
+        """
+        entry = self.tracker.entries[self.tracker.names[row]]
+        if column == 0:
+            return entry.name
+        if column == 1:
+            return f"{entry.chips:,}"
+        if column == 2:
+            return entry.rebuys
+        if column == 3:
+            return entry.addons
+        return "" if entry.place is None else entry.place
+
+
+class TablesWindow:
+    """
+    Seating window
+
+    Draw seats for the players still in and see where everyone sits and who
+    has to move. Knock outs, late entries and level changes update it.
+    """
+
+    def __init__(self, game_page):
+        window = tk.Toplevel(game_page.root)
+        window.title("Tables")
+        window.geometry("800x600")
+        window.configure(bg=BG_COLOR)
+        window.columnconfigure((0, 1), weight=1)
+        window.rowconfigure(1, weight=1)
+        self.game_page = game_page
+        self.seating = game_page.seating
+        self.rows = []
+
+        action_frame = tk.Frame(window, bg=BG_COLOR)
+        action_frame.grid(row=0, column=0, columnspan=2, sticky="EW", padx=10, pady=10)
+        tk.Label(action_frame, text="Seats per table", bg=BG_COLOR, fg="white").pack(
+            side="left"
         )
+        self.size_entry = tk.Entry(action_frame, width=4)
+        self.size_entry.insert(tk.END, self.seating.size)
+        self.size_entry.pack(side="left", padx=(2, 10))
+        for text, command, bg in (
+            ("Draw Seats", self.draw, "red"),
+            ("Break Tables Now", self.break_tables, "black"),
+        ):
+            tk.Button(action_frame, text=text, command=command, bg=bg, fg="white").pack(
+                side="left", padx=2
+            )
 
-        if self.from_landing_page:
-            source = self.ctx.rounds
-        else:
-            source = self.ctx.game_state.rounds
+        self.table = VirtualTable(
+            window,
+            (
+                ("Table", "red", 6, False),
+                ("Seat", "black", 6, False),
+                ("Player", "red", 16, False),
+            ),
+            self.get_cell,
+        )
+        self.table.frame.grid(row=1, column=0, sticky="NESW", padx=10)
+        self.moves = tk.StringVar()
+        tk.Label(
+            window,
+            textvariable=self.moves,
+            bg="black",
+            fg="white",
+            justify="left",
+            anchor="nw",
+        ).grid(row=1, column=1, sticky="NESW", padx=10)
+        self.status = tk.StringVar()
+        tk.Label(window, textvariable=self.status, bg=BG_COLOR, fg="white").grid(
+            row=2, column=0, columnspan=2, sticky="W", padx=10, pady=(0, 10)
+        )
+        self.window = window
+        window.protocol("WM_DELETE_WINDOW", self.close)
+        self.refresh()
 
-        if file:
-            with open(file, "w", newline="", encoding="utf-8") as f:
-                for r in source:
-                    f.write(f"{r.num},{r.time},{r.s_blind},{r.b_blind}\n")
+    def close(self):
+        """
+        Close the window, moves are still recorded while it is closed
 
-    def import_game(self):
+        Args:
+            None
+
+        Returns:
+            None
         """
-        Import a game from a CSV file
+        self.game_page.tables_window = None
+        self.window.destroy()
+
+    def draw(self):
+        """
+        Seat every player still in at random, starting the seating over
 
         Args:
             None
@@ -823,85 +2568,219 @@ class EditorPage:
         Returns:
             None
         """
-        documents_dir = Path.home() / "Documents"
-        poker_dir = documents_dir / "PokerTime"
-        poker_dir.mkdir(parents=True, exist_ok=True)
+        players = [
+            name
+            for name in self.game_page.tracker.names
+            if self.game_page.tracker.entries[name].place is None
+        ]
+        try:
+            size = int(self.size_entry.get())
+            if size < 2:
+                raise ValueError(size)
+        except ValueError:
+            self.status.set("Seats per table must be a whole number of at least 2")
+            return
+        if not players:
+            self.status.set("Register players first")
+            return
+        self.seating.size = size
+        self.seating.draw(players)
+        self.game_page.table_moves.clear()
+        self.status.set(
+            f"{len(players)} players drawn to {len(self.seating.tables)} tables"
+        )
+        self.refresh()
 
-        file = filedialog.askopenfilename(
-            initialdir=poker_dir,
-            title="Select a file",
-            filetypes=(("CVS files", "*.csv"), ("All files", "*.*")),
+    def break_tables(self):
+        """
+        Break tables that are no longer needed without waiting for the
+        next level
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if not self.seating.tables_to_break():
+            self.status.set("No table can be broken yet")
+            return
+        self.status.set("")
+        self.game_page.on_table_moves(self.seating.break_tables())
+
+    def refresh(self):
+        """
+        Show the current seats and the latest moves
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.rows = [
+            (number, seat + 1, player)
+            for number, table in sorted(self.seating.tables.items())
+            for seat, player in enumerate(table.seats)
+            if player is not None
+        ]
+        self.table.set_row_count(len(self.rows))
+        self.moves.set(
+            "Moves, latest first\n\n"
+            + "\n".join(
+                f"{move.player}: new, table {move.to_table} seat {move.to_seat + 1}"
+                if move.from_table is None
+                else f"{move.player}: table {move.from_table} seat "
+                f"{move.from_seat + 1} to table {move.to_table} seat {move.to_seat + 1}"
+                for move in self.game_page.table_moves
+            )
         )
 
-        rounds = []
+    def get_cell(self, row, column):
+        """
+        Value shown in a cell of the seats table
 
-        if file:
-            with open(file, "r", encoding="utf-8") as f:
-                for row in csv.reader(f):
-                    rounds.append(
-                        Round(int(row[0]), int(row[1]), int(row[2]), int(row[3]))
-                    )
+        Args:
+            row (int): Seat index, sorted by table and seat
+            column (int): Column index
 
-        if self.from_landing_page:
-            self.ctx.rounds = rounds
-        else:
-            self.ctx.game_state.update_rounds(rounds)
-            self.ctx.refresh_round_values()
-        self.rounds = rounds
-        self.refresh_editor()
+        Returns:
+            value (str): Cell text
+        """
+        return self.rows[row][column]
 
 
-class GameOverview:
+class DealCalculator:
     """
-    Basic overview page to see all round data
+    Deal calculator window
+
+    Shows each player's ICM equity and chip chop share for a final table
     """
 
-    def __init__(self, root, rounds):
+    def __init__(self, root):
         window = tk.Toplevel(root)
-        window.title("Game Overview")
+        window.title("Deal Calculator")
         window.geometry("800x600")
         window.configure(bg=BG_COLOR)
-
-        window.columnconfigure((0, 1, 2, 3), weight=1)
-        for i in range(len(rounds)):
-            window.rowconfigure(i, weight=1)
-
-        round_column = tk.Frame(window, bg="red")
-        round_column.grid(row=0, column=0, rowspan=len(rounds), sticky="NESW")
-        time_column = tk.Frame(window, bg="black")
-        time_column.grid(row=0, column=1, rowspan=len(rounds), sticky="NESW")
-        s_blind_column = tk.Frame(window, bg="red")
-        s_blind_column.grid(row=0, column=2, rowspan=len(rounds), sticky="NESW")
-        b_blind_column = tk.Frame(window, bg="black")
-        b_blind_column.grid(row=0, column=3, rowspan=len(rounds), sticky="NESW")
-
-        tk.Label(round_column, text="Round", bg="red", fg="white").grid(
-            row=0, column=0, padx=10, pady=10, sticky="NSWE"
-        )
-        tk.Label(time_column, text="Time", bg="black", fg="white").grid(
-            row=0, column=1, padx=10, pady=10, sticky="NSWE"
+        window.columnconfigure(1, weight=1)
+        window.rowconfigure(1, weight=1)
+        self.window = window
+        self.names = []
+        self.stacks = []
+        self.result = None
+        self.chop = None
+
+        tk.Label(
+            window,
+            text="Stacks, one player per line\n(name: chips or just chips)",
+            bg=BG_COLOR,
+            fg="white",
+        ).grid(row=0, column=0, sticky="W", padx=10, pady=(10, 0))
+        self.stack_text = tk.Text(window, width=24)
+        self.stack_text.grid(row=1, column=0, rowspan=3, sticky="NS", padx=10, pady=10)
+
+        payout_frame = tk.Frame(window, bg=BG_COLOR)
+        payout_frame.grid(row=0, column=1, sticky="EW", padx=10, pady=(10, 0))
+        tk.Label(payout_frame, text="Payouts", bg=BG_COLOR, fg="white").pack(
+            side="left"
         )
-        tk.Label(s_blind_column, text="Small Blind", bg="red", fg="white").grid(
-            row=0, column=2, padx=10, pady=10, sticky="NSWE"
+        self.payout_entry = tk.Entry(payout_frame)
+        self.payout_entry.pack(side="left", fill="x", expand=True, padx=10)
+        tk.Button(
+            payout_frame,
+            text="Calculate",
+            command=self.calculate,
+            bg="black",
+            fg="white",
+        ).pack(side="left")
+
+        self.table = VirtualTable(
+            window,
+            (
+                ("Player", "red", 12, False),
+                ("Chips", "black", 10, False),
+                ("ICM", "red", 10, False),
+                ("+/-", "black", 8, False),
+                ("Chip Chop", "red", 10, False),
+            ),
+            self.get_cell,
         )
-        tk.Label(b_blind_column, text="Big Blind", bg="black", fg="white").grid(
-            row=0, column=3, padx=10, pady=10, sticky="NSWE"
+        self.table.frame.grid(row=1, column=1, sticky="NESW", padx=10, pady=10)
+        self.status = tk.StringVar()
+        tk.Label(window, textvariable=self.status, bg=BG_COLOR, fg="white").grid(
+            row=2, column=1, sticky="W", padx=10, pady=(0, 10)
         )
 
-        for index, r in enumerate(rounds):
-            tk.Label(round_column, text=r.num, bg="red", fg="white").grid(
-                row=index + 1, column=0, padx=10, pady=10, sticky="NSWE"
-            )
-            tk.Label(time_column, text=r.time, bg="black", fg="white").grid(
-                row=index + 1, column=1, padx=10, pady=10, sticky="NSWE"
-            )
-            tk.Label(s_blind_column, text=r.s_blind, bg="red", fg="white").grid(
-                row=index + 1, column=2, padx=10, pady=10, sticky="NSWE"
-            )
-            tk.Label(b_blind_column, text=r.b_blind, bg="black", fg="white").grid(
-                row=index + 1, column=3, padx=10, pady=10, sticky="NSWE"
-            )
+    def read_stacks(self):
+        """
+        Parse the stacks box
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.names, self.stacks = [], []
+        for line in self.stack_text.get("1.0", tk.END).splitlines():
+            if not line.strip():
+                continue
+            name, chips = parse_stack_line(line)
+            self.stacks.append(chips)
+            self.names.append(name or f"Player {len(self.stacks)}")
+
+    def calculate(self):
+        """
+        Work out the deal and show it in the table
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        from icm import chip_chop, icm  # pylint: disable=import-outside-toplevel
+
+        try:
+            self.read_stacks()
+            payouts = [
+                float(payout)
+                for payout in self.payout_entry.get().replace(" ", "").split(",")
+                if payout
+            ]
+            self.result = icm(self.stacks, payouts)
+            self.chop = chip_chop(self.stacks, payouts)
+        except ValueError:
+            self.status.set("Enter whole chip counts and payouts separated by commas")
+            self.result = None
+            self.table.set_row_count(0)
+            return
+        method = "exact" if self.result.exact else "estimated, +/- is a 95% range"
+        self.status.set(f"{len(self.stacks)} players, ICM {method}")
+        self.table.set_row_count(len(self.stacks))
+
+    def get_cell(self, row, column):
+        """
+        Value shown in a cell of the results table
+
+        Args:
+            row (int): Player index
+            column (int): Column index
+
+        Returns:
+            value (str): Cell text
+        """
+        if column == 0:
+            return self.names[row]
+        if column == 1:
+            return f"{self.stacks[row]:,}"
+        if column == 2:
+            return f"{self.result.equity[row]:,.2f}"
+        if column == 3:
+            return f"{self.result.error[row]:,.2f}" if not self.result.exact else ""
+        return f"{self.chop[row]:,.2f}"
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     PokerTime()
@@ -0,0 +1,284 @@
+"""
+Timing instrumentation for Poker Time
+
+Records tick jitter, how long callbacks take and how late the Tk event loop
+runs timers, as histograms served in the Prometheus text format.
+
+Nothing is measured unless the instrument_* functions are called. They wrap
+the methods to time when instrumentation is turned on, so when it is off the
+app runs the original methods untouched. The app only imports this module
+when instrumentation is turned on, and the HTTP server is only imported
+when the endpoint is started.
+"""
+
+import bisect
+import functools
+import threading
+import time
+
+BUCKETS_MS = (0.25, 0.5, 1, 2, 4, 8, 16, 33, 50, 100, 250, 500, 1000)
+LOOP_PROBE_MS = 100
+DEFAULT_PORT = 9109
+
+
+class Histogram:
+    """
+    Cumulative histogram with fixed bucket bounds in milliseconds
+    """
+
+    def __init__(self, buckets=BUCKETS_MS):
+        self.bounds = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+        self.max = 0.0
+
+    def observe(self, value):
+        """
+        Record one measurement
+
+        Args:
+            value (float): Measurement in milliseconds
+
+        Returns:
+            None
+        """
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.sum += value
+        self.count += 1
+        self.max = max(self.max, value)
+
+    def quantile(self, q):
+        """
+        Upper bound of the bucket holding a quantile
+
+        Args:
+            q (float): Quantile between 0 and 1
+
+        Returns:
+            bound (float): Bucket bound, the largest value seen past the last bucket
+        """
+        target = q * self.count
+        seen = 0
+        for bound, count in zip(self.bounds, self.counts):
+            seen += count
+            if seen >= target and seen:
+                return bound
+        return self.max
+
+
+class Metrics:
+    """
+    Named histograms, each optionally split by one label
+    """
+
+    def __init__(self, prefix="poker_time"):
+        self.prefix = prefix
+        self.families = {}
+        self.lock = threading.Lock()
+
+    def histogram(self, name, description, label=None):
+        """
+        Get or create a histogram
+
+        Args:
+            name (str): Metric name without the prefix
+            description (str): Help text
+            label (tuple, optional): Label name and value
+
+        Returns:
+            histogram (Histogram): Histogram to observe into
+        """
+        with self.lock:
+            family = self.families.setdefault(name, (description, {}))
+            return family[1].setdefault(label, Histogram())
+
+    def render(self):
+        """
+        Every histogram in the Prometheus text format
+
+        Args:
+            None
+
+        Returns:
+            text (str): Exposition text
+        """
+        lines = []
+        with self.lock:
+            families = [(n, d, dict(h)) for n, (d, h) in self.families.items()]
+        for name, description, histograms in families:
+            metric = f"{self.prefix}_{name}"
+            lines.append(f"# HELP {metric} {description}")
+            lines.append(f"# TYPE {metric} histogram")
+            for label, histogram in histograms.items():
+                labels = f'{label[0]}="{label[1]}",' if label else ""
+                seen = 0
+                for bound, count in zip(histogram.bounds, histogram.counts):
+                    seen += count
+                    lines.append(f'{metric}_bucket{{{labels}le="{bound}"}} {seen}')
+                lines.append(f'{metric}_bucket{{{labels}le="+Inf"}} {histogram.count}')
+                braces = f"{{{labels.rstrip(',')}}}" if labels else ""
+                lines.append(f"{metric}_sum{braces} {histogram.sum:.3f}")
+                lines.append(f"{metric}_count{braces} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def summary(self):
+        """
+        Short text for the debug overlay
+
+        Args:
+            None
+
+        Returns:
+            text (str): One line per histogram with its median, p99 and max
+        """
+        lines = []
+        with self.lock:
+            families = [(n, dict(h)) for n, (_, h) in self.families.items()]
+        for name, histograms in families:
+            for label, histogram in histograms.items():
+                title = f"{name} {label[1]}" if label else name
+                lines.append(
+                    f"{title}: p50 {histogram.quantile(0.5)} "
+                    f"p99 {histogram.quantile(0.99)} "
+                    f"max {histogram.max:.1f} ms (n={histogram.count})"
+                )
+        return "\n".join(lines)
+
+
+def timed(method, histogram):
+    """
+    Wrap a method so every call is timed into a histogram
+
+    Args:
+        method (callable): Function to wrap
+        histogram (Histogram): Histogram for the call durations
+
+    Returns:
+        wrapper (callable): Timed function
+    """
+
+    @functools.wraps(method)
+    def wrapper(*args, **kwargs):
+        started = time.perf_counter()
+        try:
+            return method(*args, **kwargs)
+        finally:
+            histogram.observe((time.perf_counter() - started) * 1000)
+
+    return wrapper
+
+
+def instrument_callbacks(metrics, callbacks):
+    """
+    Time methods of classes as callbacks
+
+    Args:
+        metrics (Metrics): Registry
+        callbacks (dict): Callback label to (class, method name)
+
+    Returns:
+        None
+    """
+    for label, (cls, name) in callbacks.items():
+        histogram = metrics.histogram(
+            "callback_ms", "Time spent in UI callbacks", ("callback", label)
+        )
+        setattr(cls, name, timed(getattr(cls, name), histogram))
+
+
+def instrument_ticks(metrics, countdown_cls):
+    """
+    Record how late every countdown tick runs
+
+    Args:
+        metrics (Metrics): Registry
+        countdown_cls (type): Countdown class to wrap
+
+    Returns:
+        None
+    """
+    histogram = metrics.histogram("tick_jitter_ms", "Lateness of clock ticks")
+    tick = countdown_cls.tick
+
+    @functools.wraps(tick)
+    def wrapper(self):
+        remaining = tick(self)
+        if self.expected_tick is not None:
+            histogram.observe(self.last_lag * 1000)
+        return remaining
+
+    countdown_cls.tick = wrapper
+
+
+def probe_loop(metrics, root, interval=LOOP_PROBE_MS):
+    """
+    Measure Tk event loop lag with an after() timer that checks how late it runs
+
+    Args:
+        metrics (Metrics): Registry
+        root (tk.Tk): Tk root window
+        interval (int, optional): Probe interval in milliseconds
+
+    Returns:
+        None
+    """
+    histogram = metrics.histogram("loop_lag_ms", "Lateness of Tk after() timers")
+    expected = [time.perf_counter() + interval / 1000]
+
+    def probe():
+        now = time.perf_counter()
+        histogram.observe(max(0.0, now - expected[0]) * 1000)
+        expected[0] = now + interval / 1000
+        root.after(interval, probe)
+
+    root.after(interval, probe)
+
+
+def serve(metrics, port=DEFAULT_PORT, host="127.0.0.1"):
+    """
+    Serve /metrics on a background thread
+
+    Args:
+        metrics (Metrics): Registry
+        port (int, optional): Port, 0 picks a free one
+        host (str, optional): Address to listen on
+
+    Returns:
+        server (ThreadingHTTPServer): Running server
+    """
+    # pylint: disable-next=import-outside-toplevel
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        """
+        Answers GET /metrics
+        """
+
+        def do_GET(self):  # pylint: disable=invalid-name
+            """
+            Send the metrics text
+
+            Args:
+                None
+
+            Returns:
+                None
+            """
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body = metrics.render().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):  # pylint: disable=arguments-differ
+            """Keep requests out of the console"""
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
@@ -0,0 +1,324 @@
+"""
+Remote control for Poker Time
+
+Listens on a TCP or Unix socket for one command per line:
+
+    pause, resume, toggle, next, previous, reset, restart,
+    seek <h:mm or h:mm:ss>, add <[-]m:ss or seconds>, state, ping
+
+Connections are read on background threads and the commands handed to the
+Tk thread through a queue that it polls once per frame, so a slow or silent
+client never blocks the clock. Every command is answered once it has been
+applied and drawn with "ok <round> <seconds left>" or "error <reason>".
+
+Anyone who can reach a TCP address other than loopback could drive the
+clock, so there the first line of every connection must be "auth <token>".
+The token is POKER_TIME_REMOTE_TOKEN, or a random one printed at startup.
+"""
+
+import hmac
+import ipaddress
+import os
+import queue
+import secrets
+import socket
+import threading
+
+from clock import parse_clock_time
+
+DEFAULT_ADDRESS = ("127.0.0.1", 8766)
+FRAME_MS = 8
+
+
+def parse_seconds(text):
+    """
+    Parse a time as seconds, h:mm:ss, or mm:ss, with an optional sign
+
+    Args:
+        text (str): Time text such as "90", "-1:00" or "1:30:00"
+
+    Returns:
+        seconds (int): Time in seconds
+    """
+    text = text.strip()
+    sign = -1 if text.startswith("-") else 1
+    parts = [int(part) for part in text.lstrip("+-").split(":")]
+    if not 1 <= len(parts) <= 3 or min(parts) < 0:
+        raise ValueError(text)
+    seconds = 0
+    for part in parts:
+        seconds = seconds * 60 + part
+    return sign * seconds
+
+
+def parse_address(text):
+    """
+    Read a listen address, a path for a Unix socket or host:port for TCP
+
+    Args:
+        text (str): Address text, "1" for the default address, the default
+            port if only a host is given
+
+    Returns:
+        address (str|tuple): Socket path or host and port, ValueError if the
+            port is not a port number
+    """
+    if text in ("", "1"):
+        return DEFAULT_ADDRESS
+    if "/" in text or os.sep in text:
+        return text
+    host, colon, port = text.rpartition(":")
+    if not colon:
+        return (text, DEFAULT_ADDRESS[1])
+    if not port.isdigit() or not 0 <= int(port) <= 65535:
+        raise ValueError(f"{text} is not an address like host:port")
+    return (host or DEFAULT_ADDRESS[0], int(port))
+
+
+def is_loopback(address):
+    """
+    Whether only this machine can reach an address
+
+    Args:
+        address (str|tuple): Socket path or host and port
+
+    Returns:
+        loopback (bool): True for Unix sockets and loopback TCP addresses
+    """
+    if isinstance(address, str):
+        return True
+    try:
+        return ipaddress.ip_address(address[0]).is_loopback
+    except ValueError:
+        return False
+
+
+class RemoteControl:
+    """
+    Socket listener driving a TournamentClock
+
+    Only poll() touches the clock, it has to be called from the thread that
+    owns the clock, attach() does that from the Tk event loop
+    """
+
+    def __init__(self, address=DEFAULT_ADDRESS, tournament_clock=None, token=None):
+        self.address = address
+        self.clock = tournament_clock
+        self.token = token
+        self.commands = queue.SimpleQueue()
+        self.server = None
+        self.root = None
+        self.after_id = None
+
+    def start(self):
+        """
+        Open the socket and start accepting connections on a background thread
+
+        Args:
+            None
+
+        Returns:
+            address (str|tuple): Address actually listened on
+        """
+        if isinstance(self.address, str):
+            if os.path.exists(self.address):
+                os.unlink(self.address)
+            self.server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        else:
+            self.server = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.server.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.server.bind(self.address)
+        self.server.listen()
+        self.address = self.server.getsockname()
+        if self.token is None and not is_loopback(self.address):
+            self.token = secrets.token_urlsafe(16)
+        threading.Thread(target=self.accept_loop, daemon=True).start()
+        return self.address
+
+    def accept_loop(self):
+        """
+        Accept connections and read each on its own thread
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        while True:
+            try:
+                conn, _ = self.server.accept()
+            except OSError:
+                return
+            if conn.family != getattr(socket, "AF_UNIX", None):
+                conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            threading.Thread(target=self.read_loop, args=(conn,), daemon=True).start()
+
+    def is_authorized(self, line):
+        """
+        Whether the first line of a connection carries the token
+
+        Args:
+            line (str): First line the client sent
+
+        Returns:
+            authorized (bool): True if no token is needed or it matches
+        """
+        if self.token is None:
+            return True
+        name, _, token = line.strip().partition(" ")
+        return name.lower() == "auth" and hmac.compare_digest(
+            token.strip().encode(), self.token.encode()
+        )
+
+    def read_loop(self, conn):
+        """
+        Queue every line a client sends, once it has sent the token if one
+        is needed
+
+        Args:
+            conn (socket): Client connection
+
+        Returns:
+            None
+        """
+        with conn, conn.makefile("r", encoding="utf-8", newline="\n") as lines:
+            try:
+                if self.token is not None:
+                    if not self.is_authorized(lines.readline()):
+                        conn.sendall(b"error bad token\n")
+                        return
+                    conn.sendall(b"ok auth\n")
+                for line in lines:
+                    if line.strip():
+                        self.commands.put((line.strip(), conn))
+            except (OSError, UnicodeDecodeError):
+                pass
+
+    def attach(self, root):
+        """
+        Poll for commands from a Tk event loop once per frame
+
+        Args:
+            root (tk.Tk): Tk root window
+
+        Returns:
+            None
+        """
+        self.root = root
+        self.on_after()
+
+    def on_after(self):
+        """
+        Tk after() callback, polls and schedules the next frame
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        answered = self.poll(reply=False)
+        if answered:
+            self.root.update_idletasks()
+            self.reply(answered)
+        self.after_id = self.root.after(FRAME_MS, self.on_after)
+
+    def poll(self, reply=True):
+        """
+        Run every queued command, never waits for more
+
+        Args:
+            reply (bool, optional): Answer each command, False to leave the
+                answers to the caller
+
+        Returns:
+            answered (arr[tuple]): Connection and answer for every command run
+        """
+        answered = []
+        while True:
+            try:
+                line, conn = self.commands.get_nowait()
+            except queue.Empty:
+                break
+            answered.append((conn, self.run_command(line)))
+        if reply:
+            self.reply(answered)
+        return answered
+
+    @staticmethod
+    def reply(answered):
+        """
+        Send answers back to the clients that asked
+
+        Args:
+            answered (arr[tuple]): Connection and answer pairs from poll()
+
+        Returns:
+            None
+        """
+        for conn, answer in answered:
+            try:
+                conn.sendall(answer.encode("utf-8") + b"\n")
+            except OSError:
+                pass
+
+    def run_command(self, line):
+        """
+        Apply one command to the clock
+
+        Args:
+            line (str): Command line
+
+        Returns:
+            answer (str): Reply for the client
+        """
+        name, _, arg = line.partition(" ")
+        name = name.lower()
+        clock = self.clock
+        if clock is None:
+            return "error no game"
+        try:
+            if name == "pause":
+                clock.pause()
+            elif name == "resume":
+                clock.start()
+            elif name == "toggle":
+                clock.toggle()
+            elif name == "next":
+                clock.next_round()
+            elif name == "previous":
+                clock.previous_round()
+            elif name == "reset":
+                clock.reset_timer()
+            elif name == "restart":
+                clock.restart_game()
+            elif name == "seek":
+                clock.seek(parse_clock_time(arg))
+            elif name == "add":
+                clock.add_time(parse_seconds(arg))
+            elif name not in ("state", "ping"):
+                return f"error unknown command {name}"
+        except ValueError:
+            return f"error bad time {arg.strip()}"
+        remaining = clock.countdown.remaining_seconds()
+        return f"ok {clock.game_state.round_num} {remaining}"
+
+    def close(self):
+        """
+        Stop listening
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+        if self.server is not None:
+            self.server.close()
+            if isinstance(self.address, str) and os.path.exists(self.address):
+                os.unlink(self.address)
+            self.server = None
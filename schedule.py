@@ -0,0 +1,378 @@
+"""
+Blind schedule storage for Poker Time
+
+Levels are stored column by column in typed arrays instead of one object per
+level, so large schedules stay small and load or save without creating
+objects for every row.
+"""
+
+from array import array
+
+COLUMNS = {
+    "num": "nums",
+    "time": "times",
+    "s_blind": "s_blinds",
+    "b_blind": "b_blinds",
+    "ante": "antes",
+    "is_break": "breaks",
+}
+MAX_VALUE = 2**63 - 1
+
+
+class TimeIndex:
+    """
+    Running total of level lengths in seconds
+
+    A Fenwick tree, so both finding the level at a point in the tournament
+    and changing the length of one level are O(log n)
+    """
+
+    def __init__(self, durations=()):
+        self.values = list(durations)
+        self.tree = [0] + self.values
+        size = len(self.tree)
+        for i in range(1, size):
+            parent = i + (i & -i)
+            if parent < size:
+                self.tree[parent] += self.tree[i]
+        self.top = 1 << (size - 1).bit_length() if size > 1 else 0
+
+    def __len__(self):
+        return len(self.values)
+
+    def update(self, index, value):
+        """
+        Set the length of one level
+
+        Args:
+            index (int): Level index
+            value (int): New length in seconds
+
+        Returns:
+            None
+        """
+        delta = value - self.values[index]
+        self.values[index] = value
+        i = index + 1
+        while i < len(self.tree):
+            self.tree[i] += delta
+            i += i & -i
+
+    def append(self, value):
+        """
+        Add a level to the end
+
+        Args:
+            value (int): Length in seconds
+
+        Returns:
+            None
+        """
+        i = len(self.tree)
+        self.tree.append(value + self.start(i - 1) - self.start(i - (i & -i)))
+        self.values.append(value)
+        if i >= self.top:
+            self.top = 1 << i.bit_length()
+
+    def start(self, index):
+        """
+        Seconds from the start of the tournament to the start of a level
+
+        Args:
+            index (int): Level index, len() gives the total length
+
+        Returns:
+            seconds (int): Sum of the lengths of every earlier level
+        """
+        total = 0
+        i = index
+        while i > 0:
+            total += self.tree[i]
+            i -= i & -i
+        return total
+
+    def total(self):
+        """
+        Length of the whole schedule
+
+        Args:
+            None
+
+        Returns:
+            seconds (int): Sum of every level length
+        """
+        return self.start(len(self.values))
+
+    def find(self, elapsed):
+        """
+        Level that is running a given time into the tournament
+
+        Args:
+            elapsed (float): Seconds since the start of the first level
+
+        Returns:
+            position (tuple): Level index and seconds already played in it
+        """
+        if not self.values:
+            raise IndexError("schedule is empty")
+        index = 0
+        remaining = max(0, elapsed)
+        step = self.top
+        while step:
+            probe = index + step
+            if probe < len(self.tree) and self.tree[probe] <= remaining:
+                index = probe
+                remaining -= self.tree[probe]
+            step >>= 1
+        if index >= len(self.values):
+            last = len(self.values) - 1
+            return last, self.values[last]
+        return index, remaining
+
+
+class Round:
+    """
+    Round object
+
+    A single level, handed out by BlindSchedule when one level is needed
+    """
+
+    __slots__ = ("ante", "b_blind", "is_break", "num", "s_blind", "time")
+
+    def __init__(self, num, time=0, s_blind=0, b_blind=0, ante=0, is_break=False):
+        self.num = num
+        self.time = time
+        self.s_blind = s_blind
+        self.b_blind = b_blind
+        self.ante = ante
+        self.is_break = is_break
+
+    def __str__(self):
+        return f"Round: {self.num}\nTime: {self.time}\nSmall Blind: {self.s_blind}\nBig Blind: {self.b_blind}"
+
+
+class BlindSchedule:
+    """
+    Column oriented list of levels
+
+    Supports len(), indexing (returns a Round), slicing (returns a new
+    BlindSchedule) and iteration like the list of rounds it replaces
+    """
+
+    __slots__ = tuple(COLUMNS.values()) + ("index",)
+
+    def __init__(self, rounds=()):
+        self.index = None
+        self.nums = array("q")
+        self.times = array("q")
+        self.s_blinds = array("q")
+        self.b_blinds = array("q")
+        self.antes = array("q")
+        self.breaks = array("b")
+        for r in rounds:
+            self.append(
+                r.num,
+                r.time,
+                r.s_blind,
+                r.b_blind,
+                getattr(r, "ante", 0),
+                getattr(r, "is_break", False),
+            )
+
+    @classmethod
+    def from_columns(cls, nums, times, s_blinds, b_blinds, antes=None, breaks=None):
+        """
+        Build a schedule from whole columns
+
+        Args:
+            nums (iter[int]): Round numbers
+            times (iter[int]): Round lengths in minutes
+            s_blinds (iter[int]): Small blinds
+            b_blinds (iter[int]): Big blinds
+            antes (iter[int], optional): Antes, zero if not given
+            breaks (iter[bool], optional): Break flags, False if not given
+
+        Returns:
+            schedule (BlindSchedule): New schedule
+        """
+        schedule = cls()
+        schedule.nums.extend(nums)
+        schedule.times.extend(times)
+        schedule.s_blinds.extend(s_blinds)
+        schedule.b_blinds.extend(b_blinds)
+        size = len(schedule.nums)
+        schedule.antes.extend(antes if antes is not None else [0] * size)
+        schedule.breaks.extend(breaks if breaks is not None else [0] * size)
+        return schedule
+
+    def __len__(self):
+        return len(self.nums)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            schedule = BlindSchedule()
+            for name in COLUMNS.values():
+                setattr(schedule, name, getattr(self, name)[index])
+            return schedule
+        return Round(
+            self.nums[index],
+            self.times[index],
+            self.s_blinds[index],
+            self.b_blinds[index],
+            self.antes[index],
+            bool(self.breaks[index]),
+        )
+
+    def __iter__(self):
+        for index in range(len(self.nums)):
+            yield self[index]
+
+    def __eq__(self, other):
+        if not isinstance(other, BlindSchedule):
+            return NotImplemented
+        return all(getattr(self, n) == getattr(other, n) for n in COLUMNS.values())
+
+    def append(self, num, time=0, s_blind=0, b_blind=0, ante=0, is_break=False):
+        """
+        Add a level to the end of the schedule
+
+        Args:
+            num (int): Round number
+            time (int, optional): Round length in minutes
+            s_blind (int, optional): Small blind
+            b_blind (int, optional): Big blind
+            ante (int, optional): Ante
+            is_break (bool, optional): True if the level is a break
+
+        Returns:
+            None
+        """
+        self.nums.append(num)
+        self.times.append(time)
+        self.s_blinds.append(s_blind)
+        self.b_blinds.append(b_blind)
+        self.antes.append(ante)
+        self.breaks.append(1 if is_break else 0)
+        if self.index is not None:
+            self.index.append(time * 60)
+
+    def column(self, field):
+        """
+        Array holding one field for every level
+
+        Args:
+            field (str): Field name such as "time" or "b_blind"
+
+        Returns:
+            column (array): The column itself, not a copy
+        """
+        return getattr(self, COLUMNS[field])
+
+    def set_level(self, index, **fields):
+        """
+        Change fields of one level
+
+        Args:
+            index (int): Level index
+            fields (dict): Field names and new values
+
+        Returns:
+            None
+        """
+        for field, value in fields.items():
+            self.column(field)[index] = int(value)
+        if "time" in fields and self.index is not None:
+            self.index.update(index, self.times[index] * 60)
+
+    def set_column(self, field, values, start=0):
+        """
+        Overwrite a run of one field in a single operation
+
+        Args:
+            field (str): Field name
+            values (iter[int]): New values
+            start (int, optional): First level to overwrite
+
+        Returns:
+            None
+        """
+        column = self.column(field)
+        values = array(column.typecode, values)
+        column[start : start + len(values)] = values
+        if field == "time" and self.index is not None:
+            if len(values) * 8 > len(column):
+                self.index = None
+            else:
+                for offset, value in enumerate(values):
+                    self.index.update(start + offset, value * 60)
+
+    def time_index(self):
+        """
+        Running total of level lengths, built on first use and then kept up
+        to date by append, set_level and set_column
+
+        Args:
+            None
+
+        Returns:
+            index (TimeIndex): Index over the level lengths in seconds
+        """
+        if self.index is None:
+            self.index = TimeIndex(time * 60 for time in self.times)
+        return self.index
+
+    def copy(self):
+        """
+        Independent copy of the schedule
+
+        Args:
+            None
+
+        Returns:
+            schedule (BlindSchedule): Copy
+        """
+        return self[:]
+
+    def rows(self):
+        """
+        Iterate levels as plain tuples without creating Round objects
+
+        Args:
+            None
+
+        Returns:
+            rows (iter[tuple]): num, time, s_blind, b_blind, ante, is_break
+        """
+        return zip(
+            self.nums, self.times, self.s_blinds, self.b_blinds, self.antes, self.breaks
+        )
+
+    def write_csv(self, f):
+        """
+        Write the schedule in the game file format
+
+        Args:
+            f (file): Open text file
+
+        Returns:
+            None
+        """
+        f.writelines(
+            f"{num},{time},{s_blind},{b_blind},{ante},{is_break}\n"
+            for num, time, s_blind, b_blind, ante, is_break in self.rows()
+        )
+
+
+def as_schedule(rounds):
+    """
+    Accept a BlindSchedule or any iterable of rounds
+
+    Args:
+        rounds (BlindSchedule|arr[Round]): Levels
+
+    Returns:
+        schedule (BlindSchedule): The schedule itself or a new one
+    """
+    if isinstance(rounds, BlindSchedule):
+        return rounds
+    return BlindSchedule(rounds)
@@ -0,0 +1,247 @@
+"""
+Shared scheduler for running many tournament clocks in one process
+
+Each running clock has one entry in a heap keyed by the time its display is
+next due to change, so work is done per tick that fires rather than per clock.
+"""
+
+import heapq
+import itertools
+import math
+import time
+
+from clock import TournamentClock
+
+
+class ClockScheduler:
+    """
+    Heap of next-due deadlines for any number of TournamentClocks
+
+    Entries are never removed from the middle of the heap. When a clock is
+    paused, reset or changes level its generation is bumped and older entries
+    are dropped as they reach the top.
+    """
+
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self.heap = []
+        self.generations = {}
+        self.callbacks = {}
+        self.sequence = itertools.count()
+        self.root = None
+        self.after_id = None
+        self.after_due = None
+        self.in_run = False
+
+    def add_clock(self, rounds):
+        """
+        Create a clock driven by this scheduler
+
+        Args:
+            rounds (BlindSchedule): Rounds for the new clock
+
+        Returns:
+            tournament_clock (TournamentClock): The new clock
+        """
+        tournament_clock = TournamentClock(rounds, self.clock)
+        self.register(tournament_clock)
+        return tournament_clock
+
+    def register(self, tournament_clock):
+        """
+        Drive an existing clock from this scheduler
+
+        Args:
+            tournament_clock (TournamentClock): Clock to drive
+
+        Returns:
+            None
+        """
+
+        def on_event(event, _state):
+            if event != "tick":
+                self.reschedule(tournament_clock)
+
+        self.generations[tournament_clock] = 0
+        self.callbacks[tournament_clock] = tournament_clock.subscribe(on_event)
+        self.reschedule(tournament_clock)
+
+    def remove(self, tournament_clock):
+        """
+        Stop driving a clock, its pending entries are discarded lazily
+
+        Args:
+            tournament_clock (TournamentClock): Clock to remove
+
+        Returns:
+            None
+        """
+        if tournament_clock in self.generations:
+            tournament_clock.unsubscribe(self.callbacks.pop(tournament_clock))
+            del self.generations[tournament_clock]
+            self.wake()
+
+    def __len__(self):
+        return len(self.generations)
+
+    def reschedule(self, tournament_clock):
+        """
+        Replace the pending entry of a clock with its next due time
+
+        Args:
+            tournament_clock (TournamentClock): Clock to reschedule
+
+        Returns:
+            None
+        """
+        if tournament_clock not in self.generations:
+            return
+        generation = self.generations[tournament_clock] + 1
+        self.generations[tournament_clock] = generation
+        delay = tournament_clock.next_tick_delay()
+        if delay is not None:
+            heapq.heappush(
+                self.heap,
+                (
+                    self.clock() + delay / 1000,
+                    next(self.sequence),
+                    generation,
+                    tournament_clock,
+                ),
+            )
+        self.wake()
+
+    def is_current(self, entry):
+        """
+        Check whether a heap entry still belongs to a live schedule
+
+        Args:
+            entry (tuple): Heap entry
+
+        Returns:
+            current (bool): False if the entry has been superseded
+        """
+        return self.generations.get(entry[3]) == entry[2]
+
+    def next_due(self):
+        """
+        Time the next live entry is due, dropping stale entries on the way
+
+        Args:
+            None
+
+        Returns:
+            due (float|None): Due time on the scheduler clock or None if idle
+        """
+        heap = self.heap
+        while heap and not self.is_current(heap[0]):
+            heapq.heappop(heap)
+        return heap[0][0] if heap else None
+
+    def next_delay(self):
+        """
+        Milliseconds until the next entry is due
+
+        Args:
+            None
+
+        Returns:
+            delay (int|None): Delay in milliseconds or None if idle
+        """
+        due = self.next_due()
+        if due is None:
+            return None
+        return max(0, math.ceil((due - self.clock()) * 1000))
+
+    def run_due(self):
+        """
+        Update every clock whose entry is due
+
+        Args:
+            None
+
+        Returns:
+            fired (int): Number of clocks updated
+        """
+        heap = self.heap
+        now = self.clock()
+        fired = 0
+        self.in_run = True
+        try:
+            while heap and heap[0][0] <= now:
+                entry = heapq.heappop(heap)
+                if not self.is_current(entry):
+                    continue
+                entry[3].update()
+                self.reschedule(entry[3])
+                fired += 1
+        finally:
+            self.in_run = False
+        self.wake()
+        return fired
+
+    def run(self, sleep=time.sleep):
+        """
+        Drive all clocks without a GUI until none are running
+
+        Args:
+            sleep (func, optional): Sleep function taking seconds
+
+        Returns:
+            None
+        """
+        delay = self.next_delay()
+        while delay is not None:
+            sleep(delay / 1000)
+            self.run_due()
+            delay = self.next_delay()
+
+    def attach(self, root):
+        """
+        Drive the scheduler from a Tk event loop with a single after() chain
+
+        Args:
+            root (tk.Tk): Tk root whose event loop runs the scheduler
+
+        Returns:
+            None
+        """
+        self.root = root
+        self.wake()
+
+    def wake(self):
+        """
+        Make sure the Tk callback fires when the earliest entry is due
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self.root is None or self.in_run:
+            return
+        due = self.next_due()
+        if due == self.after_due:
+            return
+        if self.after_id is not None:
+            self.root.after_cancel(self.after_id)
+            self.after_id = None
+        self.after_due = due
+        if due is not None:
+            delay = max(1, math.ceil((due - self.clock()) * 1000))
+            self.after_id = self.root.after(delay, self.on_after)
+
+    def on_after(self):
+        """
+        Tk callback for the earliest due entry
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.after_id = None
+        self.after_due = None
+        self.run_due()
@@ -0,0 +1,279 @@
+"""
+Table balancing and seat draws for Poker Time
+
+Players are drawn into random seats and the tables are kept balanced as
+players are knocked out. Every table keeps its players and free seats in
+lists with an index, so a knock out only looks at the table counts and
+never at every player.
+
+Table breaks can be held until the next level starts by attaching the
+seating to a TournamentClock.
+"""
+
+import math
+import random
+from collections import namedtuple
+
+Move = namedtuple("Move", ["player", "from_table", "from_seat", "to_table", "to_seat"])
+
+
+class Table:
+    """
+    Table object
+
+    Seats hold a player or None, players and free list the occupied players
+    and empty seats in no particular order for O(1) random picks
+    """
+
+    __slots__ = ("free", "number", "players", "seats")
+
+    def __init__(self, number, size):
+        self.number = number
+        self.seats = [None] * size
+        self.players = []
+        self.free = list(range(size))
+
+    def __len__(self):
+        return len(self.players)
+
+
+class Seating:
+    """
+    Seat assignments for a whole tournament
+
+    Seat draws and moves use their own random generator so a seed gives the
+    same draw every time, defer_breaks holds table breaks for the next level
+    """
+
+    def __init__(self, seats=9, seed=None, defer_breaks=False):
+        self.size = seats
+        self.rng = random.Random(seed)
+        self.defer_breaks = defer_breaks
+        self.tables = {}
+        self.where = {}
+        self.slot = {}
+        self.clock = None
+        self.on_moves = None
+
+    def __len__(self):
+        return len(self.where)
+
+    def draw(self, players):
+        """
+        Seat players at random on as few tables as will hold them, with
+        table sizes differing by at most one
+
+        Args:
+            players (iter): Player names or ids
+
+        Returns:
+            None
+        """
+        players = list(players)
+        if len(set(players)) != len(players):
+            raise ValueError("players must be unique")
+        self.rng.shuffle(players)
+        count = max(1, math.ceil(len(players) / self.size))
+        self.tables = {n: Table(n, self.size) for n in range(1, count + 1)}
+        self.where.clear()
+        self.slot.clear()
+        for i, player in enumerate(players):
+            self.sit(player, self.tables[i % count + 1])
+
+    def sit(self, player, table, seat=None):
+        """
+        Put a player in a free seat, a random one if not given
+
+        Args:
+            player: Player to seat
+            table (Table): Table to sit at
+            seat (int, optional): Seat number
+
+        Returns:
+            seat (int): Seat taken
+        """
+        free = table.free
+        i = self.rng.randrange(len(free)) if seat is None else free.index(seat)
+        free[i], free[-1] = free[-1], free[i]
+        seat = free.pop()
+        table.seats[seat] = player
+        self.slot[player] = len(table.players)
+        table.players.append(player)
+        self.where[player] = (table.number, seat)
+        return seat
+
+    def stand(self, player):
+        """
+        Take a player out of their seat
+
+        Args:
+            player: Player to remove
+
+        Returns:
+            place (tuple): Table and seat the player left
+        """
+        number, seat = self.where.pop(player)
+        table = self.tables[number]
+        i = self.slot.pop(player)
+        last = table.players.pop()
+        if last != player:
+            table.players[i] = last
+            self.slot[last] = i
+        table.seats[seat] = None
+        table.free.append(seat)
+        return number, seat
+
+    def add(self, player):
+        """
+        Seat a late entry at the table with the most free seats, opening a
+        new table and balancing into it if every seat is taken
+
+        Args:
+            player: Player to seat
+
+        Returns:
+            moves (arr[Move]): Moves to make, the new player first with no
+                table or seat to come from
+        """
+        if player in self.where:
+            raise ValueError(f"{player} is already seated")
+        table = self.shortest() if self.tables else None
+        if table is None or not table.free:
+            number = max(self.tables, default=0) + 1
+            table = self.tables[number] = Table(number, self.size)
+        moves = [Move(player, None, None, table.number, self.sit(player, table))]
+        while step := self.balance(table):
+            moves += step
+        return moves
+
+    def move(self, player, table):
+        """
+        Move a player to a random free seat at another table
+
+        Args:
+            player: Player to move
+            table (Table): Table to move to
+
+        Returns:
+            move (Move): Where the player went from and to
+        """
+        from_table, from_seat = self.stand(player)
+        seat = self.sit(player, table)
+        return Move(player, from_table, from_seat, table.number, seat)
+
+    def shortest(self, exclude=()):
+        """
+        Table with the fewest players, the highest numbered one on a tie
+
+        Args:
+            exclude (set, optional): Table numbers to skip
+
+        Returns:
+            table (Table): Table with the most free seats
+        """
+        return min(
+            (t for n, t in self.tables.items() if n not in exclude),
+            key=lambda t: (len(t), -t.number),
+        )
+
+    def tables_to_break(self):
+        """
+        Number of tables that could be broken with everyone still seated
+
+        Args:
+            None
+
+        Returns:
+            count (int): Tables that are no longer needed
+        """
+        needed = max(1, math.ceil(len(self.where) / self.size))
+        return len(self.tables) - needed
+
+    def eliminate(self, player):
+        """
+        Knock a player out and rebalance the tables
+
+        Breaks a table when the rest can seat everyone, unless breaks are
+        deferred to the next level, otherwise moves one player from the
+        fullest table if it is two or more ahead
+
+        Args:
+            player: Player knocked out
+
+        Returns:
+            moves (arr[Move]): Player moves to make, in order
+        """
+        number, _ = self.stand(player)
+        if self.tables_to_break() and not self.defer_breaks:
+            return self.break_tables()
+        return self.balance(self.tables[number])
+
+    def balance(self, short):
+        """
+        Move a player to a table that has just lost one if it is now two
+        or more behind the fullest table
+
+        Args:
+            short (Table): Table that lost a player
+
+        Returns:
+            moves (arr[Move]): At most one move
+        """
+        full = max(self.tables.values(), key=lambda t: (len(t), -t.number))
+        if len(full) - len(short) < 2:
+            return []
+        player = full.players[self.rng.randrange(len(full))]
+        return [self.move(player, short)]
+
+    def break_tables(self):
+        """
+        Break every table that is no longer needed, the smallest ones, seating
+        each player at the table with the most free seats so nobody moves twice
+
+        Args:
+            None
+
+        Returns:
+            moves (arr[Move]): Player moves to make, in order
+        """
+        broken = set()
+        for _ in range(self.tables_to_break()):
+            broken.add(self.shortest(exclude=broken).number)
+        players = [p for n in sorted(broken) for p in self.tables[n].players]
+        self.rng.shuffle(players)
+        moves = [self.move(p, self.shortest(exclude=broken)) for p in players]
+        for number in broken:
+            del self.tables[number]
+        return moves
+
+    def attach(self, tournament_clock, on_moves):
+        """
+        Break deferred tables whenever the clock moves to a new level
+
+        Args:
+            tournament_clock (TournamentClock): Clock to follow
+            on_moves (callable): Called with the list of moves when tables break
+
+        Returns:
+            None
+        """
+        if self.clock is not None:
+            self.clock.unsubscribe(self.on_clock_event)
+        self.clock = tournament_clock
+        self.on_moves = on_moves
+        self.defer_breaks = True
+        tournament_clock.subscribe(self.on_clock_event)
+
+    def on_clock_event(self, event, _state):
+        """
+        Clock subscriber, breaks tables at level transitions
+
+        Args:
+            event (str): Clock event name
+            _state (ClockState): Unused
+
+        Returns:
+            None
+        """
+        if event == "level_up" and self.tables_to_break():
+            self.on_moves(self.break_tables())
@@ -0,0 +1,438 @@
+"""
+Broadcast server for Poker Time
+
+Serves the clock as JSON over HTTP and pushes changes over WebSocket so TVs,
+tablets and phones can mirror the clock from a browser.
+
+    python server.py Sample_Game.csv --port 8765 --start
+
+Routes:
+    GET  /                  minimal display page
+    GET  /state             JSON snapshot
+    GET  /ws                WebSocket, snapshot on connect then deltas
+    POST /control/<action>  toggle, next, restart, reset
+
+Anyone on the network can watch the clock, but control requests must carry
+the token printed at startup, as "Authorization: Bearer <token>" or
+?token=<token>. Pass --token to choose it.
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import hmac
+import json
+import secrets
+import struct
+import sys
+import time
+from urllib.parse import parse_qs, urlsplit
+
+from clock import TournamentClock
+from importer import import_structure
+
+WS_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+MAX_CLIENT_BUFFER = 64 * 1024
+MAX_FRAME = 64 * 1024
+STATE_FIELDS = {
+    "round_index": "level",
+    "round_num": "round",
+    "s_blind": "s_blind",
+    "b_blind": "b_blind",
+    "ante": "ante",
+    "is_break": "break",
+    "remaining": "remaining",
+    "is_paused": "paused",
+    "is_expired": "expired",
+}
+
+DISPLAY_PAGE = """<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Poker Time</title>
+<meta name="viewport" content="width=device-width, initial-scale=1">
+<style>
+body{margin:0;background:#0B6623;color:#fff;font:bold 6vw Arial;text-align:center}
+#round{background:#000;padding:2vh}#time{font-size:22vw}
+#blinds{display:flex;justify-content:space-around}
+</style></head><body>
+<div id="round"></div><div id="time"></div>
+<div id="blinds"><span id="sb"></span><span id="bb"></span></div>
+<script>
+let s = {};
+function fmt(t){return Math.floor(t/60)+":"+String(t%60).padStart(2,"0")}
+function show(){
+  round.textContent = "Round: " + s.round;
+  time.textContent = fmt(s.remaining);
+  sb.textContent = "Small Blind: " + s.s_blind.toLocaleString();
+  bb.textContent = "Big Blind: " + s.b_blind.toLocaleString();
+}
+function connect(){
+  const ws = new WebSocket("ws://" + location.host + "/ws");
+  ws.onmessage = e => { Object.assign(s, JSON.parse(e.data).state); show(); };
+  ws.onclose = () => setTimeout(connect, 1000);
+}
+connect();
+</script></body></html>
+"""
+
+
+def state_dict(state):
+    """
+    Convert a ClockState to the JSON shape sent to displays
+
+    Args:
+        state (ClockState): Clock state
+
+    Returns:
+        state (dict): Compact JSON friendly state
+    """
+    return {key: getattr(state, field) for field, key in STATE_FIELDS.items()}
+
+
+def ws_frame(payload, opcode=0x1):
+    """
+    Build an unmasked server to client WebSocket frame
+
+    Args:
+        payload (bytes): Frame payload
+        opcode (int, optional): Frame opcode, text by default
+
+    Returns:
+        frame (bytes): Encoded frame
+    """
+    length = len(payload)
+    if length < 126:
+        header = struct.pack("!BB", 0x80 | opcode, length)
+    elif length < 1 << 16:
+        header = struct.pack("!BBH", 0x80 | opcode, 126, length)
+    else:
+        header = struct.pack("!BBQ", 0x80 | opcode, 127, length)
+    return header + payload
+
+
+async def read_ws_frame(reader):
+    """
+    Read one WebSocket frame from a client
+
+    Clients must mask their frames, and frames over MAX_FRAME are refused
+    before their payload is read
+
+    Args:
+        reader (asyncio.StreamReader): Stream to read from
+
+    Returns:
+        frame (tuple): Opcode and unmasked payload, ValueError for a frame
+            that is not masked or too big
+    """
+    first, second = await reader.readexactly(2)
+    if not second & 0x80:
+        raise ValueError("unmasked client frame")
+    length = second & 0x7F
+    if length == 126:
+        (length,) = struct.unpack("!H", await reader.readexactly(2))
+    elif length == 127:
+        (length,) = struct.unpack("!Q", await reader.readexactly(8))
+    if length > MAX_FRAME:
+        raise ValueError(f"frame of {length} bytes")
+    mask = await reader.readexactly(4)
+    payload = await reader.readexactly(length)
+    key = int.from_bytes((mask * (length // 4 + 1))[:length], "big")
+    payload = (int.from_bytes(payload, "big") ^ key).to_bytes(length, "big")
+    return first & 0x0F, payload
+
+
+def write_response(writer, status, kind, body):
+    """
+    Write a complete HTTP response that closes the connection
+
+    Args:
+        writer (asyncio.StreamWriter): Client writer
+        status (str): Status line such as "200 OK"
+        kind (str): Content type
+        body (bytes): Response body
+
+    Returns:
+        None
+    """
+    writer.write(
+        f"HTTP/1.1 {status}\r\nContent-Type: {kind}\r\n"
+        f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode()
+        + body
+    )
+
+
+class BroadcastServer:
+    """
+    Pushes TournamentClock changes to every connected display
+
+    Each change is encoded and framed once, then the same bytes are written to
+    every client. Clients that fall too far behind are dropped rather than
+    allowed to slow down everyone else.
+    """
+
+    def __init__(self, tournament_clock, token=None):
+        self.clock = tournament_clock
+        self.token = token or secrets.token_urlsafe(16)
+        self.clients = set()
+        self.loop = None
+        self.wake = None
+        self.seq = 0
+        self.last = state_dict(tournament_clock.state)
+        self.clock.subscribe(self.on_clock_event)
+
+    def on_clock_event(self, event, state):
+        """
+        Clock subscriber, safe to call from any thread
+
+        Args:
+            event (str): Clock event name
+            state (ClockState): Clock state at the time of the event
+
+        Returns:
+            None
+        """
+        if self.loop is not None:
+            self.loop.call_soon_threadsafe(self.publish, event, state)
+
+    def snapshot(self):
+        """
+        Full state message sent to new clients
+
+        Args:
+            None
+
+        Returns:
+            message (bytes): Encoded JSON message
+        """
+        return json.dumps(
+            {
+                "type": "snapshot",
+                "seq": self.seq,
+                "ts": time.time(),
+                "state": self.last,
+            },
+            separators=(",", ":"),
+        ).encode()
+
+    def publish(self, event, state):
+        """
+        Send the fields that changed to every client
+
+        Args:
+            event (str): Clock event name
+            state (ClockState): Clock state at the time of the event
+
+        Returns:
+            None
+        """
+        current = state_dict(state)
+        changed = {k: v for k, v in current.items() if self.last.get(k) != v}
+        self.last = current
+        if event != "tick":
+            self.wake.set()
+        elif not changed:
+            return
+        self.seq += 1
+        frame = ws_frame(
+            json.dumps(
+                {"type": event, "seq": self.seq, "ts": time.time(), "state": changed},
+                separators=(",", ":"),
+            ).encode()
+        )
+        for writer in list(self.clients):
+            if writer.transport.get_write_buffer_size() > MAX_CLIENT_BUFFER:
+                self.clients.discard(writer)
+                writer.transport.abort()
+            else:
+                writer.write(frame)
+
+    async def drive(self):
+        """
+        Run the clock from the asyncio event loop
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        while True:
+            delay = self.clock.next_tick_delay()
+            try:
+                timeout = None if delay is None else delay / 1000
+                await asyncio.wait_for(self.wake.wait(), timeout)
+            except TimeoutError:
+                pass
+            self.wake.clear()
+            self.clock.update()
+
+    async def handle(self, reader, writer):
+        """
+        Handle one HTTP or WebSocket connection
+
+        Args:
+            reader (asyncio.StreamReader): Client reader
+            writer (asyncio.StreamWriter): Client writer
+
+        Returns:
+            None
+        """
+        try:
+            request = await reader.readuntil(b"\r\n\r\n")
+            lines = request.decode("latin-1").split("\r\n")
+            method, path, _ = lines[0].split(" ", 2)
+            headers = {}
+            for line in lines[1:]:
+                if ":" in line:
+                    name, value = line.split(":", 1)
+                    headers[name.strip().lower()] = value.strip()
+            if path == "/ws" and headers.get("upgrade", "").lower() == "websocket":
+                await self.serve_websocket(reader, writer, headers)
+            else:
+                self.serve_http(writer, method, path, headers)
+            await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError, ValueError):
+            pass
+        finally:
+            self.clients.discard(writer)
+            writer.close()
+
+    def is_authorized(self, query, headers):
+        """
+        Whether a request carries the control token
+
+        Args:
+            query (str): Query string of the request
+            headers (dict): Request headers
+
+        Returns:
+            authorized (bool): True if the token matches
+        """
+        scheme, _, token = headers.get("authorization", "").partition(" ")
+        if scheme.lower() != "bearer":
+            token = parse_qs(query).get("token", [""])[0]
+        return hmac.compare_digest(token.encode(), self.token.encode())
+
+    def serve_http(self, writer, method, target, headers):
+        """
+        Answer a plain HTTP request
+
+        Args:
+            writer (asyncio.StreamWriter): Client writer
+            method (str): HTTP method
+            target (str): Request path and query
+            headers (dict): Request headers
+
+        Returns:
+            None
+        """
+        path, query = urlsplit(target)[2:4]
+        actions = {
+            "/control/toggle": self.clock.toggle,
+            "/control/next": self.clock.next_round,
+            "/control/restart": self.clock.restart_game,
+            "/control/reset": self.clock.reset_timer,
+        }
+        if method == "GET" and path == "/":
+            status, kind, body = "200 OK", "text/html", DISPLAY_PAGE.encode()
+        elif method == "GET" and path == "/state":
+            status, kind, body = "200 OK", "application/json", self.snapshot()
+        elif method == "POST" and path in actions:
+            if self.is_authorized(query, headers):
+                actions[path]()
+                status, kind, body = "204 No Content", "text/plain", b""
+            else:
+                status, kind, body = "403 Forbidden", "text/plain", b"bad token"
+        else:
+            status, kind, body = "404 Not Found", "text/plain", b"not found"
+        write_response(writer, status, kind, body)
+
+    async def serve_websocket(self, reader, writer, headers):
+        """
+        Complete the WebSocket handshake, send a snapshot and keep the client
+
+        Args:
+            reader (asyncio.StreamReader): Client reader
+            writer (asyncio.StreamWriter): Client writer
+            headers (dict): Request headers
+
+        Returns:
+            None
+        """
+        key = headers.get("sec-websocket-key")
+        if not key:
+            write_response(writer, "400 Bad Request", "text/plain", b"missing key")
+            return
+        accept = base64.b64encode(
+            hashlib.sha1((key + WS_GUID).encode()).digest()
+        ).decode()
+        writer.write(
+            (
+                "HTTP/1.1 101 Switching Protocols\r\nUpgrade: websocket\r\n"
+                f"Connection: Upgrade\r\nSec-WebSocket-Accept: {accept}\r\n\r\n"
+            ).encode()
+            + ws_frame(self.snapshot())
+        )
+        self.clients.add(writer)
+        while True:
+            opcode, payload = await read_ws_frame(reader)
+            if opcode == 0x8:
+                writer.write(ws_frame(payload[:2], 0x8))
+                return
+            if opcode == 0x9:
+                writer.write(ws_frame(payload, 0xA))
+
+    async def serve(self, host="0.0.0.0", port=8765):
+        """
+        Run the server until cancelled
+
+        Args:
+            host (str, optional): Address to listen on
+            port (int, optional): Port to listen on
+
+        Returns:
+            None
+        """
+        self.loop = asyncio.get_running_loop()
+        self.wake = asyncio.Event()
+        server = await asyncio.start_server(self.handle, host, port, backlog=1024)
+        async with server:
+            await asyncio.gather(server.serve_forever(), self.drive())
+
+
+def main():
+    """
+    Run the broadcast server from the command line
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Poker Time broadcast server")
+    parser.add_argument("game", help="game file exported from the editor")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--start", action="store_true", help="start the clock")
+    parser.add_argument("--token", help="control token, random if not given")
+    args = parser.parse_args()
+
+    report = import_structure(args.game)
+    if report.error_count:
+        print(report.summary(), file=sys.stderr)
+    if not report.rounds:
+        sys.exit(f"{args.game} has no rounds")
+    tournament_clock = TournamentClock(report.rounds)
+    if args.start:
+        tournament_clock.start()
+    server = BroadcastServer(tournament_clock, args.token)
+    print(f"control token: {server.token}")
+    try:
+        asyncio.run(server.serve(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+"""
+Shared memory clock state for Poker Time
+
+The main clock writes its state into a small memory mapped file with a
+fixed layout. Display processes map the same file read only and read the
+state straight out of it, with no messages between the processes.
+
+A seqlock keeps reads consistent. The writer makes the sequence number odd
+before writing and even again after, and a reader retries if the number
+was odd or changed while it was reading.
+
+Layout, little endian:
+    magic "PKTM", layout version u32, sequence u64,
+    round index i64, round number i64, small blind i64, big blind i64,
+    ante i64, remaining ms i64, monotonic ns at the time of writing i64,
+    paused u8, expired u8, break u8, alert (screen flashing) u8
+"""
+
+import mmap
+import os
+import struct
+import tempfile
+import time
+from collections import namedtuple
+
+MAGIC = b"PKTM"
+LAYOUT_VERSION = 2
+HEADER = struct.Struct("<4sIQ")
+SEQUENCE = struct.Struct("<Q")
+SEQUENCE_OFFSET = 8
+PAYLOAD = struct.Struct("<qqqqqqqBBBB")
+SIZE = HEADER.size + PAYLOAD.size
+READ_ATTEMPTS = 100
+
+SharedState = namedtuple(
+    "SharedState",
+    [
+        "round_index",
+        "round_num",
+        "s_blind",
+        "b_blind",
+        "ante",
+        "remaining_ms",
+        "written_ns",
+        "is_paused",
+        "is_expired",
+        "is_break",
+        "alert",
+    ],
+)
+
+
+def default_path():
+    """
+    Where the state is shared unless told otherwise, in memory where possible
+
+    Args:
+        None
+
+    Returns:
+        path (str): Path of the shared file
+    """
+    folder = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(folder, "poker_time_state")
+
+
+class StatePublisher:
+    """
+    Writes a TournamentClock's state into the shared file on every event
+
+    alert is set by the game page while its screen is flashing
+    """
+
+    def __init__(self, path=None):
+        self.path = path or default_path()
+        self.clock = None
+        self.alert = False
+        self.sequence = 0
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if os.fstat(fd).st_size < SIZE:
+                os.ftruncate(fd, SIZE)
+            self.map = mmap.mmap(fd, SIZE, access=mmap.ACCESS_WRITE)
+        finally:
+            os.close(fd)
+        (self.sequence,) = SEQUENCE.unpack_from(self.map, SEQUENCE_OFFSET)
+        self.sequence += self.sequence & 1
+        HEADER.pack_into(self.map, 0, MAGIC, LAYOUT_VERSION, self.sequence)
+
+    def attach(self, tournament_clock):
+        """
+        Start publishing a clock, replacing any clock published before
+
+        Args:
+            tournament_clock (TournamentClock): Clock to publish
+
+        Returns:
+            None
+        """
+        if self.clock is not None:
+            self.clock.unsubscribe(self.on_clock_event)
+        self.clock = tournament_clock
+        self.alert = False
+        tournament_clock.subscribe(self.on_clock_event)
+        self.write(tournament_clock.state)
+
+    def set_alert(self, alert):
+        """
+        Publish whether the screen is flashing
+
+        Args:
+            alert (bool): True while flashing
+
+        Returns:
+            None
+        """
+        if alert != self.alert and self.clock is not None:
+            self.alert = alert
+            self.write(self.clock.state)
+
+    def on_clock_event(self, _event, state):
+        """
+        Clock subscriber, publishes every change
+
+        Args:
+            _event (str): Unused
+            state (ClockState): Clock state
+
+        Returns:
+            None
+        """
+        self.write(state)
+
+    def write(self, state):
+        """
+        Write a state under the seqlock
+
+        Args:
+            state (ClockState): Clock state
+
+        Returns:
+            None
+        """
+        self.sequence += 1
+        SEQUENCE.pack_into(self.map, SEQUENCE_OFFSET, self.sequence)
+        PAYLOAD.pack_into(
+            self.map,
+            HEADER.size,
+            state.round_index,
+            state.round_num,
+            state.s_blind,
+            state.b_blind,
+            state.ante,
+            round(self.clock.countdown.remaining() * 1000),
+            time.monotonic_ns(),
+            state.is_paused,
+            state.is_expired,
+            state.is_break,
+            self.alert,
+        )
+        self.sequence += 1
+        SEQUENCE.pack_into(self.map, SEQUENCE_OFFSET, self.sequence)
+
+    def close(self):
+        """
+        Stop publishing and unmap the file
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        if self.clock is not None:
+            self.clock.unsubscribe(self.on_clock_event)
+        self.map.close()
+
+
+class StateReader:
+    """
+    Read only view of a shared clock state
+    """
+
+    def __init__(self, path=None):
+        self.path = path or default_path()
+        with open(self.path, "rb") as f:
+            self.map = mmap.mmap(f.fileno(), SIZE, access=mmap.ACCESS_READ)
+        magic, version, _ = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC or version != LAYOUT_VERSION:
+            self.map.close()
+            raise ValueError(f"{self.path} is not a Poker Time state file")
+        self.sequence = None
+
+    def read(self):
+        """
+        Latest consistent state
+
+        Args:
+            None
+
+        Returns:
+            state (SharedState|None): State, None if the writer never let go
+        """
+        for _ in range(READ_ATTEMPTS):
+            (before,) = SEQUENCE.unpack_from(self.map, SEQUENCE_OFFSET)
+            if before & 1:
+                continue
+            values = PAYLOAD.unpack_from(self.map, HEADER.size)
+            (after,) = SEQUENCE.unpack_from(self.map, SEQUENCE_OFFSET)
+            if before == after:
+                self.sequence = after
+                return SharedState(*values[:7], *(bool(v) for v in values[7:]))
+        return None
+
+    def changed(self):
+        """
+        True if the writer has published since the last read
+
+        Args:
+            None
+
+        Returns:
+            changed (bool): Sequence number moved on
+        """
+        return SEQUENCE.unpack_from(self.map, SEQUENCE_OFFSET)[0] != self.sequence
+
+    @staticmethod
+    def remaining(state, now_ns=None):
+        """
+        Milliseconds left now, counting down from when the state was written
+        if the clock is running
+
+        Args:
+            state (SharedState): State read from the file
+            now_ns (int, optional): time.monotonic_ns(), read if not given
+
+        Returns:
+            remaining (float): Milliseconds left, never negative
+        """
+        if state.is_paused or state.is_expired:
+            return float(state.remaining_ms)
+        now_ns = time.monotonic_ns() if now_ns is None else now_ns
+        return max(0.0, state.remaining_ms - (now_ns - state.written_ns) / 1e6)
+
+    def close(self):
+        """
+        Unmap the file
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.map.close()
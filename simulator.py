@@ -0,0 +1,213 @@
+"""
+Monte Carlo tournament length simulator for Poker Time
+
+Plays many tournaments hand by hand against a blind schedule. Each trial
+pairs up the players still in, some pairs get into a pot, and short stacks
+go all in. Batches of trials are run as NumPy arrays and spread across a
+process pool. Every batch has its own seed taken from one SeedSequence, so
+results depend only on the seed and not on how many processes ran them.
+
+Blinds that stay small next to the stacks could keep a trial going forever,
+so play stops after max_hours and any trial still running is counted as cut
+short at that time.
+"""
+
+import multiprocessing
+import os
+from collections import namedtuple
+
+import numpy as np
+
+HANDS_PER_HOUR = 30
+SEATS = 9
+POT_CHANCE = 0.25
+ALL_IN_BBS = 15
+MAX_POT_BBS = 12
+BATCH_SIZE = 2000
+MAX_HOURS = 24
+CANCEL_POLL = 0.1
+PERCENTILES = (10, 25, 50, 75, 90)
+
+SimulationResult = namedtuple(
+    "SimulationResult",
+    ["trials", "finish_minutes", "finish_level", "cut_short", "max_hours"],
+)
+
+
+def schedule_columns(rounds):
+    """
+    Columns the simulation needs, as plain lists that pickle cheaply
+
+    Args:
+        rounds (BlindSchedule): Blind schedule
+
+    Returns:
+        columns (tuple): Level lengths in minutes, big blinds, antes and break flags
+    """
+    return (
+        rounds.times.tolist(),
+        rounds.b_blinds.tolist(),
+        rounds.antes.tolist(),
+        rounds.breaks.tolist(),
+    )
+
+
+def simulate_batch(columns, players, stack, trials, seed, max_hands):
+    """
+    Play a batch of tournaments to the end or until max_hands
+
+    Args:
+        columns (tuple): Output of schedule_columns
+        players (int): Number of players
+        stack (int): Starting stack of every player
+        trials (int): Number of tournaments
+        seed (SeedSequence): Seed for this batch
+        max_hands (int): Hands, breaks included, after which play stops
+
+    Returns:
+        finish (tuple): Finish time in minutes and finish level index per
+            trial, and the number of trials cut short
+    """
+    times, b_blinds, antes, breaks = (np.array(column) for column in columns)
+    starts = np.concatenate(([0], np.cumsum(times)))
+    rng = np.random.default_rng(seed)
+    minutes_per_hand = 60 / HANDS_PER_HOUR
+    pair_chance = POT_CHANCE / (SEATS / 2)
+
+    stacks = np.full((trials, players), float(stack))
+    finish_minutes = np.zeros(trials)
+    finish_level = np.zeros(trials, dtype=np.int64)
+    running = np.arange(trials)
+    hand = 0
+    while running.size and hand < max_hands:
+        minutes = hand * minutes_per_hand
+        level = min(np.searchsorted(starts, minutes, side="right") - 1, len(times) - 1)
+        hand += 1
+        if breaks[level] and minutes < starts[-1]:
+            continue
+        big_blind = max(1, b_blinds[level] + antes[level] * SEATS / 2)
+
+        order = np.argsort(rng.random(stacks.shape) + (stacks <= 0), axis=1)
+        rows = np.arange(len(running))[:, None]
+        first = order[:, 0 : players - 1 : 2]
+        second = order[:, 1:players:2]
+        a = stacks[rows, first]
+        b = stacks[rows, second]
+        short = np.minimum(a, b)
+        short_bbs = short / big_blind
+        chance = pair_chance * np.minimum(
+            4.0, 1 + ALL_IN_BBS / np.maximum(short_bbs, 1)
+        )
+        plays = (short > 0) & (rng.random(short.shape) < chance)
+        pot = np.where(
+            short_bbs <= ALL_IN_BBS,
+            short,
+            np.minimum(short, big_blind * rng.uniform(2, MAX_POT_BBS, short.shape)),
+        )
+        pot = np.where(plays, pot, 0) * np.where(rng.random(short.shape) < 0.5, 1, -1)
+        stacks[rows, first] = a + pot
+        stacks[rows, second] = b - pot
+
+        done = (stacks > 0).sum(axis=1) <= 1
+        if done.any():
+            finished = running[done]
+            finish_minutes[finished] = minutes + minutes_per_hand
+            finish_level[finished] = level
+            running = running[~done]
+            stacks = stacks[~done]
+    if running.size:
+        minutes = hand * minutes_per_hand
+        level = min(np.searchsorted(starts, minutes, side="right") - 1, len(times) - 1)
+        finish_minutes[running] = minutes
+        finish_level[running] = level
+    return finish_minutes, finish_level, running.size
+
+
+def run_pool(jobs, workers, cancel):
+    """
+    Run batches across a process pool
+
+    Args:
+        jobs (arr[tuple]): Arguments of simulate_batch for every batch
+        workers (int): Processes to use
+        cancel (threading.Event|None): Set to stop the pool
+
+    Returns:
+        results (arr[tuple]|None): Result of every batch in order, None if
+            cancelled
+    """
+    # leaving the block terminates the workers, so a cancelled run does not
+    # keep batches going or hold up exit
+    with multiprocessing.Pool(workers) as pool:
+        pending = pool.starmap_async(simulate_batch, jobs, chunksize=1)
+        while cancel is not None and not pending.ready():
+            if cancel.is_set():
+                return None
+            pending.wait(CANCEL_POLL)
+        return pending.get()
+
+
+def simulate(
+    rounds,
+    players,
+    stack,
+    trials=100000,
+    seed=0,
+    workers=None,
+    max_hours=MAX_HOURS,
+    cancel=None,
+):
+    """
+    Simulate how long a tournament will run
+
+    Args:
+        rounds (BlindSchedule): Blind schedule
+        players (int): Number of players
+        stack (int): Starting stack of every player
+        trials (int, optional): Number of tournaments to play
+        seed (int, optional): Seed, the same seed always gives the same result
+        workers (int, optional): Processes to use, one per CPU if not given,
+            0 runs every batch in this process
+        max_hours (float, optional): Length after which a trial is cut short
+        cancel (threading.Event, optional): Set from another thread to stop,
+            checked between batches in this process and while waiting on
+            the pool
+
+    Returns:
+        result (SimulationResult|None): Percentiles of finish time in minutes
+            and of the round number at the finish, with cut short trials
+            counted as finishing at max_hours, None if cancelled
+    """
+    if players < 2 or stack <= 0 or trials <= 0 or not rounds or max_hours <= 0:
+        raise ValueError("need at least two players, chips, trials and rounds")
+    columns = schedule_columns(rounds)
+    sizes = [BATCH_SIZE] * (trials // BATCH_SIZE)
+    if trials % BATCH_SIZE:
+        sizes.append(trials % BATCH_SIZE)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    max_hands = round(max_hours * HANDS_PER_HOUR)
+    jobs = [
+        (columns, players, stack, size, s, max_hands) for size, s in zip(sizes, seeds)
+    ]
+
+    if workers == 0 or len(jobs) == 1:
+        results = []
+        for job in jobs:
+            if cancel is not None and cancel.is_set():
+                return None
+            results.append(simulate_batch(*job))
+    else:
+        results = run_pool(jobs, min(workers or os.cpu_count(), len(jobs)), cancel)
+        if results is None:
+            return None
+
+    minutes = np.concatenate([result[0] for result in results])
+    levels = np.concatenate([result[1] for result in results])
+    nums = np.array(rounds.nums)[levels]
+    return SimulationResult(
+        trials,
+        dict(zip(PERCENTILES, np.percentile(minutes, PERCENTILES).tolist())),
+        dict(zip(PERCENTILES, np.percentile(nums, PERCENTILES).tolist())),
+        sum(result[2] for result in results),
+        max_hours,
+    )
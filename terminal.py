@@ -0,0 +1,472 @@
+"""
+Terminal clock for Poker Time
+
+Runs the clock in a text console with curses, for small machines where Tk
+and PIL are too heavy. The time and blinds are drawn in big block digits
+and only the cells that changed since the last frame are written.
+
+    python terminal.py Sample_Game.csv --start
+
+Keys:
+    space  start/pause        n  next round        b  previous round
+    r      reset timer        N  new game          e  edit game (reload file)
+    o      game overview      j  jump to time      R  restart game
+    q      exit
+"""
+
+import argparse
+import curses
+import locale
+import sys
+import time
+
+from clock import TournamentClock, base_state, parse_clock_time, state_text
+from importer import import_structure
+
+FLASH_MS = 500
+FLASH_CYCLES = 10
+OVERVIEW_ROWS = 8
+FONT = {
+    "0": ["####", "#  #", "#  #", "#  #", "####"],
+    "1": ["  # ", " ## ", "  # ", "  # ", " ###"],
+    "2": ["####", "   #", "####", "#   ", "####"],
+    "3": ["####", "   #", " ###", "   #", "####"],
+    "4": ["#  #", "#  #", "####", "   #", "   #"],
+    "5": ["####", "#   ", "####", "   #", "####"],
+    "6": ["####", "#   ", "####", "#  #", "####"],
+    "7": ["####", "   #", "  # ", " #  ", " #  "],
+    "8": ["####", "#  #", "####", "#  #", "####"],
+    "9": ["####", "#  #", "####", "   #", "####"],
+    ":": [" ", "#", " ", "#", " "],
+    ".": [" ", " ", " ", " ", "#"],
+    ",": [" ", " ", " ", "#", "#"],
+    "/": ["   #", "  # ", " #  ", "#   ", "    "],
+    " ": ["  "] * 5,
+}
+KEYS = (
+    "space start/pause  n next  b previous  r reset  N new game  e edit game  "
+    "o overview  j jump to time  R restart  q exit"
+)
+
+
+def big_text(text, block="#"):
+    """
+    Text in five row block digits
+
+    Args:
+        text (str): Digits and clock punctuation
+        block (str, optional): Character to draw with
+
+    Returns:
+        rows (arr[str]): Five rows of equal width
+    """
+    glyphs = [FONT.get(char, FONT[" "]) for char in text]
+    return [
+        " ".join(glyph[row] for glyph in glyphs).replace("#", block) for row in range(5)
+    ]
+
+
+class Screen:
+    """
+    Remembers the last frame and writes only the cells that changed
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self.rows = []
+        self.attr = None
+        self.written = 0
+
+    def invalidate(self):
+        """
+        Forget the last frame so the next draw writes everything
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        self.rows = []
+        self.window.erase()
+
+    def draw(self, rows, attr):
+        """
+        Write a frame
+
+        Args:
+            rows (arr[str]): One string per screen row, as wide as the screen
+            attr (int): Colour attribute for the whole screen
+
+        Returns:
+            None
+        """
+        if attr != self.attr:
+            self.attr = attr
+            self.window.bkgd(" ", attr)
+            self.invalidate()
+        for y, row in enumerate(rows):
+            old = self.rows[y] if y < len(self.rows) else None
+            if row == old:
+                continue
+            start, end = 0, len(row)
+            if old is not None and len(old) == len(row):
+                while row[start] == old[start]:
+                    start += 1
+                while row[end - 1] == old[end - 1]:
+                    end -= 1
+            try:
+                self.window.addstr(y, start, row[start:end])
+            except curses.error:
+                pass
+            self.written += end - start
+        self.rows = rows
+        self.window.noutrefresh()
+        curses.doupdate()
+
+
+class TerminalClock:
+    """
+    Curses front end for a TournamentClock
+    """
+
+    def __init__(self, window, path, tournament_clock, block="#"):
+        self.window = window
+        self.path = path
+        self.clock = tournament_clock
+        self.block = block
+        self.screen = Screen(window)
+        self.overview = False
+        self.flashes = 0
+        self.flash_due = None
+        self.message = ""
+        self.colors = {}
+        self.setup_colors()
+        self.clock.subscribe(self.on_clock_event)
+
+    def setup_colors(self):
+        """
+        Colour pairs for the visual states of the game page
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        pairs = {
+            "normal": (curses.COLOR_WHITE, curses.COLOR_GREEN),
+            "break": (curses.COLOR_WHITE, curses.COLOR_BLUE),
+            "final_minute": (curses.COLOR_WHITE, curses.COLOR_RED),
+            "alert_on": (curses.COLOR_WHITE, curses.COLOR_BLACK),
+            "alert_off": (curses.COLOR_BLACK, curses.COLOR_WHITE),
+        }
+        if curses.has_colors():
+            curses.start_color()
+        for number, (name, (fg, bg)) in enumerate(pairs.items(), 1):
+            if curses.has_colors():
+                curses.init_pair(number, fg, bg)
+                self.colors[name] = curses.color_pair(number) | curses.A_BOLD
+            else:
+                self.colors[name] = curses.A_REVERSE if number % 2 else curses.A_NORMAL
+
+    def on_clock_event(self, event, _state):
+        """
+        Clock subscriber, flashes the screen when a level runs out
+
+        Args:
+            event (str): Clock event name
+            _state (ClockState): Unused
+
+        Returns:
+            None
+        """
+        if event == "expire":
+            self.flashes = FLASH_CYCLES * 2
+            self.flash_due = time.monotonic() + FLASH_MS / 1000
+        elif event != "tick":
+            self.flashes = 0
+            self.flash_due = None
+
+    def visual_state(self, state):
+        """
+        Visual state to draw, as on the game page
+
+        Args:
+            state (ClockState): Clock state
+
+        Returns:
+            name (str): Visual state name
+        """
+        if self.flashes:
+            return "alert_on" if self.flashes % 2 == 0 else "alert_off"
+        return base_state(state)
+
+    def compose(self, state, height, width):
+        """
+        Build a frame for a state
+
+        Args:
+            state (ClockState): Clock state
+            height (int): Screen rows
+            width (int): Screen columns
+
+        Returns:
+            rows (arr[str]): One string per row, width - 1 wide
+        """
+        width -= 1
+        game_state = self.clock.game_state
+        title = "Break" if state.is_break else f"Round {state.round_num}"
+        if state.is_paused and not state.is_expired:
+            title += "  (paused)"
+        blinds = f"{state.s_blind:,}/{state.b_blind:,}"
+        lines = [title, ""]
+        text = state_text(state)
+        big_time = big_text(text, self.block)
+        lines += big_time if len(big_time[0]) <= width else [text]
+        lines.append("")
+        if self.overview:
+            lines += self.overview_lines()
+        else:
+            if not state.is_break:
+                big_blinds = big_text(blinds, self.block)
+                lines += big_blinds if len(big_blinds[0]) <= width else [blinds]
+            lines.append(f"Ante {state.ante:,}" if state.ante else "")
+            upcoming = game_state.round_index + 1
+            if upcoming < len(game_state.rounds):
+                level = game_state.rounds[upcoming]
+                lines.append(f"Next: {level.s_blind:,}/{level.b_blind:,}")
+        top = max(0, (height - len(lines) - 2) // 2)
+        rows = [""] * top + lines
+        rows = rows[: height - 2] + [""] * (height - 2 - len(rows))
+        rows += [self.message, KEYS]
+        return [row[:width].center(width) for row in rows]
+
+    def overview_lines(self):
+        """
+        Upcoming levels with the time each is expected to start
+
+        Args:
+            None
+
+        Returns:
+            lines (arr[str]): One line per level
+        """
+        game_state = self.clock.game_state
+        first = game_state.round_index
+        lines = []
+        for index in range(first, min(first + OVERVIEW_ROWS, len(game_state.rounds))):
+            level = game_state.rounds[index]
+            start = self.clock.projected_start(index)
+            when = (
+                "now"
+                if start is None
+                else time.strftime("%H:%M", time.localtime(start))
+            )
+            name = "Break" if level.is_break else f"Round {level.num}"
+            lines.append(
+                f"{name:<10} {level.s_blind:>8,}/{level.b_blind:<8,} "
+                f"{level.time:>3} min  {when}"
+            )
+        return lines
+
+    def draw(self):
+        """
+        Draw the current state, writing only what changed
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        state = self.clock.state
+        height, width = self.window.getmaxyx()
+        rows = self.compose(state, height, width)
+        self.screen.draw(rows, self.colors[self.visual_state(state)])
+
+    def next_delay(self):
+        """
+        Milliseconds to wait for a key before something is due to change
+
+        Args:
+            None
+
+        Returns:
+            delay (int): Milliseconds, -1 to wait for a key
+        """
+        delay = self.clock.next_tick_delay()
+        if self.flash_due is not None:
+            flash = max(1, int((self.flash_due - time.monotonic()) * 1000))
+            delay = flash if delay is None else min(delay, flash)
+        return -1 if delay is None else delay
+
+    def prompt(self, text):
+        """
+        Ask for a line of text on the message row
+
+        Args:
+            text (str): Question
+
+        Returns:
+            answer (str): What was typed
+        """
+        height, width = self.window.getmaxyx()
+        self.window.move(height - 2, 0)
+        self.window.clrtoeol()
+        self.window.addstr(height - 2, 0, text[: width - 1])
+        self.window.timeout(-1)
+        curses.echo()
+        try:
+            answer = self.window.getstr(height - 2, min(len(text), width - 1))
+        finally:
+            curses.noecho()
+        self.screen.invalidate()
+        return answer.decode("utf-8", "replace").strip()
+
+    def load(self, path, keep_position):
+        """
+        Load a game file
+
+        Args:
+            path (str): Game file
+            keep_position (bool): Stay on the current level, as editing does
+
+        Returns:
+            None
+        """
+        try:
+            report = import_structure(path)
+        except OSError as e:
+            self.message = f"Could not open {path}: {e.strerror}"
+            return
+        if not report.rounds:
+            self.message = f"{path} has no rounds"
+            return
+        self.path = path
+        self.clock.update_rounds(report.rounds)
+        if not keep_position:
+            self.clock.restart_game()
+        self.message = (
+            f"{report.error_count} rows skipped" if report.error_count else ""
+        )
+
+    def jump_to_time(self):
+        """
+        Ask how far into the tournament it is and move the clock there
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        text = self.prompt("Time since the start of the game (h:mm or h:mm:ss): ")
+        if not text:
+            return
+        try:
+            elapsed = parse_clock_time(text)
+        except ValueError:
+            self.message = f"{text} is not a time like 2:13"
+            return
+        self.clock.seek(elapsed)
+
+    def handle(self, key):
+        """
+        Run the command for a key
+
+        Args:
+            key (int): Key code from getch()
+
+        Returns:
+            running (bool): False to exit
+        """
+        self.message = ""
+        commands = {
+            ord(" "): self.clock.toggle,
+            ord("n"): self.clock.next_round,
+            ord("b"): self.clock.previous_round,
+            ord("r"): self.clock.reset_timer,
+            ord("R"): self.clock.restart_game,
+            ord("j"): self.jump_to_time,
+            ord("e"): lambda: self.load(self.path, True),
+            ord("N"): lambda: self.load(self.prompt("Game file: ") or self.path, False),
+        }
+        if key in (ord("q"), ord("Q")):
+            return False
+        if key == ord("o"):
+            self.overview = not self.overview
+        elif key == curses.KEY_RESIZE:
+            self.screen.invalidate()
+        elif key in commands:
+            commands[key]()
+        return True
+
+    def run(self):
+        """
+        Draw and wait for a key or the next change until told to exit
+
+        Args:
+            None
+
+        Returns:
+            None
+        """
+        while True:
+            self.draw()
+            self.window.timeout(self.next_delay())
+            key = self.window.getch()
+            if key != -1 and not self.handle(key):
+                return
+            self.clock.update()
+            if self.flash_due is not None and time.monotonic() >= self.flash_due:
+                self.flashes -= 1
+                self.flash_due = (
+                    time.monotonic() + FLASH_MS / 1000 if self.flashes else None
+                )
+
+
+def main():
+    """
+    Run the terminal clock from the command line
+
+    Args:
+        None
+
+    Returns:
+        None
+    """
+    parser = argparse.ArgumentParser(description="Poker Time terminal clock")
+    parser.add_argument("game", help="game file exported from the editor")
+    parser.add_argument("--start", action="store_true", help="start the clock")
+    parser.add_argument("--ascii", action="store_true", help="draw digits with #")
+    args = parser.parse_args()
+
+    report = import_structure(args.game)
+    if report.error_count:
+        print(report.summary(), file=sys.stderr)
+    if not report.rounds:
+        sys.exit(f"{args.game} has no rounds")
+    tournament_clock = TournamentClock(report.rounds)
+    if args.start:
+        tournament_clock.start()
+
+    def run(window):
+        try:
+            curses.curs_set(0)
+        except curses.error:
+            pass
+        window.keypad(True)
+        TerminalClock(
+            window, args.game, tournament_clock, "#" if args.ascii else "█"
+        ).run()
+
+    locale.setlocale(locale.LC_ALL, "")
+    try:
+        curses.wrapper(run)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Shared fixtures for the Poker Time tests
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# pylint: disable=wrong-import-position
+from clock import TournamentClock
+from schedule import BlindSchedule
+
+
+class FakeClock:
+    """
+    Monotonic clock that only moves when told to
+    """
+
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        """
+        Move the clock forward
+
+        Args:
+            seconds (float): Seconds to move
+
+        Returns:
+            None
+        """
+        self.now += seconds
+
+
+@pytest.fixture(name="fake_clock")
+def fake_clock_fixture():
+    """Clock that starts at a fixed time and only moves when advanced"""
+    return FakeClock()
+
+
+@pytest.fixture(name="rounds")
+def rounds_fixture():
+    """Two 20 minute levels around a 10 minute break"""
+    return BlindSchedule.from_columns(
+        [1, 2, 3], [20, 10, 20], [25, 0, 50], [50, 0, 100], breaks=[0, 1, 0]
+    )
+
+
+@pytest.fixture(name="tournament")
+def tournament_fixture(rounds, fake_clock):
+    """Tournament clock on the fake time source that records its events"""
+    tournament_clock = TournamentClock(rounds, fake_clock)
+    tournament_clock.events = []
+    tournament_clock.subscribe(
+        lambda event, state: tournament_clock.events.append((event, state))
+    )
+    return tournament_clock
@@ -0,0 +1,285 @@
+"""
+Tests for the headless tournament clock
+"""
+
+import pytest
+
+from clock import (
+    Countdown,
+    base_state,
+    format_time,
+    parse_clock_time,
+    state_text,
+)
+
+
+def events(tournament_clock):
+    """
+    Names of the events a recording clock has emitted
+
+    Args:
+        tournament_clock (TournamentClock): Clock from the tournament fixture
+
+    Returns:
+        events (arr[str]): Event names in order
+    """
+    return [event for event, _ in tournament_clock.events]
+
+
+def test_countdown_keeps_deadline_across_pause(fake_clock):
+    """Pausing keeps the exact time left however long the pause lasts"""
+    countdown = Countdown(60, fake_clock)
+    countdown.start()
+    fake_clock.advance(10.25)
+    countdown.pause()
+    fake_clock.advance(100)
+    assert countdown.remaining() == pytest.approx(49.75)
+    countdown.start()
+    fake_clock.advance(9.75)
+    assert countdown.remaining() == pytest.approx(40)
+    assert countdown.remaining_seconds() == 40
+
+
+def test_countdown_rounds_up_and_never_goes_negative(fake_clock):
+    """Displayed seconds round up and an overrun reads zero"""
+    countdown = Countdown(60, fake_clock)
+    countdown.start()
+    assert countdown.remaining_seconds() == 60
+    fake_clock.advance(0.5)
+    assert countdown.remaining_seconds() == 60
+    fake_clock.advance(120)
+    assert countdown.remaining() == 0.0
+
+
+def test_next_tick_delay_hits_second_boundary(fake_clock):
+    """The next tick is due when the displayed value changes"""
+    countdown = Countdown(60, fake_clock)
+    countdown.start()
+    fake_clock.advance(0.25)
+    assert countdown.next_tick_delay() == 750
+    assert countdown.next_tick_delay(0.1) == pytest.approx(50, abs=1)
+
+
+def test_start_and_pause(tournament, fake_clock):
+    """Time only counts down while the clock is running"""
+    tournament.start()
+    assert tournament.is_running
+    fake_clock.advance(61)
+    state = tournament.update()
+    assert state.remaining == 20 * 60 - 61
+    tournament.pause()
+    fake_clock.advance(500)
+    assert tournament.update().remaining == 20 * 60 - 61
+    assert tournament.state.is_paused
+    tournament.start()
+    fake_clock.advance(1)
+    assert tournament.update().remaining == 20 * 60 - 62
+    assert events(tournament) == ["resume", "tick", "pause", "resume", "tick"]
+
+
+def test_expire_and_level_advance(tournament, fake_clock):
+    """A level expires at zero and the next and previous levels load in full"""
+    tournament.start()
+    fake_clock.advance(20 * 60)
+    state = tournament.update()
+    assert state.is_expired
+    assert not tournament.is_running
+    assert events(tournament)[-1] == "expire"
+
+    tournament.next_round()
+    assert events(tournament)[-2:] == ["level_up", "break_start"]
+    state = tournament.state
+    assert state.round_index == 1
+    assert state.is_break
+    assert state.remaining == 10 * 60
+    assert state.elapsed == pytest.approx(20 * 60)
+
+    tournament.previous_round()
+    assert events(tournament)[-1] == "level_down"
+    assert tournament.state.round_index == 0
+    assert tournament.state.elapsed == 0
+
+
+def test_next_round_on_last_level_resets(tournament):
+    """Moving past the last level restarts it instead"""
+    tournament.seek(10_000)
+    tournament.next_round()
+    assert events(tournament)[-1] == "reset"
+    assert tournament.state.round_index == 2
+
+
+def test_toggle_resets_expired_level(tournament, fake_clock):
+    """The single control resets a level that has run out"""
+    tournament.toggle()
+    fake_clock.advance(20 * 60 + 1)
+    tournament.update()
+    tournament.toggle()
+    assert events(tournament)[-1] == "reset"
+    assert tournament.state.remaining == 20 * 60
+    assert tournament.state.is_paused
+
+
+def test_final_minute_ticks_in_tenths(tournament, fake_clock):
+    """The final minute counts tenths and ticks ten times a second"""
+    tournament.start()
+    fake_clock.advance(19 * 60 + 1)
+    state = tournament.update()
+    assert state.tenths == 590
+    assert tournament.next_tick_delay() == 100
+    fake_clock.advance(0.1)
+    assert tournament.update().tenths == 589
+
+
+def test_seek_keeps_running_state(tournament, fake_clock):
+    """Seeking lands in the right level and keeps a running clock running"""
+    tournament.seek(25 * 60)
+    state = tournament.state
+    assert events(tournament) == ["seek"]
+    assert state.round_index == 1
+    assert state.remaining == 5 * 60
+    assert state.elapsed == pytest.approx(25 * 60)
+    assert state.is_paused
+
+    tournament.start()
+    tournament.seek(31 * 60)
+    assert tournament.is_running
+    assert tournament.state.round_index == 2
+    fake_clock.advance(1)
+    assert tournament.update().remaining == 19 * 60 - 1
+
+
+def test_add_time(tournament, fake_clock):
+    """Added or removed time applies to paused and running clocks"""
+    tournament.add_time(30)
+    assert tournament.state.remaining == 20 * 60 + 30
+    assert tournament.state.is_paused
+
+    tournament.start()
+    fake_clock.advance(10)
+    tournament.add_time(-60)
+    assert tournament.is_running
+    assert tournament.state.remaining == 20 * 60 - 40
+    assert events(tournament) == ["add_time", "resume", "add_time"]
+
+
+def test_add_time_restarts_expired_level(tournament, fake_clock):
+    """Adding time to an expired level starts it counting again"""
+    tournament.start()
+    fake_clock.advance(20 * 60)
+    tournament.update()
+    assert tournament.is_expired
+    tournament.add_time(60)
+    assert not tournament.is_expired
+    assert tournament.is_running
+    fake_clock.advance(1)
+    assert tournament.update().remaining == 59
+
+
+def test_restore(tournament, fake_clock):
+    """Restoring puts back the level, time left and running state"""
+    tournament.restore(2, 95.5, True, 30 * 60)
+    state = tournament.state
+    assert events(tournament) == ["restore"]
+    assert state.round_index == 2
+    assert state.remaining == 96
+    assert state.elapsed == pytest.approx(30 * 60 + 20 * 60 - 95.5)
+    assert tournament.is_running
+    fake_clock.advance(0.5)
+    assert tournament.update().remaining == 95
+
+    tournament.restore(7, 10, False, 0)
+    assert tournament.state.round_index == 2
+    assert tournament.state.is_paused
+
+
+def test_run_drives_level_to_expiry(tournament, fake_clock):
+    """run() ticks a level to the end without a GUI"""
+    tournament.seek(10 * 60 + 20 * 60 - 3)
+    tournament.start()
+    state = tournament.run(sleep=fake_clock.advance)
+    assert state.is_expired
+    assert state.round_index == 1
+    assert events(tournament)[-1] == "expire"
+
+
+def test_unsubscribe(tournament):
+    """Removed subscribers hear nothing more"""
+    calls = []
+    callback = tournament.subscribe(lambda event, state: calls.append(event))
+    tournament.start()
+    tournament.unsubscribe(callback)
+    tournament.pause()
+    assert calls == ["resume"]
+
+
+def test_parse_clock_time():
+    """Times are hours and minutes with optional seconds"""
+    assert parse_clock_time("2:13") == 2 * 3600 + 13 * 60
+    assert parse_clock_time(" 0:05:30 ") == 330
+    for text in ("90", "1:2:3:4", "-1:00", "a:b"):
+        with pytest.raises(ValueError):
+            parse_clock_time(text)
+
+
+def test_format_time():
+    """Clock text is m:ss under an hour and h:mm:ss from an hour"""
+    assert format_time(0) == "0:00"
+    assert format_time(1199) == "19:59"
+    assert format_time(3661) == "1:01:01"
+
+
+def test_state_text_shows_tenths_in_final_minute(tournament):
+    """Whole seconds until the final minute, then tenths of a second"""
+    state = tournament.state
+    assert state_text(state) == "20:00"
+    assert state_text(state._replace(remaining=45, tenths=447)) == "0:44.7"
+
+
+def test_base_state(tournament):
+    """Breaks and the final minute of a level have their own look"""
+    state = tournament.state
+    assert base_state(state) == "normal"
+    assert base_state(state._replace(remaining=60)) == "final_minute"
+    assert base_state(state._replace(remaining=0)) == "normal"
+    assert base_state(state._replace(is_break=True, remaining=30)) == "break"
+
+
+def test_update_rounds_keeps_running_clock(tournament, rounds, fake_clock):
+    """Editing a later level leaves the running clock and its time alone"""
+    tournament.start()
+    fake_clock.advance(300)
+    tournament.update()
+    edited = rounds[:]
+    edited.set_level(2, time=30)
+    tournament.update_rounds(edited)
+    assert tournament.is_running
+    assert tournament.countdown.remaining() == pytest.approx(900)
+    assert tournament.state.remaining == 900
+    assert events(tournament)[-1] == "schedule"
+
+
+def test_update_rounds_moves_time_with_current_level(tournament, rounds, fake_clock):
+    """A new length for the current level keeps the time already played"""
+    tournament.start()
+    fake_clock.advance(300)
+    longer = rounds[:]
+    longer.set_level(0, time=30)
+    tournament.update_rounds(longer)
+    assert tournament.is_running
+    assert tournament.countdown.remaining() == pytest.approx(1500)
+    shorter = rounds[:]
+    shorter.set_level(0, time=4)
+    tournament.update_rounds(shorter)
+    assert tournament.countdown.remaining() == 0
+    tournament.update()
+    assert tournament.state.is_expired
+
+
+def test_update_rounds_paused_clock_stays_paused(tournament, rounds, fake_clock):
+    """A paused clock is still paused with the same time after an edit"""
+    tournament.start()
+    fake_clock.advance(60)
+    tournament.pause()
+    tournament.update_rounds(rounds[:])
+    assert tournament.state.is_paused
+    assert tournament.state.remaining == 1140
@@ -0,0 +1,21 @@
+"""
+Tests for the editor's fill series
+"""
+
+import pytest
+
+from main import fill_series
+
+
+def test_fill_series_steps_every_few_levels():
+    """Steps apply every few levels and values round to whole numbers"""
+    assert fill_series(25, "+25", 4) == [25, 50, 75, 100]
+    assert fill_series(100, "x1.5", 5, every=2) == [100, 100, 150, 150, 225]
+    assert fill_series(10, "", 3) == [10, 10, 10]
+
+
+@pytest.mark.parametrize("step", ["x1e300", "+9e18", "xinf", "+nan"])
+def test_fill_series_rejects_values_a_schedule_cannot_hold(step):
+    """Series that outgrow a schedule column are refused, not overflowed"""
+    with pytest.raises(ValueError):
+        fill_series(100, step, 10)
@@ -0,0 +1,48 @@
+"""
+Tests for the blind structure generator
+"""
+
+import warnings
+
+import pytest
+
+from generator import MAX_BLIND, generate_structures
+
+
+def test_structures_fit_the_chip_set():
+    """Blinds are payable with the chips and the big blind is twice the small"""
+    structures = generate_structures(10000, 9, 240, 20, (25, 100, 500))
+    assert 1 <= len(structures) <= 3
+    scores = [structure.score for structure in structures]
+    assert scores == sorted(scores)
+    rounds = structures[0].rounds
+    assert list(rounds.times) == [20] * len(rounds)
+    assert all(s_blind % 25 == 0 for s_blind in rounds.s_blinds)
+    assert list(rounds.b_blinds) == [2 * s_blind for s_blind in rounds.s_blinds]
+
+
+def test_extreme_details_stay_in_range():
+    """Huge stacks and one minute levels give blinds a schedule can hold"""
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        structures = generate_structures(10**15, 1000, 240, 1, count=1200)
+    assert len(structures) > 100
+    for structure in structures:
+        assert min(structure.rounds.s_blinds) > 0
+        assert max(structure.rounds.b_blinds) <= 2 * MAX_BLIND
+
+
+@pytest.mark.parametrize(
+    "details",
+    [
+        (10000, 9, 100000, 1),
+        (10**18, 9, 240, 20),
+        (10000, 0, 240, 20),
+        (10000, 9, 240, 20, (0, 25)),
+        (10000, 9, 240, 20, (25, 2**62)),
+    ],
+)
+def test_out_of_range_details_are_refused(details):
+    """Too many levels, chips or bad values raise ValueError for the dialog"""
+    with pytest.raises(ValueError):
+        generate_structures(*details)
@@ -0,0 +1,127 @@
+"""
+Tests for the schedule edit history
+"""
+
+import pytest
+
+from clock import TournamentClock
+from history import CHUNK, History
+from schedule import BlindSchedule
+
+
+def big_schedule(size=100):
+    """
+    Schedule long enough to span several chunks
+
+    Args:
+        size (int, optional): Number of levels
+
+    Returns:
+        schedule (BlindSchedule): Schedule of 20 minute levels
+    """
+    return BlindSchedule.from_columns(
+        range(1, size + 1),
+        [20] * size,
+        [25 * (i + 1) for i in range(size)],
+        [50 * (i + 1) for i in range(size)],
+    )
+
+
+def edited(schedule, index, **fields):
+    """
+    Copy of a schedule with one level changed
+
+    Args:
+        schedule (BlindSchedule): Schedule to copy
+        index (int): Level to change
+        fields (dict): Values to set
+
+    Returns:
+        schedule (BlindSchedule): Edited copy
+    """
+    schedule = schedule[:]
+    schedule.set_level(index, **fields)
+    return schedule
+
+
+def test_undo_and_redo_move_between_versions():
+    """Undo and redo step through the recorded versions and stop at the ends"""
+    first = big_schedule()
+    second = edited(first, 5, time=30)
+    history = History(first)
+    history.record(second, "Save")
+    assert history.undo() == first
+    assert not history.can_undo()
+    assert history.undo() is None
+    assert history.redo() == second
+    assert not history.can_redo()
+    assert history.redo() is None
+
+
+def test_record_after_undo_drops_undone_versions():
+    """A new version after an undo replaces the versions that were undone"""
+    first = big_schedule()
+    history = History(first)
+    history.record(edited(first, 1, time=25), "Save")
+    history.undo()
+    third = edited(first, 2, time=15)
+    assert history.record(third, "Fill")
+    assert len(history.entries) == 2
+    assert history.jump(1) == third
+
+
+def test_record_skips_unchanged_schedule():
+    """Saving the same schedule again adds no version"""
+    history = History(big_schedule())
+    assert not history.record(big_schedule(), "Save")
+    assert len(history.entries) == 1
+
+
+def test_jump_returns_any_version():
+    """Any version can be reached directly and out of range is an error"""
+    versions = [big_schedule()]
+    history = History(versions[0])
+    for index in range(1, 5):
+        versions.append(edited(versions[-1], index, s_blind=index))
+        history.record(versions[-1], "Save")
+    for position in (2, 0, 4, 1):
+        assert history.jump(position) == versions[position]
+        assert history.position == position
+    with pytest.raises(IndexError):
+        history.jump(5)
+
+
+def test_versions_share_unchanged_chunks():
+    """An edit stores only the chunk it touched, the rest are shared"""
+    first = big_schedule()
+    history = History(first)
+    history.record(edited(first, CHUNK + 1, b_blind=999), "Save")
+    old, new = (snapshot.chunks for snapshot, _, _ in history.entries)
+    assert len(new) == len(old)
+    changed = [number for number, chunk in enumerate(new) if chunk is not old[number]]
+    assert changed == [1]
+
+
+def test_versions_do_not_change_each_other():
+    """Editing a schedule taken from the history leaves the history alone"""
+    first = big_schedule()
+    history = History(first)
+    schedule = history.jump(0)
+    schedule.set_level(0, s_blind=1)
+    assert history.jump(0) == first
+
+
+def test_undo_keeps_tournament_clock_running(fake_clock):
+    """Moving through the history mid level neither stops nor resets the clock"""
+    first = big_schedule()
+    history = History(first)
+    history.record(edited(first, 3, time=40), "Save")
+    tournament_clock = TournamentClock(history.jump(1), fake_clock)
+    tournament_clock.start()
+    fake_clock.advance(500)
+    tournament_clock.update_rounds(history.undo())
+    assert tournament_clock.is_running
+    assert tournament_clock.countdown.remaining() == pytest.approx(700)
+    tournament_clock.update_rounds(history.redo())
+    assert tournament_clock.game_state.rounds[3].time == 40
+    assert tournament_clock.countdown.remaining() == pytest.approx(700)
@@ -0,0 +1,73 @@
+"""
+Tests for the ICM engine and the deal calculator input
+"""
+
+import pytest
+
+from icm import chip_chop, exact_icm, icm, sampled_icm
+from main import parse_stack_line
+
+
+def test_two_players_by_hand():
+    """Heads up equity matches the Malmuth-Harville formula worked by hand"""
+    equity = exact_icm([3000, 1000], [70, 30])
+    assert equity == pytest.approx([0.75 * 70 + 0.25 * 30, 0.25 * 70 + 0.75 * 30])
+
+
+def test_three_players_by_hand():
+    """Three way equity matches the formula worked by hand"""
+    stacks = [5000, 3000, 2000]
+    equity = exact_icm(stacks, [50, 30, 20])
+    first = 0.5 * 50 + (0.3 * 5 / 7 + 0.2 * 5 / 8) * 30
+    first += (0.3 * 2 / 7 + 0.2 * 3 / 8) * 20
+    assert equity[0] == pytest.approx(first)
+    assert equity.sum() == pytest.approx(100)
+
+
+def test_equal_stacks_split_evenly():
+    """Equal stacks share the prize pool equally"""
+    assert exact_icm([100] * 6, [50, 30, 20]) == pytest.approx([100 / 6] * 6)
+
+
+def test_sampling_agrees_with_exact():
+    """Sampled equity is within its reported error of the exact value"""
+    stacks = [900, 700, 500, 400, 300, 200, 100, 50]
+    payouts = [40, 25, 15, 10]
+    exact = exact_icm(stacks, payouts)
+    sampled = sampled_icm(stacks, payouts, samples=40000, seed=1)
+    assert (abs(sampled.equity - exact) <= sampled.error * 1.5).all()
+
+
+def test_icm_picks_exact_for_small_fields():
+    """Small fields are exact with no error"""
+    result = icm([300, 200, 100], [60, 40])
+    assert result.exact
+    assert not result.error.any()
+
+
+def test_chip_chop():
+    """Everyone gets the lowest prize and the rest goes by chips"""
+    assert chip_chop([3000, 1000], [70, 30]) == pytest.approx([60, 40])
+
+
+def test_bad_inputs():
+    """Players without chips and negative payouts are rejected"""
+    with pytest.raises(ValueError):
+        icm([100, 0], [10])
+    with pytest.raises(ValueError):
+        icm([100, 50], [10, -1])
+
+
+@pytest.mark.parametrize(
+    ("line", "stack"),
+    [
+        ("Alice, 1,000", ("Alice", 1000)),
+        ("Alice: 1,000", ("Alice", 1000)),
+        ("Alice\t1,000", ("Alice", 1000)),
+        ("Alice Smith 25,000", ("Alice Smith", 25000)),
+        ("1,000", ("", 1000)),
+    ],
+)
+def test_stack_lines(line, stack):
+    """Deal calculator lines keep thousands separators in the chip count"""
+    assert parse_stack_line(line) == stack
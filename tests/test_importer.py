@@ -0,0 +1,76 @@
+"""
+Tests for the structure file importer
+"""
+
+import pytest
+
+from importer import import_structure, parse_int
+
+
+def write(tmp_path, text):
+    """
+    Write a structure file
+
+    Args:
+        tmp_path (pathlib.Path): Folder to write in
+        text (str): File contents
+
+    Returns:
+        path (str): Path of the file
+    """
+    path = tmp_path / "game.csv"
+    path.write_text(text, encoding="utf-8")
+    return str(path)
+
+
+def test_parse_int_allows_separators():
+    """Thousands separators, spaces and whole floats parse"""
+    assert parse_int(" 1,000 ") == 1000
+    assert parse_int("25_000") == 25000
+    assert parse_int("2e3") == 2000
+    with pytest.raises(ValueError):
+        parse_int("1.5")
+
+
+def test_game_file_without_header(tmp_path):
+    """Files exported by the editor load in full"""
+    report = import_structure(write(tmp_path, "1,20,25,50,0,0\n2,10,0,0,0,1\n"))
+    assert not report.has_header
+    assert not report.error_count
+    assert list(report.rounds.rows()) == [(1, 20, 25, 50, 0, 0), (2, 10, 0, 0, 0, 1)]
+
+
+def test_header_in_any_order(tmp_path):
+    """A header line maps columns by name and optional columns can be left out"""
+    text = "Big Blind\tMinutes\tSmall Blind\n100\t15\t50\n200\t15\t100\n"
+    report = import_structure(write(tmp_path, text))
+    assert report.has_header
+    assert list(report.rounds.rows()) == [
+        (1, 15, 50, 100, 0, 0),
+        (2, 15, 100, 200, 0, 0),
+    ]
+
+
+def test_bad_lines_are_reported(tmp_path):
+    """Bad lines are skipped and reported with their line number"""
+    text = "1,20,25,50,0\n2,20,fifty,100,0\n3,20\n\n4,20,-1,100,0\n"
+    report = import_structure(write(tmp_path, text))
+    assert [level.num for level in report.rounds] == [1]
+    assert [line for line, _ in report.errors] == [2, 3, 5]
+    assert report.summary().startswith("Line 2: values must be whole numbers")
+
+
+def test_quoted_thousands(tmp_path):
+    """Quoted numbers with thousands separators parse"""
+    report = import_structure(write(tmp_path, '1,20,"1,000","2,000",0\n'))
+    assert list(report.rounds.rows()) == [(1, 20, 1000, 2000, 0, 0)]
+
+
+def test_numbers_too_large_are_bad_lines(tmp_path):
+    """Values that do not fit a schedule column are reported, not raised"""
+    text = "1,20,25,50,0\n2,20,25,99999999999999999999,0\n3,20,1e30,50,0\n"
+    report = import_structure(write(tmp_path, text))
+    assert [level.num for level in report.rounds] == [1]
+    assert [line for line, _ in report.errors] == [2, 3]
+    with pytest.raises(ValueError):
+        parse_int("99999999999999999999")
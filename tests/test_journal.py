@@ -0,0 +1,57 @@
+"""
+Tests for the session journal
+"""
+
+import json
+
+from clock import TournamentClock
+from journal import Journal, load_session, resume
+
+
+def test_session_survives_restart(rounds, tmp_path):
+    """A journaled clock comes back at the same level with the same time left"""
+    journal = Journal(tmp_path, snapshot_every=2)
+    tournament_clock = TournamentClock(rounds)
+    journal.attach(tournament_clock)
+    tournament_clock.next_round()
+    tournament_clock.add_time(-90)
+    tournament_clock.next_round()
+    tournament_clock.add_time(-30)
+    journal.close()
+
+    session = load_session(tmp_path)
+    assert session.rounds == rounds
+    restored = TournamentClock(session.rounds)
+    resume(restored, session.state)
+    assert restored.state.round_index == 2
+    assert restored.state.remaining == 20 * 60 - 30
+    assert restored.state.is_paused
+
+
+def test_clear_forgets_session(rounds, tmp_path):
+    """A cleared journal has nothing to resume"""
+    journal = Journal(tmp_path)
+    journal.attach(TournamentClock(rounds))
+    journal.clear()
+    journal.close()
+    assert load_session(tmp_path) is None
+
+
+def test_corrupt_snapshot_is_no_session(tmp_path):
+    """Snapshots that parse but lack keys count as no session"""
+    path = tmp_path / "snapshot.json"
+    for data in ("{", "[]", "{}", '{"state": {}, "rounds": {}}'):
+        path.write_text(data, encoding="utf-8")
+        assert load_session(tmp_path) is None
+
+
+def test_journal_read_to_first_bad_line(rounds, tmp_path):
+    """Entries after a torn or incomplete line are ignored"""
+    journal = Journal(tmp_path)
+    tournament_clock = TournamentClock(rounds)
+    journal.attach(tournament_clock)
+    tournament_clock.next_round()
+    journal.close()
+    with open(tmp_path / "journal.jsonl", "a", encoding="utf-8") as f:
+        f.write(json.dumps({"seq": 99, "round_index": 2}) + "\n")
+    assert load_session(tmp_path).state["round_index"] == 1
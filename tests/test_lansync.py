@@ -0,0 +1,136 @@
+"""
+Tests for LAN clock synchronization
+"""
+
+import time
+
+import pytest
+
+from clock import TournamentClock
+from lansync import (
+    DEFAULT_PORT,
+    FOLLOWER_TIMEOUT,
+    MAX_FOLLOWERS,
+    SyncAuthority,
+    SyncFollower,
+    is_lan_address,
+    parse_sync,
+    to_ns,
+)
+
+
+def wait_for(condition, timeout=5.0):
+    """
+    Wait until a condition holds
+
+    Args:
+        condition (func): Called until it returns True
+        timeout (float, optional): Seconds to wait at most
+
+    Returns:
+        held (bool): True if the condition held in time
+    """
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_parse_sync():
+    """serve makes an authority, anything else is the authority to follow"""
+    assert parse_sync("serve") == ("authority", ("0.0.0.0", DEFAULT_PORT))
+    assert parse_sync("serve:9000") == ("authority", ("0.0.0.0", 9000))
+    assert parse_sync("10.0.0.5") == ("follower", ("10.0.0.5", DEFAULT_PORT))
+
+
+def test_only_lan_addresses_are_answered():
+    """Private, loopback and link local addresses may follow, others may not"""
+    for host in ("127.0.0.1", "192.168.1.20", "10.1.2.3", "fe80::1", "::1"):
+        assert is_lan_address(host)
+    for host in ("8.8.8.8", "2001:4860::8888", "not an address"):
+        assert not is_lan_address(host)
+
+
+def test_authority_expires_quiet_followers(fake_clock):
+    """Followers that stop pinging are dropped and the list has a limit"""
+    authority = SyncAuthority(clock=fake_clock)
+    assert not authority.admit(("8.8.8.8", 1), fake_clock())
+    for port in range(MAX_FOLLOWERS):
+        assert authority.admit(("10.0.0.1", port), fake_clock())
+    assert not authority.admit(("10.0.0.2", 1), fake_clock())
+    fake_clock.advance(FOLLOWER_TIMEOUT / 2)
+    assert authority.admit(("10.0.0.1", 0), fake_clock())
+    fake_clock.advance(FOLLOWER_TIMEOUT / 2 + 1)
+    assert authority.admit(("10.0.0.2", 1), fake_clock())
+    assert set(authority.followers) == {("10.0.0.1", 0), ("10.0.0.2", 1)}
+
+
+def test_add_sample_trusts_fastest_round_trip():
+    """The offset comes from the sample with the smallest delay"""
+    follower = SyncFollower(("127.0.0.1", DEFAULT_PORT))
+    follower.add_sample(0, 600, 600, 1000)
+    follower.add_sample(2000, 2150, 2150, 2200)
+    assert follower.delay_ns == 200
+    assert follower.offset_ns == 50
+
+
+def test_poll_corrects_drift_without_events(rounds, fake_clock):
+    """A drifting deadline is moved quietly, subscribers see no event"""
+    authority_clock = TournamentClock(rounds, fake_clock)
+    authority = SyncAuthority(clock=fake_clock)
+    authority.attach(authority_clock)
+    authority_clock.start()
+
+    tournament_clock = TournamentClock(rounds, fake_clock)
+    follower = SyncFollower(("127.0.0.1", DEFAULT_PORT), fake_clock)
+    follower.attach(tournament_clock)
+    follower.offset_ns = 0
+    follower.snapshot = authority.snapshot
+    follower.poll()
+    assert tournament_clock.is_running
+
+    events = []
+    tournament_clock.subscribe(lambda event, state: events.append(event))
+    tournament_clock.countdown.add(0.5)
+    follower.poll()
+    assert tournament_clock.countdown.remaining() == pytest.approx(
+        authority_clock.countdown.remaining()
+    )
+    assert not events
+
+
+def test_follower_copies_authority_over_udp(rounds):
+    """A follower on loopback picks up a running clock and a new level"""
+    authority_clock = TournamentClock(rounds)
+    authority = SyncAuthority(("127.0.0.1", 0))
+    address = authority.start()
+    authority.attach(authority_clock)
+    authority_clock.start()
+
+    tournament_clock = TournamentClock(rounds)
+    follower = SyncFollower(address)
+    follower.attach(tournament_clock)
+    follower.start()
+    try:
+        assert wait_for(lambda: follower.offset_ns is not None)
+        follower.poll()
+        assert tournament_clock.is_running
+        deadlines = (
+            tournament_clock.countdown.deadline,
+            authority_clock.countdown.deadline,
+        )
+        assert deadlines[0] == pytest.approx(deadlines[1], abs=0.05)
+        authority_clock.next_round()
+        sequence = authority.snapshot.sequence
+        assert wait_for(lambda: follower.snapshot.sequence == sequence)
+        follower.poll()
+        assert tournament_clock.game_state.round_index == 1
+        assert tournament_clock.state.is_paused
+        assert to_ns(tournament_clock.countdown.remaining()) == pytest.approx(
+            authority.snapshot.remaining_ns
+        )
+    finally:
+        follower.close()
+        authority.close()
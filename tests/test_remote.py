@@ -0,0 +1,80 @@
+"""
+Tests for the remote control commands
+"""
+
+import socket
+
+import pytest
+
+from remote import DEFAULT_ADDRESS, RemoteControl, is_loopback, parse_address
+
+TOKEN = "secret"
+
+
+def test_seek_reads_hours_and_minutes(tournament):
+    """seek takes h:mm like the Jump To Time dialog and the terminal clock"""
+    remote = RemoteControl(tournament_clock=tournament)
+    assert remote.run_command("seek 0:25") == "ok 2 300"
+    assert remote.run_command("seek 0:31:30") == "ok 3 1110"
+    assert remote.run_command("seek 90").startswith("error bad time")
+
+
+def test_add_reads_minutes_and_seconds(tournament):
+    """add takes seconds or m:ss with a sign"""
+    remote = RemoteControl(tournament_clock=tournament)
+    assert remote.run_command("add 1:30") == "ok 1 1290"
+    assert remote.run_command("add -90") == "ok 1 1200"
+
+
+def test_parse_address():
+    """Addresses are paths, host:port or a host on the default port"""
+    assert parse_address("1") == DEFAULT_ADDRESS
+    assert parse_address("/tmp/poker.sock") == "/tmp/poker.sock"
+    assert parse_address(":9000") == ("127.0.0.1", 9000)
+    assert parse_address("myhost") == ("myhost", DEFAULT_ADDRESS[1])
+    for text in ("myhost:", "myhost:port", "myhost:70000"):
+        with pytest.raises(ValueError):
+            parse_address(text)
+
+
+def test_loopback_needs_no_token():
+    """Only this machine can reach loopback addresses and Unix sockets"""
+    assert is_loopback(("127.0.0.1", 8766))
+    assert is_loopback("/tmp/poker.sock")
+    assert not is_loopback(("0.0.0.0", 8766))
+    assert not is_loopback(("192.168.1.5", 8766))
+
+
+def test_token_required_off_loopback(tournament):
+    """Listening beyond loopback makes up a token if none was given"""
+    remote = RemoteControl(("0.0.0.0", 0), tournament)
+    remote.start()
+    try:
+        assert remote.token
+        assert remote.is_authorized(f"auth {remote.token}\n")
+        assert not remote.is_authorized("auth wrong\n")
+        assert not remote.is_authorized("toggle\n")
+    finally:
+        remote.close()
+    remote = RemoteControl(("127.0.0.1", 0), tournament)
+    remote.start()
+    remote.close()
+    assert remote.token is None
+
+
+def test_commands_wait_for_token(tournament):
+    """Commands before the token are refused and the connection closed"""
+    remote = RemoteControl(("127.0.0.1", 0), tournament, token=TOKEN)
+    address = remote.start()
+    try:
+        with socket.create_connection(address, timeout=5) as conn:
+            conn.sendall(b"toggle\n")
+            assert conn.makefile("r").read() == "error bad token\n"
+        with socket.create_connection(address, timeout=5) as conn:
+            answers = conn.makefile("r")
+            conn.sendall(f"auth {TOKEN}\ntoggle\n".encode())
+            assert answers.readline() == "ok auth\n"
+            line, _ = remote.commands.get(timeout=5)
+            assert line == "toggle"
+    finally:
+        remote.close()
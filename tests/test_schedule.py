@@ -0,0 +1,95 @@
+"""
+Tests for the columnar blind schedule and its time index
+"""
+
+import random
+
+import pytest
+
+from schedule import BlindSchedule, Round, TimeIndex
+
+
+def test_round_trip_through_rounds():
+    """A schedule built from Round objects hands the same levels back"""
+    levels = [
+        Round(1, 20, 25, 50),
+        Round(2, 10, is_break=True),
+        Round(3, 20, 50, 100, 10),
+    ]
+    schedule = BlindSchedule(levels)
+    assert len(schedule) == 3
+    assert [(r.num, r.time, r.b_blind, r.ante, r.is_break) for r in schedule] == [
+        (1, 20, 50, 0, False),
+        (2, 10, 0, 0, True),
+        (3, 20, 100, 10, False),
+    ]
+    assert schedule == BlindSchedule.from_columns(
+        [1, 2, 3], [20, 10, 20], [25, 0, 50], [50, 0, 100], [0, 0, 10], [0, 1, 0]
+    )
+
+
+def test_slices_are_independent(rounds):
+    """Slices and copies do not share columns with the original"""
+    head = rounds[:2]
+    copy = rounds.copy()
+    head.set_level(0, b_blind=60)
+    copy.set_level(1, time=15)
+    assert rounds.b_blinds[0] == 50
+    assert rounds.times[1] == 10
+    assert len(head) == 2
+
+
+def test_write_csv(rounds, tmp_path):
+    """Schedules save in the game file format"""
+    path = tmp_path / "game.csv"
+    with open(path, "w", encoding="utf-8") as f:
+        rounds.write_csv(f)
+    assert path.read_text(encoding="utf-8").splitlines() == [
+        "1,20,25,50,0,0",
+        "2,10,0,0,0,1",
+        "3,20,50,100,0,0",
+    ]
+
+
+def test_time_index_follows_edits(rounds):
+    """The index stays correct through append, set_level and set_column"""
+    index = rounds.time_index()
+    assert index.total() == 50 * 60
+    rounds.append(4, 30, 100, 200)
+    rounds.set_level(1, time=5)
+    assert rounds.time_index() is index
+    assert [index.start(i) for i in range(5)] == [0, 1200, 1500, 2700, 4500]
+    rounds.set_column("time", [1] * 4)
+    assert rounds.time_index().total() == 4 * 60
+
+
+def test_time_index_find():
+    """find() returns the level and seconds played at any point in the game"""
+    index = TimeIndex([60, 120, 60])
+    assert index.find(0) == (0, 0)
+    assert index.find(59.5) == (0, 59.5)
+    assert index.find(60) == (1, 0)
+    assert index.find(200) == (2, 20)
+    assert index.find(-5) == (0, 0)
+    assert index.find(10_000) == (2, 60)
+    with pytest.raises(IndexError):
+        TimeIndex().find(0)
+
+
+def test_time_index_matches_running_total():
+    """Random edits agree with a plain running total"""
+    rng = random.Random(1)
+    values = [rng.randrange(1, 100) for _ in range(37)]
+    index = TimeIndex(values[:20])
+    for value in values[20:]:
+        index.append(value)
+    for _ in range(50):
+        position = rng.randrange(len(values))
+        values[position] = rng.randrange(1, 100)
+        index.update(position, values[position])
+    for position in range(len(values) + 1):
+        assert index.start(position) == sum(values[:position])
+    for elapsed in range(0, sum(values), 7):
+        level, played = index.find(elapsed)
+        assert sum(values[:level]) + played == elapsed
+        assert played < values[level]
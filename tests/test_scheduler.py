@@ -0,0 +1,99 @@
+"""
+Tests for the shared clock scheduler
+"""
+
+import pytest
+
+from scheduler import ClockScheduler
+
+
+def live_entries(scheduler):
+    """
+    Due time of every clock's current heap entry, in due order
+
+    Args:
+        scheduler (ClockScheduler): Scheduler to look into
+
+    Returns:
+        entries (arr[tuple]): Due time and clock pairs
+    """
+    entries = [entry for entry in scheduler.heap if scheduler.is_current(entry)]
+    return [(entry[0], entry[3]) for entry in sorted(entries)]
+
+
+def is_heap(heap):
+    """
+    Check the heap invariant, every parent due no later than its children
+
+    Args:
+        heap (arr[tuple]): Heap to check
+
+    Returns:
+        valid (bool): True if the invariant holds
+    """
+    return all(heap[(i - 1) // 2] <= heap[i] for i in range(1, len(heap)))
+
+
+@pytest.fixture(name="clocks")
+def clocks_fixture(rounds, fake_clock):
+    """Scheduler driving three running clocks started a little apart"""
+    scheduler = ClockScheduler(fake_clock)
+    clocks = []
+    for _ in range(3):
+        tournament_clock = scheduler.add_clock(rounds)
+        tournament_clock.start()
+        clocks.append(tournament_clock)
+        fake_clock.advance(0.3)
+    return scheduler, clocks
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        lambda clock: clock.pause(),
+        lambda clock: clock.next_round(),
+        lambda clock: clock.seek(25 * 60),
+        lambda clock: clock.add_time(30),
+    ],
+    ids=["pause", "next", "seek", "add_time"],
+)
+def test_changing_one_clock_leaves_the_others(clocks, change):
+    """Pausing, advancing or seeking one clock keeps the others' deadlines"""
+    scheduler, (first, *others) = clocks
+    deadlines = [clock.countdown.deadline for clock in others]
+    before = [entry for entry in live_entries(scheduler) if entry[1] is not first]
+    change(first)
+    after = [entry for entry in live_entries(scheduler) if entry[1] is not first]
+    assert after == before
+    assert [clock.countdown.deadline for clock in others] == deadlines
+    assert is_heap(scheduler.heap)
+    assert len(live_entries(scheduler)) == (2 if first.state.is_paused else 3)
+
+
+def test_run_due_updates_only_due_clocks(clocks, fake_clock):
+    """Only clocks whose display is due are updated"""
+    scheduler, tournament_clocks = clocks
+    first_due = live_entries(scheduler)[0]
+    fake_clock.now = first_due[0]
+    assert scheduler.run_due() == 1
+    assert first_due[1].state.remaining == 1199
+    assert [clock.state.remaining for clock in tournament_clocks[1:]] == [1200, 1200]
+    assert is_heap(scheduler.heap)
+
+
+def test_run_drives_every_clock_to_expiry(clocks, fake_clock):
+    """Without a GUI the scheduler runs until no clock is running"""
+    scheduler, tournament_clocks = clocks
+    scheduler.run(fake_clock.advance)
+    assert all(clock.state.is_expired for clock in tournament_clocks)
+    assert scheduler.next_due() is None
+
+
+def test_removed_clock_is_no_longer_driven(clocks, fake_clock):
+    """A removed clock's entries are dropped and it is never updated again"""
+    scheduler, (first, *_) = clocks
+    scheduler.remove(first)
+    assert len(scheduler) == 2
+    fake_clock.advance(5)
+    scheduler.run_due()
+    assert first.state.remaining == 1200
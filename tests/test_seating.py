@@ -0,0 +1,64 @@
+"""
+Tests for seat draws and table balancing
+"""
+
+from clock import TournamentClock
+from seating import Seating
+
+
+def counts(seating):
+    """
+    Players at each table
+
+    Args:
+        seating (Seating): Seating to count
+
+    Returns:
+        counts (dict): Table number to player count
+    """
+    return {number: len(table) for number, table in seating.tables.items()}
+
+
+def test_draw_balances_tables():
+    """A draw uses as few tables as possible with sizes one apart at most"""
+    seating = Seating(9, seed=1)
+    seating.draw(range(20))
+    assert sorted(counts(seating).values()) == [6, 7, 7]
+    assert len(seating) == 20
+
+
+def test_knock_outs_keep_tables_balanced():
+    """Every knock out leaves tables at most one apart"""
+    seating = Seating(9, seed=2)
+    seating.draw(range(27))
+    for player in range(20):
+        seating.eliminate(player)
+        sizes = counts(seating).values()
+        assert max(sizes) - min(sizes) <= 1
+        assert sum(sizes) == len(seating)
+    assert counts(seating) == {next(iter(seating.tables)): 7}
+
+
+def test_late_entry_opens_a_table():
+    """A late entry with every seat taken opens a table and balances into it"""
+    seating = Seating(3, seed=3)
+    seating.draw("abcdef")
+    moves = seating.add("g")
+    assert moves[0].player == "g"
+    assert moves[0].from_table is None
+    assert sorted(counts(seating).values()) == [2, 2, 3]
+
+
+def test_breaks_wait_for_the_next_level(rounds):
+    """An attached seating breaks tables when the level changes"""
+    seating = Seating(3, seed=4)
+    seating.draw("abcdef")
+    broken = []
+    seating.attach(TournamentClock(rounds), broken.extend)
+    for player in "abc":
+        seating.eliminate(player)
+    assert len(seating.tables) == 2
+    seating.clock.next_round()
+    assert len(seating.tables) == 1
+    assert broken
+    assert {move.to_table for move in broken} == set(seating.tables)
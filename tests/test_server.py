@@ -0,0 +1,225 @@
+"""
+Tests for the broadcast server, over real connections on loopback
+"""
+
+import asyncio
+import json
+import os
+import struct
+
+from clock import TournamentClock
+from server import MAX_FRAME, BroadcastServer, read_ws_frame
+
+TOKEN = "secret"
+
+
+def ws_client_frame(payload, opcode=0x1, mask=True, length=None):
+    """
+    Build a client to server WebSocket frame
+
+    Args:
+        payload (bytes): Frame payload
+        opcode (int, optional): Frame opcode, text by default
+        mask (bool, optional): Mask the payload as clients must
+        length (int, optional): Length to claim instead of the real one
+
+    Returns:
+        frame (bytes): Encoded frame
+    """
+    length = len(payload) if length is None else length
+    header = struct.pack("!BBQ", 0x80 | opcode, (0x80 if mask else 0) | 127, length)
+    if not mask:
+        return header + payload
+    key = os.urandom(4)
+    return header + key + bytes(b ^ key[i % 4] for i, b in enumerate(payload))
+
+
+async def start(broadcast):
+    """
+    Listen on a free loopback port the way BroadcastServer.serve() does
+
+    Args:
+        broadcast (BroadcastServer): Server to run
+
+    Returns:
+        server (asyncio.Server): Listening server
+        port (int): Port it listens on
+    """
+    broadcast.loop = asyncio.get_running_loop()
+    broadcast.wake = asyncio.Event()
+    server = await asyncio.start_server(broadcast.handle, "127.0.0.1", 0)
+    return server, server.sockets[0].getsockname()[1]
+
+
+async def http(port, request):
+    """
+    Send one HTTP request and read the whole response
+
+    Args:
+        port (int): Server port
+        request (str): Request line and headers
+
+    Returns:
+        status (str): Status line
+        body (bytes): Response body
+    """
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"{request}\r\n\r\n".encode())
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    return head.split(b"\r\n")[0].decode(), body
+
+
+async def open_websocket(port):
+    """
+    Connect a WebSocket client and read the handshake
+
+    Args:
+        port (int): Server port
+
+    Returns:
+        reader (asyncio.StreamReader): Client reader after the handshake
+        writer (asyncio.StreamWriter): Client writer
+    """
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(
+        b"GET /ws HTTP/1.1\r\nUpgrade: websocket\r\nConnection: Upgrade\r\n"
+        b"Sec-WebSocket-Key: dGhlIHNhbXBsZSBub25jZQ==\r\n\r\n"
+    )
+    head = await reader.readuntil(b"\r\n\r\n")
+    assert head.startswith(b"HTTP/1.1 101")
+    return reader, writer
+
+
+async def read_message(reader):
+    """
+    Read one JSON message pushed by the server
+
+    Args:
+        reader (asyncio.StreamReader): Client reader
+
+    Returns:
+        message (dict): Decoded message
+    """
+    first, second = await asyncio.wait_for(reader.readexactly(2), 5)
+    assert first == 0x81
+    length = second & 0x7F
+    if length == 126:
+        (length,) = struct.unpack("!H", await reader.readexactly(2))
+    return json.loads(await reader.readexactly(length))
+
+
+def test_control_needs_token(rounds, fake_clock):
+    """Control requests without the token are refused and change nothing"""
+    tournament_clock = TournamentClock(rounds, fake_clock)
+    broadcast = BroadcastServer(tournament_clock, TOKEN)
+
+    async def run():
+        server, port = await start(broadcast)
+        async with server:
+            statuses = [
+                await http(port, "POST /control/toggle HTTP/1.1"),
+                await http(port, "POST /control/toggle?token=wrong HTTP/1.1"),
+            ]
+            assert tournament_clock.state.is_paused
+            statuses.append(
+                await http(
+                    port,
+                    f"POST /control/toggle HTTP/1.1\r\nAuthorization: Bearer {TOKEN}",
+                )
+            )
+            assert tournament_clock.is_running
+            statuses.append(
+                await http(port, f"POST /control/toggle?token={TOKEN} HTTP/1.1")
+            )
+            assert tournament_clock.state.is_paused
+            return [status for status, _ in statuses]
+
+    assert asyncio.run(run()) == [
+        "HTTP/1.1 403 Forbidden",
+        "HTTP/1.1 403 Forbidden",
+        "HTTP/1.1 204 No Content",
+        "HTTP/1.1 204 No Content",
+    ]
+
+
+def test_state_is_public(rounds, fake_clock):
+    """Anyone can read the state as JSON"""
+    broadcast = BroadcastServer(TournamentClock(rounds, fake_clock), TOKEN)
+
+    async def run():
+        server, port = await start(broadcast)
+        async with server:
+            return await http(port, "GET /state HTTP/1.1")
+
+    status, body = asyncio.run(run())
+    assert status == "HTTP/1.1 200 OK"
+    message = json.loads(body)
+    assert message["type"] == "snapshot"
+    assert message["state"]["remaining"] == 1200
+
+
+def test_websocket_gets_snapshot_then_changes(rounds, fake_clock):
+    """A display gets the full state on connect, then only what changed"""
+    tournament_clock = TournamentClock(rounds, fake_clock)
+    broadcast = BroadcastServer(tournament_clock, TOKEN)
+
+    async def run():
+        server, port = await start(broadcast)
+        async with server:
+            reader, writer = await open_websocket(port)
+            snapshot = await read_message(reader)
+            tournament_clock.next_round()
+            change = await read_message(reader)
+            writer.close()
+            return snapshot, change
+
+    snapshot, change = asyncio.run(run())
+    assert snapshot["type"] == "snapshot"
+    assert snapshot["state"]["round"] == 1
+    assert change["type"] == "level_up"
+    assert change["seq"] == snapshot["seq"] + 1
+    assert change["state"] == {
+        "level": 1,
+        "round": 2,
+        "s_blind": 0,
+        "b_blind": 0,
+        "break": True,
+        "remaining": 600,
+    }
+
+
+def test_oversized_and_unmasked_frames_close_the_connection(rounds, fake_clock):
+    """Frames over MAX_FRAME or without a mask are refused unread"""
+    broadcast = BroadcastServer(TournamentClock(rounds, fake_clock), TOKEN)
+
+    async def closed_after(frame):
+        server, port = await start(broadcast)
+        async with server:
+            reader, writer = await open_websocket(port)
+            await read_message(reader)
+            writer.write(frame)
+            try:
+                rest = await asyncio.wait_for(reader.read(), 5)
+            except ConnectionResetError:
+                rest = b""
+            writer.close()
+            return rest == b"" and not broadcast.clients
+
+    assert asyncio.run(closed_after(ws_client_frame(b"", length=1 << 40)))
+    assert asyncio.run(closed_after(ws_client_frame(b"x" * (MAX_FRAME + 1))))
+    assert asyncio.run(closed_after(ws_client_frame(b"hello", mask=False)))
+
+
+def test_read_ws_frame_unmasks_payload():
+    """A masked frame up to MAX_FRAME is read back unmasked"""
+    payload = bytes(range(256)) * (MAX_FRAME // 256)
+
+    async def run():
+        reader = asyncio.StreamReader()
+        reader.feed_data(ws_client_frame(payload, opcode=0x2))
+        reader.feed_eof()
+        return await read_ws_frame(reader)
+
+    assert asyncio.run(run()) == (0x2, payload)
@@ -0,0 +1,65 @@
+"""
+Tests for the shared memory clock state
+"""
+
+import pytest
+
+from clock import TournamentClock
+from schedule import MAX_VALUE, BlindSchedule
+from sharedstate import StatePublisher, StateReader
+
+
+@pytest.fixture(name="path")
+def path_fixture(tmp_path):
+    """State file in a temporary folder"""
+    return str(tmp_path / "state")
+
+
+def test_reader_sees_published_state(path, tournament, fake_clock):
+    """A reader gets what the publisher wrote and notices new writes"""
+    publisher = StatePublisher(path)
+    publisher.attach(tournament)
+    reader = StateReader(path)
+    try:
+        state = reader.read()
+        assert (state.round_num, state.s_blind, state.b_blind) == (1, 25, 50)
+        assert state.remaining_ms == 1_200_000
+        assert state.is_paused and not state.alert
+        assert not reader.changed()
+
+        tournament.start()
+        fake_clock.advance(30)
+        publisher.set_alert(True)
+        assert reader.changed()
+        state = reader.read()
+        assert not state.is_paused and state.alert
+        assert state.remaining_ms == 1_170_000
+        assert StateReader.remaining(state, state.written_ns + 500_000_000) == 1_169_500
+    finally:
+        reader.close()
+        publisher.close()
+
+
+def test_round_numbers_use_the_full_column_range(path, fake_clock):
+    """Round numbers and indexes as large as a schedule holds are published"""
+    rounds = BlindSchedule.from_columns(
+        [MAX_VALUE], [20], [MAX_VALUE // 2], [MAX_VALUE]
+    )
+    publisher = StatePublisher(path)
+    publisher.attach(TournamentClock(rounds, fake_clock))
+    reader = StateReader(path)
+    try:
+        state = reader.read()
+        assert state.round_num == MAX_VALUE
+        assert state.b_blind == MAX_VALUE
+    finally:
+        reader.close()
+        publisher.close()
+
+
+def test_reader_refuses_other_files(path):
+    """A file that is not a state file is refused"""
+    with open(path, "wb") as f:
+        f.write(b"\0" * 4096)
+    with pytest.raises(ValueError):
+        StateReader(path)
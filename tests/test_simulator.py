@@ -0,0 +1,31 @@
+"""
+Tests for the tournament length simulator
+"""
+
+import threading
+
+from schedule import BlindSchedule
+from simulator import simulate
+
+
+def test_small_blinds_are_cut_short():
+    """Trials that would never end stop at max_hours and are counted"""
+    rounds = BlindSchedule.from_columns([1, 2], [20, 20], [1, 2], [2, 4])
+    result = simulate(rounds, 20, 10000, 100, workers=0, max_hours=2)
+    assert result.cut_short == 100
+    assert result.finish_minutes[50] == 120
+    assert result.finish_level[50] == 2
+
+
+def test_same_seed_same_result(rounds):
+    """Results depend only on the seed"""
+    first = simulate(rounds, 6, 1000, 300, seed=3, workers=0)
+    assert first == simulate(rounds, 6, 1000, 300, seed=3, workers=0)
+
+
+def test_cancel():
+    """A cancelled simulation returns None"""
+    cancel = threading.Event()
+    cancel.set()
+    rounds = BlindSchedule.from_columns([1], [20], [25], [50])
+    assert simulate(rounds, 6, 1000, 100, workers=0, cancel=cancel) is None
@@ -0,0 +1,90 @@
+"""
+Tests for the terminal clock's drawing and commands, without a terminal
+"""
+
+import pytest
+
+import terminal
+from terminal import KEYS, TerminalClock, big_text
+
+
+class FakeWindow:
+    """
+    Stands in for a curses window, the tests never draw
+    """
+
+    def getmaxyx(self):
+        """Size of an 80 by 24 terminal"""
+        return 24, 80
+
+
+@pytest.fixture(name="terminal_clock")
+def terminal_clock_fixture(monkeypatch, tournament):
+    """Terminal front end on the recording tournament clock, without colours"""
+    monkeypatch.setattr(terminal.curses, "has_colors", lambda: False)
+    return TerminalClock(FakeWindow(), "game.csv", tournament)
+
+
+def test_big_text_rows_line_up():
+    """Block digits are five rows of equal width with the chosen block"""
+    rows = big_text("1:05", "@")
+    assert len(rows) == 5
+    assert len({len(row) for row in rows}) == 1
+    assert rows[0] == "  @    @@@@ @@@@"
+    assert "#" not in "".join(rows)
+
+
+def test_compose_fills_the_screen(terminal_clock, tournament):
+    """A frame is one row per screen row with the keys on the last row"""
+    rows = terminal_clock.compose(tournament.state, 24, 80)
+    assert len(rows) == 24
+    assert {len(row) for row in rows} == {79}
+    assert rows[-1] == KEYS[:79].center(79)
+    text = "\n".join(rows)
+    assert "Round 1  (paused)" in text
+    assert "Next: 0/0" in text
+    assert big_text("20:00")[0] in text
+
+
+def test_compose_falls_back_to_plain_text(terminal_clock, tournament):
+    """Big digits too wide for the screen are drawn as plain text"""
+    rows = terminal_clock.compose(tournament.state, 12, 12)
+    assert "20:00" in [row.strip() for row in rows]
+
+
+def test_visual_state_flashes_after_expiry(terminal_clock, tournament, fake_clock):
+    """Running out starts the flashing and any other change stops it"""
+    tournament.start()
+    fake_clock.advance(1200)
+    tournament.update()
+    assert terminal_clock.visual_state(tournament.state) == "alert_on"
+    tournament.reset_timer()
+    assert terminal_clock.visual_state(tournament.state) == "normal"
+
+
+def test_jump_to_time(terminal_clock, tournament):
+    """Jumping moves the clock and a bad time leaves a message"""
+    terminal_clock.prompt = lambda text: "0:25"
+    terminal_clock.jump_to_time()
+    assert tournament.state.round_index == 1
+    assert tournament.state.remaining == 300
+    terminal_clock.prompt = lambda text: "soon"
+    terminal_clock.jump_to_time()
+    assert terminal_clock.message == "soon is not a time like 2:13"
+
+
+def test_edit_keeps_running_level(
+    terminal_clock, tournament, rounds, fake_clock, tmp_path
+):
+    """Reloading the game file mid level keeps the clock running"""
+    path = tmp_path / "game.csv"
+    edited = rounds[:]
+    edited.set_level(2, s_blind=75, b_blind=150)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        edited.write_csv(f)
+    tournament.start()
+    fake_clock.advance(300)
+    terminal_clock.load(str(path), keep_position=True)
+    assert tournament.is_running
+    assert tournament.countdown.remaining() == pytest.approx(900)
+    assert tournament.game_state.rounds[2].b_blind == 150
@@ -0,0 +1,109 @@
+"""
+Tests for the player, rebuy and chip tracker
+"""
+
+import pytest
+
+from tracker import Tracker
+
+
+@pytest.fixture(name="tracker")
+def tracker_fixture():
+    """Tracker with a 20 buy-in, 10 rebuys and add-ons and 10% rake"""
+    return Tracker(buy_in=20, stack=10000, rebuy=(10, 5000), addon=(10, 8000), rake=0.1)
+
+
+def test_entries_set_the_totals(tracker):
+    """Every entry adds a player, a stack and a buy-in"""
+    for name in ("Ann", "Bob", "Cat", "Dan"):
+        tracker.register(name)
+    stats = tracker.stats(big_blind=200)
+    assert stats.entries == 4
+    assert stats.remaining == 4
+    assert stats.total_chips == 40000
+    assert stats.average_stack == 10000
+    assert stats.average_bbs == 50
+    assert stats.prize_pool == pytest.approx(72)
+
+
+def test_rebuys_and_addons_add_chips_and_money(tracker):
+    """Rebuys and add-ons count at their own prices"""
+    for name in ("Ann", "Bob"):
+        tracker.register(name)
+    tracker.rebuy("Ann")
+    tracker.addon("Bob")
+    tracker.addon("Ann")
+    stats = tracker.stats(big_blind=100)
+    assert (stats.rebuys, stats.addons) == (1, 2)
+    assert stats.total_chips == 20000 + 5000 + 2 * 8000
+    assert stats.average_stack == 20500
+    assert stats.average_bbs == 205
+    assert stats.prize_pool == pytest.approx((40 + 10 + 20) * 0.9)
+    ann = tracker.entries["Ann"]
+    assert (ann.chips, ann.paid, ann.rebuys, ann.addons) == (23000, 40, 1, 1)
+
+
+def test_eliminations_keep_chips_in_play(tracker):
+    """Knocked out players' chips are shared by the players left"""
+    for name in ("Ann", "Bob", "Cat"):
+        tracker.register(name)
+    assert tracker.eliminate("Cat").place == 3
+    stats = tracker.stats(big_blind=300)
+    assert stats.remaining == 2
+    assert stats.total_chips == 30000
+    assert stats.average_stack == 15000
+    assert stats.average_bbs == 50
+    with pytest.raises(ValueError):
+        tracker.eliminate("Cat")
+    with pytest.raises(ValueError):
+        tracker.addon("Cat")
+
+
+def test_rebuy_brings_a_player_back(tracker):
+    """A rebuy after a knock out puts the player back in"""
+    for name in ("Ann", "Bob"):
+        tracker.register(name)
+    tracker.eliminate("Bob")
+    entry = tracker.rebuy("Bob")
+    assert entry.place is None
+    stats = tracker.stats()
+    assert stats.remaining == 2
+    assert stats.total_chips == 25000
+    assert stats.average_bbs == 0
+
+
+def test_prices_changed_mid_tournament(tracker):
+    """Each purchase keeps the price set when it was made"""
+    tracker.register("Ann")
+    tracker.buy_in, tracker.stack = 50, 20000
+    tracker.register("Bob")
+    stats = tracker.stats()
+    assert stats.total_chips == 30000
+    assert stats.prize_pool == pytest.approx(63)
+
+
+def test_no_players_left():
+    """Averages are zero rather than dividing by nobody"""
+    tracker = Tracker(buy_in=20, stack=10000)
+    tracker.register("Ann")
+    tracker.eliminate("Ann")
+    stats = tracker.stats(big_blind=100)
+    assert (stats.remaining, stats.average_stack, stats.average_bbs) == (0, 0, 0)
+
+
+def test_duplicate_names_and_events(tracker):
+    """Names are unique and subscribers hear about every change"""
+    events = []
+    tracker.subscribe(lambda event, entry: events.append((event, entry.name)))
+    tracker.register("Ann")
+    with pytest.raises(ValueError):
+        tracker.register("Ann")
+    tracker.rebuy("Ann")
+    tracker.addon("Ann")
+    tracker.eliminate("Ann")
+    assert events == [
+        ("register", "Ann"),
+        ("rebuy", "Ann"),
+        ("addon", "Ann"),
+        ("eliminate", "Ann"),
+    ]
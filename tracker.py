@@ -0,0 +1,223 @@
+"""
+Player, rebuy and chip tracker for Poker Time
+
+Keeps running totals of entries, players left, chips in play and money
+collected, so each registration, rebuy, add-on or knock out is O(1) and
+the stats on screen never need to look at every player.
+"""
+
+from collections import namedtuple
+
+TrackerStats = namedtuple(
+    "TrackerStats",
+    [
+        "entries",
+        "remaining",
+        "rebuys",
+        "addons",
+        "total_chips",
+        "average_stack",
+        "average_bbs",
+        "prize_pool",
+    ],
+)
+
+
+class Entry:
+    """
+    Entry object
+
+    One registered player with what they have bought
+    """
+
+    __slots__ = ("addons", "chips", "name", "paid", "place", "rebuys")
+
+    def __init__(self, name, chips, paid):
+        self.name = name
+        self.rebuys = 0
+        self.addons = 0
+        self.chips = chips
+        self.paid = paid
+        self.place = None
+
+
+class Tracker:
+    """
+    Tournament entries and running totals
+
+    Prices and chip amounts can change during the tournament, each purchase
+    is counted at the prices set when it was made
+    """
+
+    def __init__(self, buy_in=0, stack=0, rebuy=(0, 0), addon=(0, 0), rake=0.0):
+        self.buy_in = buy_in
+        self.stack = stack
+        self.rebuy_cost, self.rebuy_chips = rebuy
+        self.addon_cost, self.addon_chips = addon
+        self.rake = rake
+        self.entries = {}
+        self.names = []
+        self.remaining = 0
+        self.rebuys = 0
+        self.addons = 0
+        self.total_chips = 0
+        self.collected = 0
+        self.subscribers = []
+
+    def subscribe(self, callback):
+        """
+        Call a function with the event name and entry after every change
+
+        Args:
+            callback (callable): Called as callback(event, entry)
+
+        Returns:
+            callback (callable): The callback, so it can be unsubscribed later
+        """
+        self.subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback):
+        """
+        Stop calling a subscribed function
+
+        Args:
+            callback (callable): Callback passed to subscribe
+
+        Returns:
+            None
+        """
+        if callback in self.subscribers:
+            self.subscribers.remove(callback)
+
+    def emit(self, event, entry):
+        """
+        Tell subscribers about a change
+
+        Args:
+            event (str): Event name
+            entry (Entry): Entry that changed
+
+        Returns:
+            None
+        """
+        for callback in list(self.subscribers):
+            callback(event, entry)
+
+    def buy(self, entry, chips, cost):
+        """
+        Add chips and money to an entry and the totals
+
+        Args:
+            entry (Entry): Entry buying
+            chips (int): Chips bought
+            cost (float): Money paid
+
+        Returns:
+            None
+        """
+        entry.chips += chips
+        entry.paid += cost
+        self.total_chips += chips
+        self.collected += cost
+
+    def register(self, name):
+        """
+        Register a new player
+
+        Args:
+            name (str): Player name, must be unique
+
+        Returns:
+            entry (Entry): New entry
+        """
+        if name in self.entries:
+            raise ValueError(f"{name} is already registered")
+        entry = Entry(name, 0, 0)
+        self.entries[name] = entry
+        self.names.append(name)
+        self.remaining += 1
+        self.buy(entry, self.stack, self.buy_in)
+        self.emit("register", entry)
+        return entry
+
+    def rebuy(self, name):
+        """
+        Rebuy for a player, bringing them back in if they were knocked out
+
+        Args:
+            name (str): Player name
+
+        Returns:
+            entry (Entry): Player's entry
+        """
+        entry = self.entries[name]
+        if entry.place is not None:
+            entry.place = None
+            self.remaining += 1
+        entry.rebuys += 1
+        self.rebuys += 1
+        self.buy(entry, self.rebuy_chips, self.rebuy_cost)
+        self.emit("rebuy", entry)
+        return entry
+
+    def addon(self, name):
+        """
+        Add-on for a player still in
+
+        Args:
+            name (str): Player name
+
+        Returns:
+            entry (Entry): Player's entry
+        """
+        entry = self.entries[name]
+        if entry.place is not None:
+            raise ValueError(f"{name} has been knocked out")
+        entry.addons += 1
+        self.addons += 1
+        self.buy(entry, self.addon_chips, self.addon_cost)
+        self.emit("addon", entry)
+        return entry
+
+    def eliminate(self, name):
+        """
+        Knock a player out, their chips stay in play with the others
+
+        Args:
+            name (str): Player name
+
+        Returns:
+            entry (Entry): Player's entry with their finishing place
+        """
+        entry = self.entries[name]
+        if entry.place is not None:
+            raise ValueError(f"{name} has already been knocked out")
+        entry.place = self.remaining
+        self.remaining -= 1
+        self.emit("eliminate", entry)
+        return entry
+
+    def stats(self, big_blind=0):
+        """
+        Current totals
+
+        Args:
+            big_blind (int, optional): Big blind to measure the average stack in
+
+        Returns:
+            stats (TrackerStats): Entries, players left, rebuys, add-ons,
+                chips in play, average stack, average stack in big blinds
+                and prize pool
+        """
+        average = self.total_chips / self.remaining if self.remaining else 0
+        return TrackerStats(
+            len(self.entries),
+            self.remaining,
+            self.rebuys,
+            self.addons,
+            self.total_chips,
+            average,
+            average / big_blind if big_blind else 0,
+            self.collected * (1 - self.rake),
+        )